@@ -0,0 +1,152 @@
+!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+!> A benchmark of how fast triplet lists go in and out of a distributed matrix.
+PROGRAM TripletThroughput
+  USE DataTypesModule, ONLY : NTREAL
+  USE LoggingModule, ONLY : ActivateLogger, DeactivateLogger, WriteElement, &
+       & WriteHeader, EnterSubLog, ExitSubLog
+  USE ProcessGridModule, ONLY : ConstructProcessGrid, IsRoot, global_grid, &
+       & DestructProcessGrid
+  USE PSMatrixModule, ONLY : Matrix_ps, ConstructEmptyMatrix, &
+       & FillMatrixFromTripletList, GetMatrixTripletList, DestructMatrix
+  USE TripletListModule, ONLY : TripletList_r, ConstructTripletList, &
+       & DestructTripletList
+  USE TripletModule, ONLY : Triplet_r
+  USE MPI
+  IMPLICIT NONE
+  !! Parameters
+  INTEGER :: process_rows, process_columns, process_slices
+  INTEGER :: matrix_dimension, entries_per_row, repetitions
+  !! Matrices
+  TYPE(Matrix_ps) :: Mat
+  !! Triplet Lists
+  TYPE(TripletList_r) :: triplet_list, out_list
+  TYPE(Triplet_r) :: temporary_triplet
+  !! MPI Variables
+  INTEGER :: ierr
+  INTEGER :: provided
+  INTEGER :: rank, total_processors
+  !! Timing
+  DOUBLE PRECISION :: start_time, fill_time, get_time
+  REAL(NTREAL) :: total_entries
+  !! Temporary Variables
+  CHARACTER(len=80) :: argument
+  CHARACTER(len=80) :: argument_value
+  INTEGER :: row, stride, list_size
+  INTEGER :: ARGII, II, JJ, KK
+  REAL(NTREAL) :: rand_value
+
+  !! Setup MPI
+  CALL MPI_Init_thread(MPI_THREAD_SERIALIZED, provided, ierr)
+  CALL MPI_Comm_rank(MPI_COMM_WORLD, rank, ierr)
+  CALL MPI_Comm_size(MPI_COMM_WORLD, total_processors, ierr)
+
+  !! Process the input parameters.
+  repetitions = 5
+  DO ARGII = 1, COMMAND_ARGUMENT_COUNT(), 2
+     CALL GET_COMMAND_ARGUMENT(ARGII, argument)
+     CALL GET_COMMAND_ARGUMENT(ARGII + 1, argument_value)
+     SELECT CASE(argument)
+     CASE('--matrix_dimension')
+        READ(argument_value,*) matrix_dimension
+     CASE('--entries_per_row')
+        READ(argument_value,*) entries_per_row
+     CASE('--repetitions')
+        READ(argument_value,*) repetitions
+     CASE('--process_rows')
+        READ(argument_value,*) process_rows
+     CASE('--process_columns')
+        READ(argument_value,*) process_columns
+     CASE('--process_slices')
+        READ(argument_value,*) process_slices
+     END SELECT
+  END DO
+
+  !! Setup the process grid.
+  CALL ConstructProcessGrid(MPI_COMM_WORLD, process_rows, process_columns, &
+       & process_slices)
+
+  !! Print Out The Parameters
+  IF (IsRoot()) THEN
+     CALL ActivateLogger
+  END IF
+  CALL WriteHeader("Command Line Parameters")
+  CALL EnterSubLog
+  CALL WriteElement(key="matrix_dimension", VALUE=matrix_dimension)
+  CALL WriteElement(key="entries_per_row", VALUE=entries_per_row)
+  CALL WriteElement(key="repetitions", VALUE=repetitions)
+  CALL WriteElement(key="process_rows", VALUE=process_rows)
+  CALL WriteElement(key="process_columns", VALUE=process_columns)
+  CALL WriteElement(key="process_slices", VALUE=process_slices)
+  CALL WriteElement(key="omp_threads", VALUE=global_grid%omp_max_threads)
+  CALL ExitSubLog
+
+  !! Each process makes every total_processors-th row, with the columns
+  !! spread out so that no entry is repeated.
+  stride = MAX(1, matrix_dimension / entries_per_row)
+  list_size = 0
+  CALL ConstructTripletList(triplet_list, &
+       & (matrix_dimension / total_processors + 1) * entries_per_row)
+  DO row = rank + 1, matrix_dimension, total_processors
+     DO KK = 0, MIN(entries_per_row, matrix_dimension) - 1
+        list_size = list_size + 1
+        triplet_list%DATA(list_size)%index_row = row
+        triplet_list%DATA(list_size)%index_column = &
+             & MOD(row - 1 + KK * stride, matrix_dimension) + 1
+        CALL RANDOM_NUMBER(rand_value)
+        triplet_list%DATA(list_size)%point_value = rand_value
+     END DO
+  END DO
+  triplet_list%CurrentSize = list_size
+
+  !! Shuffle, so that the entries arrive in no particular order.
+  DO II = list_size, 2, -1
+     CALL RANDOM_NUMBER(rand_value)
+     JJ = 1 + INT(rand_value * II)
+     temporary_triplet = triplet_list%DATA(II)
+     triplet_list%DATA(II) = triplet_list%DATA(JJ)
+     triplet_list%DATA(JJ) = temporary_triplet
+  END DO
+
+  !! Fill the matrix, which sorts the lists and builds the local matrices.
+  CALL ConstructEmptyMatrix(Mat, matrix_dimension)
+  CALL MPI_Barrier(MPI_COMM_WORLD, ierr)
+  start_time = MPI_Wtime()
+  DO II = 1, repetitions
+     CALL FillMatrixFromTripletList(Mat, triplet_list)
+  END DO
+  fill_time = MPI_Wtime() - start_time
+  CALL MPI_Allreduce(MPI_IN_PLACE, fill_time, 1, MPI_DOUBLE_PRECISION, &
+       & MPI_MAX, MPI_COMM_WORLD, ierr)
+
+  !! Get the triplets back out again.
+  CALL MPI_Barrier(MPI_COMM_WORLD, ierr)
+  start_time = MPI_Wtime()
+  DO II = 1, repetitions
+     CALL GetMatrixTripletList(Mat, out_list)
+  END DO
+  get_time = MPI_Wtime() - start_time
+  CALL MPI_Allreduce(MPI_IN_PLACE, get_time, 1, MPI_DOUBLE_PRECISION, &
+       & MPI_MAX, MPI_COMM_WORLD, ierr)
+
+  !! Print The Results
+  total_entries = REAL(list_size, KIND=NTREAL)
+  CALL MPI_Allreduce(MPI_IN_PLACE, total_entries, 1, MPI_DOUBLE_PRECISION, &
+       & MPI_SUM, MPI_COMM_WORLD, ierr)
+  CALL WriteHeader("Throughput (entries per second)")
+  CALL EnterSubLog
+  CALL WriteElement(key="fill", &
+       & VALUE=total_entries * repetitions / MAX(fill_time, TINY(fill_time)))
+  CALL WriteElement(key="get", &
+       & VALUE=total_entries * repetitions / MAX(get_time, TINY(get_time)))
+  CALL ExitSubLog
+
+  !! Cleanup
+  CALL DestructMatrix(Mat)
+  CALL DestructTripletList(triplet_list)
+  CALL DestructTripletList(out_list)
+  IF (IsRoot()) THEN
+     CALL DeactivateLogger
+  END IF
+  CALL DestructProcessGrid
+  CALL MPI_Finalize(ierr)
+END PROGRAM TripletThroughput
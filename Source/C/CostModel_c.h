@@ -0,0 +1,10 @@
+#ifndef CostModel_ch
+#define CostModel_ch
+
+void CalibrateCostModel_wrp();
+void SetCostModel_wrp(const double *sparse_cost, const double *output_cost,
+                      const double *dense_cost, const double *conversion_cost);
+void ResetCostModel_wrp();
+void PrintCostModel_wrp();
+
+#endif
@@ -2,11 +2,17 @@
 #define MATRIXMEMORYPOOL_ch
 
 void ConstructMatrixMemoryPool_lr_wrp(int *ih_this, const int *columns,
-                                      const int *rows);
+                                      const int *rows, const bool *use_hash,
+                                      const bool *reuse_pattern,
+                                      const int *block_size);
 void DestructMatrixMemoryPool_lr_wrp(int *ih_this);
+void GetMatrixMemoryPoolFlops_lr_wrp(const int *ih_this, long int *flops);
 
 void ConstructMatrixMemoryPool_lc_wrp(int *ih_this, const int *columns,
-                                      const int *rows);
+                                      const int *rows, const bool *use_hash,
+                                      const bool *reuse_pattern,
+                                      const int *block_size);
 void DestructMatrixMemoryPool_lc_wrp(int *ih_this);
+void GetMatrixMemoryPoolFlops_lc_wrp(const int *ih_this, long int *flops);
 
 #endif
@@ -0,0 +1,8 @@
+#ifndef MemoryAccounting_ch
+#define MemoryAccounting_ch
+
+void GetMemoryHighWaterMark_wrp(long int *bytes);
+void ResetMemoryHighWaterMark_wrp();
+void PrintMemoryUsage_wrp();
+
+#endif
@@ -1,7 +1,14 @@
 #ifndef DISTRIBUTEDMATRIXMEMORYPOOL_ch
 #define DISTRIBUTEDMATRIXMEMORYPOOL_ch
 
-void ConstructMatrixMemoryPool_p_wrp(int *ih_this, const int *ih_matrix);
+void ConstructMatrixMemoryPool_p_wrp(int *ih_this, const int *ih_matrix,
+                                     const bool *use_hash,
+                                     const bool *reuse_pattern,
+                                     const int *block_size,
+                                     const bool *pin_first,
+                                     const bool *pin_second);
 void DestructMatrixMemoryPool_p_wrp(int *ih_this);
+void GetMemoryPoolMemory_p_wrp(const int *ih_this, long int *bytes);
+void DestructGatheredOperands_p_wrp(int *ih_this);
 
 #endif
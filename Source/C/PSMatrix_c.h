@@ -32,6 +32,7 @@ void FillMatrixDense_ps_wrp(int *ih_this);
 void GetMatrixActualDimension_ps_wrp(const int *ih_this, int *size);
 void GetMatrixLogicalDimension_ps_wrp(const int *ih_this, int *size);
 void GetMatrixSize_ps_wrp(const int *ih_this, long int *size);
+void GetMatrixMemory_ps_wrp(const int *ih_this, long int *bytes);
 void GetMatrixTripletList_psr_wrp(const int *ih_this, int *ih_triplet_list);
 void GetMatrixTripletList_psc_wrp(const int *ih_this, int *ih_triplet_list);
 void GetMatrixBlock_psr_wrp(const int *ih_this, int *ih_triplet_list,
@@ -51,18 +52,37 @@ void GetMatrixProcessGrid_ps_wrp(const int *ih_this, int *ih_grid);
 void DotMatrix_psr_wrp(const int *ih_matA, const int *ih_matB, double *product);
 void DotMatrix_psc_wrp(const int *ih_matA, const int *ih_matB,
                        double *product_real, double *product_imag);
+void TraceOfProduct_psr_wrp(const int *ih_matA, const int *ih_matB,
+                            double *trace_value);
+void TraceOfProduct_psc_wrp(const int *ih_matA, const int *ih_matB,
+                            double *trace_real, double *trace_imag);
 void IncrementMatrix_ps_wrp(const int *ih_matA, int *ih_matB,
                             const double *alpha_in, const double *threshold_in);
 void MatrixPairwiseMultiply_ps_wrp(const int *ih_matA, const int *ih_matB,
                                    int *ih_matC);
 void MatrixMultiply_ps_wrp(const int *ih_matA, const int *ih_matB, int *ih_matC,
                            const double *alpha_in, const double *beta_in,
-                           const double *threshold_in, int *ih_memory_pool_in);
+                           const double *threshold_in, int *ih_memory_pool_in,
+                           const double *screen_in);
+void StartMatrixMultiply_ps_wrp(const int *ih_matA, const int *ih_matB,
+                                int *ih_memory_pool_in);
+void MatrixMultiplyChain_ps_wrp(const int *ih_matA, const int *ih_matB,
+                                int *ih_matAB, int *ih_matAAB,
+                                const double *threshold_in,
+                                int *ih_memory_pool_in);
+void MatrixMultiplyUpdate_ps_wrp(const int *ih_matA, int *ih_matC,
+                                 const double *alpha_in, const double *beta_in,
+                                 const double *shift_in,
+                                 const double *threshold_in,
+                                 int *ih_memory_pool_in);
 void ScaleMatrix_ps_wrp(int *ih_this, const double *constant);
+void ShiftMatrix_ps_wrp(int *ih_this, const double *shift);
 double MatrixNorm_ps_wrp(const int *ih_this);
 double MeasureAsymmetry_ps_wrp(const int *ih_this);
 void MatrixTrace_ps_wrp(const int *ih_this, double *trace_val);
 int IsIdentity_ps_wrp(const int *ih_this);
+bool IsMatrixHermitian_ps_wrp(const int *ih_this);
+void SetMatrixHermitian_ps_wrp(int *ih_this, const bool *is_hermitian);
 void SymmetrizeMatrix_ps_wrp(int *ih_this);
 void MatrixDiagonalScale_psr_wrp(int *ih_mat, const int *ih_tlist);
 void MatrixDiagonalScale_psc_wrp(int *ih_mat, const int *ih_tlist);
@@ -16,6 +16,7 @@ bool GetGlobalIsRoot_wrp();
 int GetGlobalNumSlices_wrp();
 int GetGlobalNumColumns_wrp();
 int GetGlobalNumRows_wrp();
+void SetGlobalCompressIndices_wrp(const bool *compress_indices);
 void WriteGlobalProcessGridInfo_wrp();
 void DestructGlobalProcessGrid_wrp();
 
@@ -32,6 +33,7 @@ int GetMyRow_wrp(const int *ih_grid);
 int GetNumSlices_wrp(const int *ih_grid);
 int GetNumColumns_wrp(const int *ih_grid);
 int GetNumRows_wrp(const int *ih_grid);
+void SetCompressIndices_wrp(const int *ih_grid, const bool *compress_indices);
 void WriteProcessGridInfo_wrp(const int *ih_grid);
 void DestructProcessGrid_wrp(int *ih_grid);
 
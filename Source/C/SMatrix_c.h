@@ -28,12 +28,14 @@ void MatrixMultiply_lsr_wrp(const int *ih_matA, const int *ih_matB,
                             int *ih_matC, const bool *IsATransposed,
                             const bool *IsBTransposed, const double *alpha,
                             const double *beta, const double *threshold,
-                            int *ih_matrix_memory_pool);
+                            int *ih_matrix_memory_pool, const double *screen);
 void TransposeMatrix_lsr_wrp(const int *ih_matA, int *ih_matAT);
 void PrintMatrix_lsr_wrp(const int *ih_this);
 void PrintMatrixF_lsr_wrp(const int *ih_this, const char *file_name,
                           const int *name_size);
 void MatrixToTripletList_lsr_wrp(const int *ih_this, int *ih_triplet_list);
+void GetMatrixArrays_lsr_wrp(const int *ih_this, int *nnz, int **outer_index,
+                            int **inner_index, double **values);
 void MatrixDiagonalScale_lsr_wrp(int *ih_mat, const int *ih_tlist);
 
 void ConstructMatrixFromFile_lsc_wrp(int *ih_this, const char *file_name,
@@ -64,13 +66,15 @@ void MatrixMultiply_lsc_wrp(const int *ih_matA, const int *ih_matB,
                             int *ih_matC, const bool *IsATransposed,
                             const bool *IsBTransposed, const double *alpha,
                             const double *beta, const double *threshold,
-                            int *ih_matrix_memory_pool);
+                            int *ih_matrix_memory_pool, const double *screen);
 void TransposeMatrix_lsc_wrp(const int *ih_matA, int *ih_matAT);
 void ConjugateMatrix_lsc_wrp(int *ih_matA);
 void PrintMatrix_lsc_wrp(const int *ih_this);
 void PrintMatrixF_lsc_wrp(const int *ih_this, const char *file_name,
                           const int *name_size);
 void MatrixToTripletList_lsc_wrp(const int *ih_this, int *ih_triplet_list);
+void GetMatrixArrays_lsc_wrp(const int *ih_this, int *nnz, int **outer_index,
+                            int **inner_index, double **values);
 void MatrixDiagonalScale_lsc_wrp(int *ih_mat, const int *ih_tlist);
 
 #endif
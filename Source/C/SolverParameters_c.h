@@ -9,6 +9,9 @@ void SetParametersThreshold_wrp(int *ih_this, const double *new_value);
 void SetParametersLoadBalance_wrp(int *ih_this, const int *ih_permutation);
 void SetParametersStepThreshold_wrp(int *ih_this, const double *new_value);
 void SetParametersMonitorConvergence_wrp(int *ih_this, const bool *new_value);
+void SetParametersReusePattern_wrp(int *ih_this, const bool *new_value);
+void SetParametersPrecisionSwitch_wrp(int *ih_this, const double *new_value);
+void SetParametersScreenTolerance_wrp(int *ih_this, const double *new_value);
 void DestructSolverParameters_wrp(int *ih_this);
 
 #endif
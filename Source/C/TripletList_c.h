@@ -13,6 +13,13 @@ void DestructTripletList_r_wrp(int *ih_this);
 void SortTripletList_r_wrp(const int *ih_this, const int *matrix_size,
                            int *h_sorted);
 int GetTripletListSize_r_wrp(const int *ih_this);
+void FillTripletListFromArrays_r_wrp(int *ih_this, const int *list_size,
+                                     const int *index_column,
+                                     const int *index_row,
+                                     const double *point_value);
+void GetTripletListArrays_r_wrp(const int *ih_this, int *list_size,
+                                int **index_column, int **index_row,
+                                double **point_value, int *stride);
 
 void ConstructTripletList_c_wrp(int *ih_this, const int *size);
 void ResizeTripletList_c_wrp(int *ih_this, const int *size);
@@ -30,5 +37,12 @@ void DestructTripletList_c_wrp(int *ih_this);
 void SortTripletList_c_wrp(const int *ih_this, const int *matrix_size,
                            int *h_sorted);
 int GetTripletListSize_c_wrp(const int *ih_this);
+void FillTripletListFromArrays_c_wrp(int *ih_this, const int *list_size,
+                                     const int *index_column,
+                                     const int *index_row,
+                                     const double *point_value);
+void GetTripletListArrays_c_wrp(const int *ih_this, int *list_size,
+                                int **index_column, int **index_row,
+                                double **point_value, int *stride);
 
 #endif
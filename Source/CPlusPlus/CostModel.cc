@@ -0,0 +1,21 @@
+#include "CostModel.h"
+
+////////////////////////////////////////////////////////////////////////////////
+extern "C" {
+#include "CostModel_c.h"
+}
+
+////////////////////////////////////////////////////////////////////////////////
+void NTPoly::CalibrateCostModel() { CalibrateCostModel_wrp(); }
+
+////////////////////////////////////////////////////////////////////////////////
+void NTPoly::SetCostModel(double sparse_cost, double output_cost,
+                          double dense_cost, double conversion_cost) {
+  SetCostModel_wrp(&sparse_cost, &output_cost, &dense_cost, &conversion_cost);
+}
+
+////////////////////////////////////////////////////////////////////////////////
+void NTPoly::ResetCostModel() { ResetCostModel_wrp(); }
+
+////////////////////////////////////////////////////////////////////////////////
+void NTPoly::PrintCostModel() { PrintCostModel_wrp(); }
@@ -0,0 +1,32 @@
+#ifndef CostModel_h
+#define CostModel_h
+
+////////////////////////////////////////////////////////////////////////////////
+namespace NTPoly {
+////////////////////////////////////////////////////////////////////////////////
+//! Calibrate the model used to choose between the sparse and dense local
+//! multiplication algorithms, by timing both on test matrices. If the clock is
+//! too coarse to time them, the model is left uncalibrated.
+void CalibrateCostModel();
+
+////////////////////////////////////////////////////////////////////////////////
+//! Set the costs of the model, for example from a stored profile.
+//! \param sparse_cost seconds per multiply-add of the sparse algorithm on one
+//! thread.
+//! \param output_cost seconds per non zero of the result of the sparse
+//! algorithm on one thread.
+//! \param dense_cost seconds per multiply-add of the dense algorithm.
+//! \param conversion_cost seconds per element to convert or scan a matrix.
+void SetCostModel(double sparse_cost, double output_cost, double dense_cost,
+                  double conversion_cost);
+
+////////////////////////////////////////////////////////////////////////////////
+//! Go back to choosing the algorithm on the sparsity of the operands alone.
+void ResetCostModel();
+
+////////////////////////////////////////////////////////////////////////////////
+//! Print the costs of the model, and the choices made with it, to the log.
+void PrintCostModel();
+
+} // namespace NTPoly
+#endif
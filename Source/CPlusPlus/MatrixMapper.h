@@ -52,6 +52,12 @@ public:
   //!\param proc the procedure to apply.
   static void Map(const Matrix_ps &inmat, Matrix_ps &outmat,
                   ComplexOperation *proc);
+  //! A helper that gets information about the process grid.
+  //!\param mat the matrix to get the info of.
+  //!\param num_slices how many slices is this matrix distributed on.
+  //!\param my_slice which slice is this process on.
+  static void GetSliceInfo(const Matrix_ps &mat, int &num_slices,
+                           int &my_slice);
 
 private:
   //! Given a triplet list, apply this procedure to each element (real).
@@ -66,12 +72,6 @@ private:
   //!\param proc the procedure to apply.
   static void Map(const TripletList_c &inmat, TripletList_c &outmat,
                   ComplexOperation *proc, int num_slices = 1, int my_slice = 0);
-  //! A helper that gets information about the process grid.
-  //!\param mat the matrix to get the info of.
-  //!\param num_slices how many slices is this matrix distributed on.
-  //!\param my_slice which slice is this process on.
-  static void GetSliceInfo(const Matrix_ps &mat, int &num_slices,
-                           int &my_slice);
 };
 } // namespace NTPoly
 
@@ -12,12 +12,16 @@ extern "C" {
 namespace NTPoly {
 ////////////////////////////////////////////////////////////////////////////////
 
-MatrixMemoryPool_r::MatrixMemoryPool_r(int columns, int rows) {
-  ConstructMatrixMemoryPool_lr_wrp(ih_this, &rows, &columns);
+MatrixMemoryPool_r::MatrixMemoryPool_r(int columns, int rows, bool use_hash,
+                                       bool reuse_pattern, int block_size) {
+  ConstructMatrixMemoryPool_lr_wrp(ih_this, &rows, &columns, &use_hash,
+                                    &reuse_pattern, &block_size);
 }
 
-MatrixMemoryPool_c::MatrixMemoryPool_c(int columns, int rows) {
-  ConstructMatrixMemoryPool_lc_wrp(ih_this, &rows, &columns);
+MatrixMemoryPool_c::MatrixMemoryPool_c(int columns, int rows, bool use_hash,
+                                       bool reuse_pattern, int block_size) {
+  ConstructMatrixMemoryPool_lc_wrp(ih_this, &rows, &columns, &use_hash,
+                                    &reuse_pattern, &block_size);
 }
 
 ////////////////////////////////////////////////////////////////////////////////
@@ -29,4 +33,18 @@ MatrixMemoryPool_r::~MatrixMemoryPool_r() {
 MatrixMemoryPool_c::~MatrixMemoryPool_c() {
   DestructMatrixMemoryPool_lc_wrp(ih_this);
 }
+
+////////////////////////////////////////////////////////////////////////////////
+
+long int MatrixMemoryPool_r::GetFlops() const {
+  long int temp;
+  GetMatrixMemoryPoolFlops_lr_wrp(ih_this, &temp);
+  return temp;
+}
+
+long int MatrixMemoryPool_c::GetFlops() const {
+  long int temp;
+  GetMatrixMemoryPoolFlops_lc_wrp(ih_this, &temp);
+  return temp;
+}
 } // namespace NTPoly
@@ -15,9 +15,20 @@ public:
   //! Constructor.
   //!\param columns number of columns for the matrix.
   //!\param rows number of rows for the matrix.
-  MatrixMemoryPool_r(int columns, int rows);
+  //!\param use_hash accumulate products in hash tables that grow with the
+  //! result, instead of dense scratch arrays.
+  //!\param reuse_pattern keep the structure of the last product, so that a
+  //! product of operands with the same patterns only recomputes values.
+  //! Implies use_hash.
+  //!\param block_size if larger than one, products are computed on blocks of
+  //! this size with dense kernels.
+  MatrixMemoryPool_r(int columns, int rows, bool use_hash = false,
+                     bool reuse_pattern = false, int block_size = 1);
   //! Destructor
   ~MatrixMemoryPool_r();
+  //! Get the number of multiply-adds needed by the last sparse product
+  //! computed with this pool.
+  long int GetFlops() const;
 
 private:
   int ih_this[SIZE_wrp];
@@ -38,9 +49,20 @@ public:
   //! Constructor.
   //!\param columns number of columns for the matrix.
   //!\param rows number of rows for the matrix.
-  MatrixMemoryPool_c(int columns, int rows);
+  //!\param use_hash accumulate products in hash tables that grow with the
+  //! result, instead of dense scratch arrays.
+  //!\param reuse_pattern keep the structure of the last product, so that a
+  //! product of operands with the same patterns only recomputes values.
+  //! Implies use_hash.
+  //!\param block_size if larger than one, products are computed on blocks of
+  //! this size with dense kernels.
+  MatrixMemoryPool_c(int columns, int rows, bool use_hash = false,
+                     bool reuse_pattern = false, int block_size = 1);
   //! Destructor
   ~MatrixMemoryPool_c();
+  //! Get the number of multiply-adds needed by the last sparse product
+  //! computed with this pool.
+  long int GetFlops() const;
 
 private:
   int ih_this[SIZE_wrp];
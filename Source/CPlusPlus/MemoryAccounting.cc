@@ -0,0 +1,19 @@
+#include "MemoryAccounting.h"
+
+////////////////////////////////////////////////////////////////////////////////
+extern "C" {
+#include "MemoryAccounting_c.h"
+}
+
+////////////////////////////////////////////////////////////////////////////////
+long int NTPoly::GetMemoryHighWaterMark() {
+  long int temp;
+  GetMemoryHighWaterMark_wrp(&temp);
+  return temp;
+}
+
+////////////////////////////////////////////////////////////////////////////////
+void NTPoly::ResetMemoryHighWaterMark() { ResetMemoryHighWaterMark_wrp(); }
+
+////////////////////////////////////////////////////////////////////////////////
+void NTPoly::PrintMemoryUsage() { PrintMemoryUsage_wrp(); }
@@ -0,0 +1,21 @@
+#ifndef MemoryAccounting_h
+#define MemoryAccounting_h
+
+////////////////////////////////////////////////////////////////////////////////
+namespace NTPoly {
+////////////////////////////////////////////////////////////////////////////////
+//! Get the most bytes of working memory NTPoly held at once on this process.
+//! This counts the memory pools and buffers of the distributed matrix
+//! multiplications while they run, but not their operands or results.
+long int GetMemoryHighWaterMark();
+
+////////////////////////////////////////////////////////////////////////////////
+//! Start recording the high water mark again, for example before a solver.
+void ResetMemoryHighWaterMark();
+
+////////////////////////////////////////////////////////////////////////////////
+//! Print the high water mark of this process to the log.
+void PrintMemoryUsage();
+
+} // namespace NTPoly
+#endif
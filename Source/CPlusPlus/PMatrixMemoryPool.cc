@@ -5,17 +5,40 @@ using namespace NTPoly;
 ////////////////////////////////////////////////////////////////////////////////
 extern "C" {
 #include "PMatrixMemoryPool_c.h"
+#include "PSMatrix_c.h"
 }
 
 ////////////////////////////////////////////////////////////////////////////////
 namespace NTPoly {
 ////////////////////////////////////////////////////////////////////////////////
-PMatrixMemoryPool::PMatrixMemoryPool(const Matrix_ps &Matrix) {
-  ConstructMatrixMemoryPool_p_wrp(ih_this, Matrix.ih_this);
+PMatrixMemoryPool::PMatrixMemoryPool(const Matrix_ps &Matrix, bool use_hash,
+                                     bool reuse_pattern, int block_size,
+                                     bool pin_first, bool pin_second) {
+  ConstructMatrixMemoryPool_p_wrp(ih_this, Matrix.ih_this, &use_hash,
+                                  &reuse_pattern, &block_size, &pin_first,
+                                  &pin_second);
 }
 
 ////////////////////////////////////////////////////////////////////////////////
 PMatrixMemoryPool::~PMatrixMemoryPool() {
   DestructMatrixMemoryPool_p_wrp(ih_this);
 }
+
+////////////////////////////////////////////////////////////////////////////////
+void PMatrixMemoryPool::StartGemm(const Matrix_ps &matA,
+                                  const Matrix_ps &matB) {
+  StartMatrixMultiply_ps_wrp(matA.ih_this, matB.ih_this, ih_this);
+}
+
+////////////////////////////////////////////////////////////////////////////////
+long int PMatrixMemoryPool::GetMemory() const {
+  long int temp;
+  GetMemoryPoolMemory_p_wrp(ih_this, &temp);
+  return temp;
+}
+
+////////////////////////////////////////////////////////////////////////////////
+void PMatrixMemoryPool::ReleaseOperands() {
+  DestructGatheredOperands_p_wrp(ih_this);
+}
 } // namespace NTPoly
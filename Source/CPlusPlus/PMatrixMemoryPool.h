@@ -12,9 +12,33 @@ class Matrix_ps;
 class PMatrixMemoryPool {
 public:
   //! Standard constructor.
-  PMatrixMemoryPool(const Matrix_ps &Matrix);
+  //!\param Matrix the matrix the pool will be used with.
+  //!\param use_hash accumulate local products in hash tables.
+  //!\param reuse_pattern keep the structure of the local products, so that a
+  //! product of operands with the same patterns only recomputes values.
+  //! Implies use_hash.
+  //!\param block_size if larger than one, local products are computed on
+  //! blocks of this size with dense kernels.
+  //!\param pin_first keep the gathered first operand of a multiply, so that
+  //! later products with the same first operand skip gathering it.
+  //!\param pin_second keep the gathered second operand of a multiply.
+  //! Operands are only reused for the same matrices, others are gathered.
+  PMatrixMemoryPool(const Matrix_ps &Matrix, bool use_hash = false,
+                    bool reuse_pattern = false, int block_size = 1,
+                    bool pin_first = false, bool pin_second = false);
   //! Standard destructor.
   ~PMatrixMemoryPool();
+  //! Start sending the operands of matA*matB in the background. The product
+  //! is computed by a later Gemm with the same operands and this pool.
+  //!\param matA first mat.
+  //!\param matB second mat.
+  void StartGemm(const Matrix_ps &matA, const Matrix_ps &matB);
+  //! Get the number of bytes held by the pool on this process, including
+  //! pinned operands and the buffers of started gathers.
+  long int GetMemory() const;
+  //! Free the operands kept in the pool, pinned or from StartGemm, so that
+  //! the next Gemm gathers its operands again.
+  void ReleaseOperands();
 
 private:
   //! Pointer to underlying data.
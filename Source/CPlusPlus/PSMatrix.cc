@@ -115,6 +115,13 @@ long int Matrix_ps::GetSize() const {
   return temp;
 }
 
+//////////////////////////////////////////////////////////////////////////////
+long int Matrix_ps::GetMemory() const {
+  long int temp;
+  GetMatrixMemory_ps_wrp(ih_this, &temp);
+  return temp;
+}
+
 //////////////////////////////////////////////////////////////////////////////
 void Matrix_ps::GetTripletList(TripletList_r &triplet_list) const {
   GetMatrixTripletList_psr_wrp(ih_this, triplet_list.ih_this);
@@ -164,6 +171,16 @@ void Matrix_ps::GetMatrixSlice(Matrix_ps &submatrix, int start_row, int end_row,
 //////////////////////////////////////////////////////////////////////////////
 bool Matrix_ps::IsIdentity() const { return IsIdentity_ps_wrp(ih_this); }
 
+//////////////////////////////////////////////////////////////////////////////
+bool Matrix_ps::IsHermitian() const {
+  return IsMatrixHermitian_ps_wrp(ih_this);
+}
+
+//////////////////////////////////////////////////////////////////////////////
+void Matrix_ps::SetHermitian(bool is_hermitian) {
+  SetMatrixHermitian_ps_wrp(ih_this, &is_hermitian);
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 void Matrix_ps::Transpose(const Matrix_ps &matA) {
   TransposeMatrix_ps_wrp(matA.ih_this, ih_this);
@@ -193,6 +210,20 @@ complex<double> Matrix_ps::Dot_c(const Matrix_ps &matB) {
   return dot_product;
 }
 
+//////////////////////////////////////////////////////////////////////////////
+double Matrix_ps::TraceOfProduct(const Matrix_ps &matB) const {
+  double trace_value;
+  TraceOfProduct_psr_wrp(ih_this, matB.ih_this, &trace_value);
+  return trace_value;
+}
+
+//////////////////////////////////////////////////////////////////////////////
+complex<double> Matrix_ps::TraceOfProduct_c(const Matrix_ps &matB) const {
+  double temp_real, temp_imag;
+  TraceOfProduct_psc_wrp(ih_this, matB.ih_this, &temp_real, &temp_imag);
+  return complex<double>(temp_real, temp_imag);
+}
+
 //////////////////////////////////////////////////////////////////////////////
 void Matrix_ps::Increment(const Matrix_ps &matB, double alpha,
                           double threshold) {
@@ -207,9 +238,25 @@ void Matrix_ps::PairwiseMultiply(const Matrix_ps &matA, const Matrix_ps &matB) {
 //////////////////////////////////////////////////////////////////////////////
 void Matrix_ps::Gemm(const Matrix_ps &matA, const Matrix_ps &matB,
                      PMatrixMemoryPool &memory_pool, double alpha, double beta,
-                     double threshold) {
+                     double threshold, double screen) {
   MatrixMultiply_ps_wrp(matA.ih_this, matB.ih_this, ih_this, &alpha, &beta,
-                        &threshold, memory_pool.ih_this);
+                        &threshold, memory_pool.ih_this, &screen);
+}
+
+//////////////////////////////////////////////////////////////////////////////
+void Matrix_ps::GemmChain(const Matrix_ps &matA, const Matrix_ps &matB,
+                          Matrix_ps &matAAB, PMatrixMemoryPool &memory_pool,
+                          double threshold) {
+  MatrixMultiplyChain_ps_wrp(matA.ih_this, matB.ih_this, ih_this,
+                             matAAB.ih_this, &threshold, memory_pool.ih_this);
+}
+
+//////////////////////////////////////////////////////////////////////////////
+void Matrix_ps::GemmUpdate(const Matrix_ps &matA,
+                           PMatrixMemoryPool &memory_pool, double alpha,
+                           double beta, double shift, double threshold) {
+  MatrixMultiplyUpdate_ps_wrp(matA.ih_this, ih_this, &alpha, &beta, &shift,
+                              &threshold, memory_pool.ih_this);
 }
 
 //////////////////////////////////////////////////////////////////////////////
@@ -217,6 +264,11 @@ void Matrix_ps::Scale(double constant) {
   ScaleMatrix_ps_wrp(ih_this, &constant);
 }
 
+//////////////////////////////////////////////////////////////////////////////
+void Matrix_ps::Shift(double shift) {
+  ShiftMatrix_ps_wrp(ih_this, &shift);
+}
+
 //////////////////////////////////////////////////////////////////////////////
 void Matrix_ps::DiagonalScale(const TripletList_r &tlist) {
   MatrixDiagonalScale_psr_wrp(ih_this, tlist.ih_this);
@@ -74,6 +74,8 @@ public:
   int GetLogicalDimension() const;
   //! Get the total number of non-zero entries in the matrix
   long int GetSize() const;
+  //! Get the number of bytes held by the matrix on this process.
+  long int GetMemory() const;
   //! Extracts a triplet list of the data that is stored on this process.
   //! Data is returned with absolute coordinates.
   //! \param triplet_list the list to fill.
@@ -116,6 +118,17 @@ public:
                       int start_column, int end_column);
   //! Determine if this is the identity matrix.
   bool IsIdentity() const;
+  //! Determine if this matrix is marked as symmetric (real) or Hermitian
+  //! (complex).
+  bool IsHermitian() const;
+  //! Mark this matrix as symmetric (real) or Hermitian (complex). Transposes
+  //! become local copies and only the lower triangle is written to file. The
+  //! matrix is compared with its conjugate transpose first, and is only
+  //! marked if they agree up to round off, so check IsHermitian afterwards.
+  //! Both triangles are still stored, so this does not save memory or
+  //! communication in other operations.
+  //!\param is_hermitian true if the matrix is Hermitian.
+  void SetHermitian(bool is_hermitian);
 
 public:
   //! Transpose a sparse matrix.
@@ -139,6 +152,12 @@ public:
   //! this = dot(this,matB)
   //!\param matB the matrix to dot.
   std::complex<double> Dot_c(const Matrix_ps &matB);
+  //! Tr(this*matB), computed without forming the product.
+  //!\param matB the matrix to multiply by.
+  double TraceOfProduct(const Matrix_ps &matB) const;
+  //! Tr(this*matB), computed without forming the product.
+  //!\param matB the matrix to multiply by.
+  std::complex<double> TraceOfProduct_c(const Matrix_ps &matB) const;
   //! this = alpha*MatB + this (AXPY)
   //!\param matB the matrix to add.
   //!\param alpha scaling factor.
@@ -157,12 +176,35 @@ public:
   //!\param alpha scaling factor.
   //!\param beta scaling factor.
   //!\param threshold for flushing small values.
+  //!\param screen products whose norm bound is below this are skipped.
   void Gemm(const Matrix_ps &matA, const Matrix_ps &matB,
             PMatrixMemoryPool &memory_pool, double alpha = 1.0,
-            double beta = 0.0, double threshold = 0.0);
+            double beta = 0.0, double threshold = 0.0, double screen = 0.0);
+  //! this := matA*matB and matAAB := matA*this, computed in one pass.
+  //!\param matA first mat.
+  //!\param matB second mat.
+  //!\param matAAB the second product of the chain.
+  //!\param memory_pool memory pool for intermediates.
+  //!\param threshold for flushing small values.
+  void GemmChain(const Matrix_ps &matA, const Matrix_ps &matB,
+                 Matrix_ps &matAAB, PMatrixMemoryPool &memory_pool,
+                 double threshold = 0.0);
+  //! this := alpha*matA*this + beta*this + shift*I
+  //!\param matA the matrix to multiply on to this one.
+  //!\param memory_pool memory pool for intermediates.
+  //!\param alpha scaling factor.
+  //!\param beta scaling factor.
+  //!\param shift value added to the diagonal.
+  //!\param threshold for flushing small values.
+  void GemmUpdate(const Matrix_ps &matA, PMatrixMemoryPool &memory_pool,
+                  double alpha = 1.0, double beta = 0.0, double shift = 0.0,
+                  double threshold = 0.0);
   //! scale the matrix by a constant.
   //! constant the value to scale by.
   void Scale(double constant);
+  //! add a constant to the diagonal of the matrix.
+  //!\param shift the value to add.
+  void Shift(double shift);
   //! compute the norm of a matrix.
   double Norm() const;
   //! compute the asymmetry (norm(A - A.T)) of a matrix.
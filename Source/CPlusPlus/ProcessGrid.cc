@@ -65,6 +65,11 @@ int ProcessGrid::GetNumColumns() { return GetNumColumns_wrp(ih_this); }
 ////////////////////////////////////////////////////////////////////////////////
 int ProcessGrid::GetNumRows() { return GetNumRows_wrp(ih_this); }
 
+////////////////////////////////////////////////////////////////////////////////
+void ProcessGrid::SetCompressIndices(bool compress_indices) {
+  SetCompressIndices_wrp(ih_this, &compress_indices);
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 void ProcessGrid::WriteInfo() { return WriteProcessGridInfo_wrp(ih_this); }
 
@@ -129,6 +134,11 @@ void WriteGridInfo() { return WriteGlobalProcessGridInfo_wrp(); }
 ////////////////////////////////////////////////////////////////////////////////
 int GetGlobalNumRows() { return GetGlobalNumRows_wrp(); }
 
+////////////////////////////////////////////////////////////////////////////////
+void SetGlobalCompressIndices(bool compress_indices) {
+  SetGlobalCompressIndices_wrp(&compress_indices);
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 void DestructGlobalProcessGrid() { DestructGlobalProcessGrid_wrp(); }
 } // namespace NTPoly
@@ -56,6 +56,9 @@ public:
   int GetNumColumns();
   //! Get the number of rows in this grid.
   int GetNumRows();
+  //! Choose whether matrix multiplication on this grid sends packed indices.
+  //!\param compress_indices true to delta encode and bit pack the indices.
+  void SetCompressIndices(bool compress_indices);
   //! Write out some basic information about this process grid to the log.
   void WriteInfo();
 
@@ -108,6 +111,10 @@ int GetGlobalNumSlices();
 int GetGlobalNumColumns();
 //! Get the number of process rows.
 int GetGlobalNumRows();
+//! Choose whether matrix multiplication on the global grid sends packed
+//! indices.
+//!\param compress_indices true to delta encode and bit pack the indices.
+void SetGlobalCompressIndices(bool compress_indices);
 //! Write out some basic information about the global process grid to the log.
 void WriteGridInfo();
 //! Standard destructor
@@ -160,19 +160,19 @@ void Matrix_lsc::PairwiseMultiply(const NTPoly::Matrix_lsc &matA,
 void Matrix_lsr::Gemm(const Matrix_lsr &matA, const Matrix_lsr &matB,
                       bool isATransposed, bool isBTransposed, double alpha,
                       double beta, double threshold,
-                      MatrixMemoryPool_r &memory_pool) {
+                      MatrixMemoryPool_r &memory_pool, double screen) {
   MatrixMultiply_lsr_wrp(matA.ih_this, matB.ih_this, ih_this, &isATransposed,
                          &isBTransposed, &alpha, &beta, &threshold,
-                         memory_pool.ih_this);
+                         memory_pool.ih_this, &screen);
 }
 
 void Matrix_lsc::Gemm(const Matrix_lsc &matA, const Matrix_lsc &matB,
                       bool isATransposed, bool isBTransposed, double alpha,
                       double beta, double threshold,
-                      MatrixMemoryPool_c &memory_pool) {
+                      MatrixMemoryPool_c &memory_pool, double screen) {
   MatrixMultiply_lsc_wrp(matA.ih_this, matB.ih_this, ih_this, &isATransposed,
                          &isBTransposed, &alpha, &beta, &threshold,
-                         memory_pool.ih_this);
+                         memory_pool.ih_this, &screen);
 }
 
 ////////////////////////////////////////////////////////////////////////////////
@@ -221,4 +221,21 @@ void Matrix_lsr::MatrixToTripletList(TripletList_r &triplet_list) const {
 void Matrix_lsc::MatrixToTripletList(TripletList_c &triplet_list) const {
   MatrixToTripletList_lsc_wrp(ih_this, triplet_list.ih_this);
 }
+
+////////////////////////////////////////////////////////////////////////////////
+int Matrix_lsr::GetArrays(int *&outer_index, int *&inner_index,
+                          double *&values) {
+  int nnz;
+  GetMatrixArrays_lsr_wrp(ih_this, &nnz, &outer_index, &inner_index, &values);
+  return nnz;
+}
+
+int Matrix_lsc::GetArrays(int *&outer_index, int *&inner_index,
+                          std::complex<double> *&values) {
+  int nnz;
+  double *temp;
+  GetMatrixArrays_lsc_wrp(ih_this, &nnz, &outer_index, &inner_index, &temp);
+  values = reinterpret_cast<std::complex<double> *>(temp);
+  return nnz;
+}
 } // namespace NTPoly
@@ -73,9 +73,11 @@ public:
   //!\param beta scaling value.
   //!\param threshold for flushing small values.
   //!\param memory_pool a memory pool to use for storing intermediates.
+  //!\param screen products whose norm bound is below this are skipped.
   void Gemm(const NTPoly::Matrix_lsr &matA, const NTPoly::Matrix_lsr &matB,
             bool isATransposed, bool isBTransposed, double alpha, double beta,
-            double threshold, NTPoly::MatrixMemoryPool_r &memory_pool);
+            double threshold, NTPoly::MatrixMemoryPool_r &memory_pool,
+            double screen = 0.0);
   //! Scale a matrix using a diagonal matrix (triplet list form).
   //!\param tlist the triplet list.
   //!\param threshold for flushing small values.
@@ -97,6 +99,15 @@ public:
   //! Compute a triplet list from the entries in a matrix.
   //!\param triplet_list output.
   void MatrixToTripletList(NTPoly::TripletList_r &triplet_list) const;
+  //! Get direct access to the compressed storage, without copying.
+  //! Storage is by column: outer_index holds columns+1 offsets starting
+  //! from 0, and inner_index holds the row (starting from 1) of each value.
+  //! The pointers are invalidated when the matrix is modified or destroyed.
+  //!\param outer_index the offset of each column.
+  //!\param inner_index the row of each value.
+  //!\param values the stored values.
+  //!\result the number of stored values.
+  int GetArrays(int *&outer_index, int *&inner_index, double *&values);
 
 public:
   //! Standard destructor.
@@ -171,9 +182,11 @@ public:
   //!\param beta scaling value.
   //!\param threshold for flushing small values.
   //!\param memory_pool a memory pool to use for storing intermediates.
+  //!\param screen products whose norm bound is below this are skipped.
   void Gemm(const NTPoly::Matrix_lsc &matA, const NTPoly::Matrix_lsc &matB,
             bool isATransposed, bool isBTransposed, double alpha, double beta,
-            double threshold, NTPoly::MatrixMemoryPool_c &memory_pool);
+            double threshold, NTPoly::MatrixMemoryPool_c &memory_pool,
+            double screen = 0.0);
   //! Scale a matrix using a diagonal matrix (triplet list form).
   //!\param tlist the triplet list.
   //!\param threshold for flushing small values.
@@ -197,6 +210,16 @@ public:
   //! Compute a triplet list from the entries in a matrix.
   //!\param triplet_list output.
   void MatrixToTripletList(NTPoly::TripletList_c &triplet_list) const;
+  //! Get direct access to the compressed storage, without copying.
+  //! Storage is by column: outer_index holds columns+1 offsets starting
+  //! from 0, and inner_index holds the row (starting from 1) of each value.
+  //! The pointers are invalidated when the matrix is modified or destroyed.
+  //!\param outer_index the offset of each column.
+  //!\param inner_index the row of each value.
+  //!\param values the stored values.
+  //!\result the number of stored values.
+  int GetArrays(int *&outer_index, int *&inner_index,
+                std::complex<double> *&values);
 
 public:
   //! Standard destructor.
@@ -48,4 +48,19 @@ void SolverParameters::SetStepThreshold(double new_value) {
 void SolverParameters::SetMonitorConvergence(bool new_value) {
   SetParametersMonitorConvergence_wrp(ih_this, &new_value);
 }
+
+////////////////////////////////////////////////////////////////////////////////
+void SolverParameters::SetReusePattern(bool new_value) {
+  SetParametersReusePattern_wrp(ih_this, &new_value);
+}
+
+////////////////////////////////////////////////////////////////////////////////
+void SolverParameters::SetPrecisionSwitch(double new_value) {
+  SetParametersPrecisionSwitch_wrp(ih_this, &new_value);
+}
+
+////////////////////////////////////////////////////////////////////////////////
+void SolverParameters::SetScreenTolerance(double new_value) {
+  SetParametersScreenTolerance_wrp(ih_this, &new_value);
+}
 } // namespace NTPoly
@@ -35,6 +35,18 @@ public:
   //! Whether to automatically monitor convergence
   //!\param new_value
   void SetMonitorConvergence(bool new_value);
+  //! Whether multiplications reuse the structure of the previous product
+  //! when the sparsity pattern of the operands has not changed.
+  //!\param new_value
+  void SetReusePattern(bool new_value);
+  //! Operands are communicated in single precision until the convergence
+  //! measure drops below this value (zero disables it).
+  //!\param new_value
+  void SetPrecisionSwitch(double new_value);
+  //! Products of blocks whose norm bound is below this value are skipped in
+  //! the multiplications (zero disables it).
+  //!\param new_value
+  void SetScreenTolerance(double new_value);
   ~SolverParameters();
 
 private:
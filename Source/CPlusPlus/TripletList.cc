@@ -79,6 +79,41 @@ Triplet_c TripletList_c::GetTripletAt(int index) const {
 int TripletList_r::GetSize() const { return GetTripletListSize_r_wrp(ih_this); }
 int TripletList_c::GetSize() const { return GetTripletListSize_c_wrp(ih_this); }
 
+////////////////////////////////////////////////////////////////////////////////
+void TripletList_r::FillFromArrays(int size, const int *index_row,
+                                   const int *index_column,
+                                   const double *point_value) {
+  FillTripletListFromArrays_r_wrp(ih_this, &size, index_column, index_row,
+                                  point_value);
+}
+
+void TripletList_c::FillFromArrays(int size, const int *index_row,
+                                   const int *index_column,
+                                   const std::complex<double> *point_value) {
+  FillTripletListFromArrays_c_wrp(
+      ih_this, &size, index_column, index_row,
+      reinterpret_cast<const double *>(point_value));
+}
+
+////////////////////////////////////////////////////////////////////////////////
+int TripletList_r::GetArrays(int *&index_row, int *&index_column,
+                             double *&point_value, int &stride) {
+  int size;
+  GetTripletListArrays_r_wrp(ih_this, &size, &index_column, &index_row,
+                             &point_value, &stride);
+  return size;
+}
+
+int TripletList_c::GetArrays(int *&index_row, int *&index_column,
+                             std::complex<double> *&point_value, int &stride) {
+  int size;
+  double *temp;
+  GetTripletListArrays_c_wrp(ih_this, &size, &index_column, &index_row, &temp,
+                             &stride);
+  point_value = reinterpret_cast<std::complex<double> *>(temp);
+  return size;
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 TripletList_r::~TripletList_r() { DestructTripletList_r_wrp(ih_this); }
 TripletList_c::~TripletList_c() { DestructTripletList_c_wrp(ih_this); }
@@ -2,6 +2,7 @@
 #define TRIPLETLIST_h
 
 #include "Wrapper.h"
+#include <complex>
 
 ////////////////////////////////////////////////////////////////////////////////
 namespace NTPoly {
@@ -33,6 +34,23 @@ public:
   //! Get the number of entries in a triplet list.
   //!\result the number of entries in the list.
   int GetSize() const;
+  //! Fill the list from arrays of indices and values in a single call.
+  //! Any existing entries are replaced.
+  //!\param size the number of triplets in the arrays.
+  //!\param index_row the row of each triplet (starting from 1).
+  //!\param index_column the column of each triplet (starting from 1).
+  //!\param point_value the value of each triplet.
+  void FillFromArrays(int size, const int *index_row, const int *index_column,
+                      const double *point_value);
+  //! Get direct access to the stored triplets, without copying.
+  //! The pointers are invalidated when the list is resized or destroyed.
+  //!\param index_row the row of the first triplet.
+  //!\param index_column the column of the first triplet.
+  //!\param point_value the value of the first triplet.
+  //!\param stride distance in bytes between consecutive triplets.
+  //!\result the number of triplets.
+  int GetArrays(int *&index_row, int *&index_column, double *&point_value,
+                int &stride);
   //! Standard destructor.
   ~TripletList_r();
   //! Sort a triplet list
@@ -81,6 +99,23 @@ public:
   //! Get the number of entries in a triplet list.
   //!\result the number of entries in the list.
   int GetSize() const;
+  //! Fill the list from arrays of indices and values in a single call.
+  //! Any existing entries are replaced.
+  //!\param size the number of triplets in the arrays.
+  //!\param index_row the row of each triplet (starting from 1).
+  //!\param index_column the column of each triplet (starting from 1).
+  //!\param point_value the value of each triplet.
+  void FillFromArrays(int size, const int *index_row, const int *index_column,
+                      const std::complex<double> *point_value);
+  //! Get direct access to the stored triplets, without copying.
+  //! The pointers are invalidated when the list is resized or destroyed.
+  //!\param index_row the row of the first triplet.
+  //!\param index_column the column of the first triplet.
+  //!\param point_value the value of the first triplet.
+  //!\param stride distance in bytes between consecutive triplets.
+  //!\result the number of triplets.
+  int GetArrays(int *&index_row, int *&index_column,
+                std::complex<double> *&point_value, int &stride);
   //! Standard destructor.
   ~TripletList_c();
   //! Sort a triplet list
@@ -0,0 +1,12 @@
+  CALL DestructMatrix(this)
+
+  this%rows = rows
+  this%columns = columns
+  this%block_size = block_size
+  this%block_rows = (rows - 1) / block_size + 1
+  this%block_columns = (columns - 1) / block_size + 1
+
+  ALLOCATE(this%outer_index(this%block_columns + 1))
+  this%outer_index = 0
+  ALLOCATE(this%inner_index(0))
+  ALLOCATE(this%values(block_size, block_size, 0))
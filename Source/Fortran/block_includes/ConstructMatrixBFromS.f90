@@ -0,0 +1,82 @@
+  !! Local Data
+  INTEGER, DIMENSION(:), ALLOCATABLE :: marker
+  INTEGER, DIMENSION(:), ALLOCATABLE :: position
+  INTEGER :: II, JJ, KK, block_row, block_column, start, temp
+
+  CALL ConstructEmptyMatrix(block_matrix, sparse_matrix%rows, &
+       & sparse_matrix%columns, block_size)
+  ALLOCATE(marker(block_matrix%block_rows))
+  ALLOCATE(position(block_matrix%block_rows))
+
+  !! Count the distinct blocks of each block column.
+  marker = 0
+  DO block_column = 1, block_matrix%block_columns
+     block_matrix%outer_index(block_column + 1) = &
+          & block_matrix%outer_index(block_column)
+     DO JJ = (block_column - 1) * block_size + 1, &
+          & MIN(block_column * block_size, sparse_matrix%columns)
+        DO KK = sparse_matrix%outer_index(JJ) + 1, &
+             & sparse_matrix%outer_index(JJ + 1)
+           block_row = (sparse_matrix%inner_index(KK) - 1) / block_size + 1
+           IF (marker(block_row) .NE. block_column) THEN
+              marker(block_row) = block_column
+              block_matrix%outer_index(block_column + 1) = &
+                   & block_matrix%outer_index(block_column + 1) + 1
+           END IF
+        END DO
+     END DO
+  END DO
+
+  DEALLOCATE(block_matrix%inner_index)
+  DEALLOCATE(block_matrix%values)
+  ALLOCATE(block_matrix%inner_index( &
+       & block_matrix%outer_index(block_matrix%block_columns + 1)))
+  ALLOCATE(block_matrix%values(block_size, block_size, &
+       & block_matrix%outer_index(block_matrix%block_columns + 1)))
+  block_matrix%values = 0
+
+  !! Gather the block rows, sort them, and scatter the values.
+  marker = 0
+  DO block_column = 1, block_matrix%block_columns
+     start = block_matrix%outer_index(block_column)
+     KK = start
+     DO JJ = (block_column - 1) * block_size + 1, &
+          & MIN(block_column * block_size, sparse_matrix%columns)
+        DO II = sparse_matrix%outer_index(JJ) + 1, &
+             & sparse_matrix%outer_index(JJ + 1)
+           block_row = (sparse_matrix%inner_index(II) - 1) / block_size + 1
+           IF (marker(block_row) .NE. block_column) THEN
+              marker(block_row) = block_column
+              KK = KK + 1
+              block_matrix%inner_index(KK) = block_row
+           END IF
+        END DO
+     END DO
+     !! Insertion sort, the number of blocks per column is small.
+     DO II = start + 2, KK
+        temp = block_matrix%inner_index(II)
+        JJ = II - 1
+        DO WHILE (JJ .GT. start)
+           IF (block_matrix%inner_index(JJ) .LE. temp) EXIT
+           block_matrix%inner_index(JJ + 1) = block_matrix%inner_index(JJ)
+           JJ = JJ - 1
+        END DO
+        block_matrix%inner_index(JJ + 1) = temp
+     END DO
+     DO II = start + 1, KK
+        position(block_matrix%inner_index(II)) = II
+     END DO
+     DO JJ = (block_column - 1) * block_size + 1, &
+          & MIN(block_column * block_size, sparse_matrix%columns)
+        DO II = sparse_matrix%outer_index(JJ) + 1, &
+             & sparse_matrix%outer_index(JJ + 1)
+           block_row = (sparse_matrix%inner_index(II) - 1) / block_size + 1
+           temp = sparse_matrix%inner_index(II) - (block_row - 1) * block_size
+           block_matrix%values(temp, JJ - (block_column - 1) * block_size, &
+                & position(block_row)) = sparse_matrix%values(II)
+        END DO
+     END DO
+  END DO
+
+  DEALLOCATE(marker)
+  DEALLOCATE(position)
@@ -0,0 +1,3 @@
+  CALL ConstructMatrixFromFile(sparse_matrix, file_name)
+  CALL ConstructMatrixBFromS(sparse_matrix, this, block_size)
+  CALL DestructMatrix(sparse_matrix)
@@ -0,0 +1,4 @@
+  CALL ConstructMatrixFromTripletList(sparse_matrix, triplet_list, &
+       & rows, columns)
+  CALL ConstructMatrixBFromS(sparse_matrix, this, block_size)
+  CALL DestructMatrix(sparse_matrix)
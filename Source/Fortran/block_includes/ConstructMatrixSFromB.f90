@@ -0,0 +1,58 @@
+  !! Local Data
+  INTEGER :: II, JJ, KK, NNZ, block_column, row_offset, column_offset
+  REAL(NTREAL) :: threshold
+
+  IF (PRESENT(threshold_in)) THEN
+     threshold = threshold_in
+  ELSE
+     threshold = 0.0_NTREAL
+  END IF
+
+  CALL ConstructEmptyMatrix(sparse_matrix, block_matrix%rows, &
+       & block_matrix%columns)
+
+  !! Fill in the outer index information.
+  NNZ = 0
+  DO JJ = 1, block_matrix%columns
+     block_column = (JJ - 1) / block_matrix%block_size + 1
+     column_offset = JJ - (block_column - 1) * block_matrix%block_size
+     DO KK = block_matrix%outer_index(block_column) + 1, &
+          & block_matrix%outer_index(block_column + 1)
+        row_offset = (block_matrix%inner_index(KK) - 1) * &
+             & block_matrix%block_size
+        DO II = 1, MIN(block_matrix%block_size, &
+             & block_matrix%rows - row_offset)
+           IF (ABS(block_matrix%values(II, column_offset, KK)) &
+                & .GT. threshold) THEN
+              NNZ = NNZ + 1
+           END IF
+        END DO
+     END DO
+     sparse_matrix%outer_index(JJ + 1) = NNZ
+  END DO
+
+  !! Allocate Storage
+  ALLOCATE(sparse_matrix%inner_index(NNZ))
+  ALLOCATE(sparse_matrix%values(NNZ))
+
+  !! Fill in the Values
+  NNZ = 0
+  DO JJ = 1, block_matrix%columns
+     block_column = (JJ - 1) / block_matrix%block_size + 1
+     column_offset = JJ - (block_column - 1) * block_matrix%block_size
+     DO KK = block_matrix%outer_index(block_column) + 1, &
+          & block_matrix%outer_index(block_column + 1)
+        row_offset = (block_matrix%inner_index(KK) - 1) * &
+             & block_matrix%block_size
+        DO II = 1, MIN(block_matrix%block_size, &
+             & block_matrix%rows - row_offset)
+           IF (ABS(block_matrix%values(II, column_offset, KK)) &
+                & .GT. threshold) THEN
+              NNZ = NNZ + 1
+              sparse_matrix%inner_index(NNZ) = row_offset + II
+              sparse_matrix%values(NNZ) = &
+                   & block_matrix%values(II, column_offset, KK)
+           END IF
+        END DO
+     END DO
+  END DO
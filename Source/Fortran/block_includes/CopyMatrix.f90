@@ -0,0 +1,2 @@
+  CALL DestructMatrix(matB)
+  matB = matA
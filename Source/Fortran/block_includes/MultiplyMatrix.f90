@@ -0,0 +1,153 @@
+  !! Local Data
+  INTEGER, DIMENSION(:), ALLOCATABLE :: marker
+  INTEGER, DIMENSION(:), ALLOCATABLE :: position
+  INTEGER, DIMENSION(:), ALLOCATABLE :: kept_index
+  REAL(NTREAL), DIMENSION(:), ALLOCATABLE :: norm_a, norm_b
+  INTEGER :: II, JJ, KK, LL, MM, NN
+  INTEGER :: block_column, block_row, start, last, temp, bs
+  REAL(NTREAL) :: alpha, threshold, screen
+
+  !! Process Optional Parameters
+  IF (PRESENT(alpha_in)) THEN
+     alpha = alpha_in
+  ELSE
+     alpha = 1.0_NTREAL
+  END IF
+  IF (PRESENT(threshold_in)) THEN
+     threshold = threshold_in
+  ELSE
+     threshold = 0.0_NTREAL
+  END IF
+  IF (PRESENT(screen_in)) THEN
+     screen = screen_in
+  ELSE
+     screen = 0.0_NTREAL
+  END IF
+
+  bs = matA%block_size
+  CALL ConstructEmptyMatrix(matC, matA%rows, matB%columns, bs)
+  ALLOCATE(marker(matC%block_rows))
+  ALLOCATE(position(matC%block_rows))
+
+  !! The Frobenius norm of each block bounds the norm of its products. The
+  !! norms of B are scaled so that a pair is kept if norm_a*norm_b >= screen.
+  ALLOCATE(norm_a(SIZE(matA%inner_index)))
+  ALLOCATE(norm_b(SIZE(matB%inner_index)))
+  IF (screen .GT. 0.0_NTREAL) THEN
+     DO II = 1, SIZE(norm_a)
+        norm_a(II) = SQRT(SUM(ABS(matA%values(:, :, II))**2))
+     END DO
+     DO II = 1, SIZE(norm_b)
+        norm_b(II) = ABS(alpha) * SQRT(SUM(ABS(matB%values(:, :, II))**2))
+     END DO
+  ELSE
+     norm_a = 1.0_NTREAL
+     norm_b = 1.0_NTREAL
+  END IF
+
+  !! Symbolic pass: count the blocks of each block column of the product.
+  marker = 0
+  DO block_column = 1, matC%block_columns
+     matC%outer_index(block_column + 1) = matC%outer_index(block_column)
+     DO KK = matB%outer_index(block_column) + 1, &
+          & matB%outer_index(block_column + 1)
+        temp = matB%inner_index(KK)
+        DO II = matA%outer_index(temp) + 1, matA%outer_index(temp + 1)
+           IF (norm_a(II) * norm_b(KK) .LT. screen) CYCLE
+           block_row = matA%inner_index(II)
+           IF (marker(block_row) .NE. block_column) THEN
+              marker(block_row) = block_column
+              matC%outer_index(block_column + 1) = &
+                   & matC%outer_index(block_column + 1) + 1
+           END IF
+        END DO
+     END DO
+  END DO
+
+  DEALLOCATE(matC%inner_index)
+  DEALLOCATE(matC%values)
+  ALLOCATE(matC%inner_index(matC%outer_index(matC%block_columns + 1)))
+  ALLOCATE(matC%values(bs, bs, matC%outer_index(matC%block_columns + 1)))
+  matC%values = 0
+
+  !! Numeric pass: sorted structure, then dense block products.
+  marker = 0
+  DO block_column = 1, matC%block_columns
+     start = matC%outer_index(block_column)
+     last = start
+     DO KK = matB%outer_index(block_column) + 1, &
+          & matB%outer_index(block_column + 1)
+        temp = matB%inner_index(KK)
+        DO II = matA%outer_index(temp) + 1, matA%outer_index(temp + 1)
+           IF (norm_a(II) * norm_b(KK) .LT. screen) CYCLE
+           block_row = matA%inner_index(II)
+           IF (marker(block_row) .NE. block_column) THEN
+              marker(block_row) = block_column
+              last = last + 1
+              matC%inner_index(last) = block_row
+           END IF
+        END DO
+     END DO
+     DO II = start + 2, last
+        temp = matC%inner_index(II)
+        JJ = II - 1
+        DO WHILE (JJ .GT. start)
+           IF (matC%inner_index(JJ) .LE. temp) EXIT
+           matC%inner_index(JJ + 1) = matC%inner_index(JJ)
+           JJ = JJ - 1
+        END DO
+        matC%inner_index(JJ + 1) = temp
+     END DO
+     DO II = start + 1, last
+        position(matC%inner_index(II)) = II
+     END DO
+
+     DO KK = matB%outer_index(block_column) + 1, &
+          & matB%outer_index(block_column + 1)
+        temp = matB%inner_index(KK)
+        DO II = matA%outer_index(temp) + 1, matA%outer_index(temp + 1)
+           IF (norm_a(II) * norm_b(KK) .LT. screen) CYCLE
+           LL = position(matA%inner_index(II))
+           DO NN = 1, bs
+              DO MM = 1, bs
+                 block_value = matB%values(MM, NN, KK)
+                 DO JJ = 1, bs
+                    matC%values(JJ, NN, LL) = matC%values(JJ, NN, LL) + &
+                         & matA%values(JJ, MM, II) * block_value
+                 END DO
+              END DO
+           END DO
+        END DO
+     END DO
+  END DO
+
+  IF (alpha .NE. 1.0_NTREAL) THEN
+     matC%values = alpha * matC%values
+  END IF
+
+  !! Drop the blocks whose entries are all below the threshold.
+  IF (threshold .GT. 0.0_NTREAL) THEN
+     ALLOCATE(kept_index(SIZE(matC%inner_index)))
+     last = 0
+     start = 0
+     DO block_column = 1, matC%block_columns
+        DO II = start + 1, matC%outer_index(block_column + 1)
+           IF (MAXVAL(ABS(matC%values(:, :, II))) .GT. threshold) THEN
+              last = last + 1
+              kept_index(last) = II
+           END IF
+        END DO
+        start = matC%outer_index(block_column + 1)
+        matC%outer_index(block_column + 1) = last
+     END DO
+     IF (last .LT. SIZE(matC%inner_index)) THEN
+        matC%inner_index = matC%inner_index(kept_index(:last))
+        matC%values = matC%values(:, :, kept_index(:last))
+     END IF
+     DEALLOCATE(kept_index)
+  END IF
+
+  DEALLOCATE(marker)
+  DEALLOCATE(position)
+  DEALLOCATE(norm_a)
+  DEALLOCATE(norm_b)
@@ -2,6 +2,10 @@
   INTEGER :: II, JJ
   INTEGER :: offset
 
+  IF (helper%compress_indices) THEN
+     CALL UnpackReduceIndices(helper, gathered_matrix%inner_index)
+  END IF
+
   !! Sum Up The Outer Indices
   DO II = 1, helper%comm_size - 1
      offset = II * matrix%columns + 1
@@ -13,3 +17,6 @@
   END DO
   DEALLOCATE(helper%values_per_process)
   DEALLOCATE(helper%displacement)
+  IF (ALLOCATED(helper%plan_request_list)) THEN
+     DEALLOCATE(helper%plan_request_list)
+  END IF
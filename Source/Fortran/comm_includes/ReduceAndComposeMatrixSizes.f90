@@ -2,6 +2,7 @@
   INTEGER :: ierr
 
   CALL MPI_Comm_size(comm, helper%comm_size, ierr)
+  IF (.NOT. PRESENT(plan_in)) helper%compress_indices = .FALSE.
 
   !! Build Storage
   CALL ConstructEmptyMatrix(gathered_matrix, &
@@ -9,6 +10,15 @@
   gathered_matrix%outer_index(1) = 0
 
   !! Gather Information About Other Processes
-  CALL MPI_IAllGather(matrix%outer_index(2:), matrix%columns,&
-       & MPINTINTEGER, gathered_matrix%outer_index(2:), &
-       & matrix%columns, MPINTINTEGER, comm, helper%outer_request, ierr)
+  IF (PRESENT(plan_in) .AND. helper%compress_indices) THEN
+     !! The length of the packed inner indices is sent with the sizes.
+     CALL PackIndices(matrix%inner_index, helper%send_packed)
+     CALL StartReducePlan(plan_in, comm, &
+          & [matrix%outer_index(2:), SIZE(helper%send_packed)], helper)
+  ELSE IF (PRESENT(plan_in)) THEN
+     CALL StartReducePlan(plan_in, comm, matrix%outer_index(2:), helper)
+  ELSE
+     CALL MPI_IAllGather(matrix%outer_index(2:), matrix%columns,&
+          & MPINTINTEGER, gathered_matrix%outer_index(2:), &
+          & matrix%columns, MPINTINTEGER, comm, helper%outer_request, ierr)
+  END IF
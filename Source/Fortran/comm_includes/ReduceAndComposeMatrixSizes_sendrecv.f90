@@ -4,24 +4,34 @@
   INTEGER :: ierr
 
   CALL MPI_Comm_size(comm, helper%comm_size, ierr)
+  IF (.NOT. PRESENT(plan_in)) helper%compress_indices = .FALSE.
 
   !! Build Storage
   CALL ConstructEmptyMatrix(gathered_matrix, &
        & matrix%rows, matrix%columns * helper%comm_size)
   gathered_matrix%outer_index(1) = 0
 
-  ALLOCATE(helper%outer_send_request_list(helper%comm_size))
-  ALLOCATE(helper%outer_recv_request_list(helper%comm_size))
+  IF (PRESENT(plan_in) .AND. helper%compress_indices) THEN
+     !! The length of the packed inner indices is sent with the sizes.
+     CALL PackIndices(matrix%inner_index, helper%send_packed)
+     CALL StartReducePlan(plan_in, comm, &
+          & [matrix%outer_index(2:), SIZE(helper%send_packed)], helper)
+  ELSE IF (PRESENT(plan_in)) THEN
+     CALL StartReducePlan(plan_in, comm, matrix%outer_index(2:), helper)
+  ELSE
+     ALLOCATE(helper%outer_send_request_list(helper%comm_size))
+     ALLOCATE(helper%outer_recv_request_list(helper%comm_size))
 
-  !! Send/Recv Outer Index
-  DO II = 1, helper%comm_size
      !! Send/Recv Outer Index
-     CALL MPI_ISend(matrix%outer_index(2:), matrix%columns, MPINTINTEGER, &
-          & II-1, 3, comm, helper%outer_send_request_list(II), ierr)
-     istart = (matrix%columns)*(II - 1) + 2
-     isize = matrix%columns
-     iend = istart + isize - 1
-     CALL MPI_Irecv(gathered_matrix%outer_index(istart:iend), isize, &
-          & MPINTINTEGER, II - 1, 3, comm, &
-          & helper%outer_recv_request_list(II), ierr)
-  END DO
+     DO II = 1, helper%comm_size
+        !! Send/Recv Outer Index
+        CALL MPI_ISend(matrix%outer_index(2:), matrix%columns, MPINTINTEGER, &
+             & II-1, 3, comm, helper%outer_send_request_list(II), ierr)
+        istart = (matrix%columns)*(II - 1) + 2
+        isize = matrix%columns
+        iend = istart + isize - 1
+        CALL MPI_Irecv(gathered_matrix%outer_index(istart:iend), isize, &
+             & MPINTINTEGER, II - 1, 3, comm, &
+             & helper%outer_recv_request_list(II), ierr)
+     END DO
+  END IF
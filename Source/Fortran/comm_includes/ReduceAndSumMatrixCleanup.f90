@@ -2,6 +2,10 @@
   INTEGER :: II
   INTEGER :: total_values
 
+  IF (helper%compress_indices) THEN
+     CALL UnpackReduceIndices(helper, gathered_matrix%inner_index)
+  END IF
+
   !! Build Matrix Objects
   CALL ConstructEmptyMatrix(acc_matrix, matrix%rows, matrix%columns)
   CALL ConstructEmptyMatrix(sum_matrix, matrix%rows, matrix%columns, &
@@ -36,3 +40,6 @@
   CALL DestructMatrix(acc_matrix)
   DEALLOCATE(helper%values_per_process)
   DEALLOCATE(helper%displacement)
+  IF (ALLOCATED(helper%plan_request_list)) THEN
+     DEALLOCATE(helper%plan_request_list)
+  END IF
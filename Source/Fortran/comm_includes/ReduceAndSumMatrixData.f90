@@ -3,6 +3,14 @@
   INTEGER :: sum_total_values
   INTEGER :: ierr
 
+  !! A plan leaves the gathered outer indices in its receive buffer.
+  IF (PRESENT(plan_in) .AND. helper%compress_indices) THEN
+     CALL UnpackReduceSizes(plan_in, gathered_matrix%outer_index, helper)
+  ELSE IF (PRESENT(plan_in)) THEN
+     gathered_matrix%outer_index(:SIZE(plan_in%recv_buffer)) = &
+          & plan_in%recv_buffer
+  END IF
+
   !! Compute values per process
   ALLOCATE(helper%values_per_process(helper%comm_size))
   DO II = 1, helper%comm_size
@@ -24,6 +32,14 @@
   ALLOCATE(gathered_matrix%inner_index(sum_total_values))
 
   !! MPI Calls
-  CALL MPI_IAllGatherv(matrix%inner_index, SIZE(matrix%values), MPINTINTEGER, &
-       & gathered_matrix%inner_index, helper%values_per_process, &
-       & helper%displacement, MPINTINTEGER, comm, helper%inner_request, ierr)
+  IF (helper%compress_indices) THEN
+     CALL MPI_IAllGatherv(helper%send_packed, SIZE(helper%send_packed), &
+          & MPINTINTEGER, helper%recv_packed, helper%packed_per_process, &
+          & helper%packed_displacement, MPINTINTEGER, comm, &
+          & helper%inner_request, ierr)
+  ELSE
+     CALL MPI_IAllGatherv(matrix%inner_index, SIZE(matrix%values), &
+          & MPINTINTEGER, gathered_matrix%inner_index, &
+          & helper%values_per_process, helper%displacement, MPINTINTEGER, &
+          & comm, helper%inner_request, ierr)
+  END IF
@@ -4,6 +4,14 @@
   INTEGER :: istart, isize, iend
   INTEGER :: ierr
 
+  !! A plan leaves the gathered outer indices in its receive buffer.
+  IF (PRESENT(plan_in) .AND. helper%compress_indices) THEN
+     CALL UnpackReduceSizes(plan_in, gathered_matrix%outer_index, helper)
+  ELSE IF (PRESENT(plan_in)) THEN
+     gathered_matrix%outer_index(:SIZE(plan_in%recv_buffer)) = &
+          & plan_in%recv_buffer
+  END IF
+
   !! Send Receive Buffers
   ALLOCATE(helper%inner_send_request_list(helper%comm_size))
   ALLOCATE(helper%inner_recv_request_list(helper%comm_size))
@@ -33,13 +41,25 @@
   !! MPI Calls
   DO II = 1, helper%comm_size
      !! Send/Recv inner index
-     CALL MPI_ISend(matrix%inner_index, SIZE(matrix%inner_index), &
-          & MPINTINTEGER, II - 1, 2, comm, &
-          & helper%inner_send_request_list(II), ierr)
-     istart = helper%displacement(II) + 1
-     isize = helper%values_per_process(II)
-     iend = istart + isize - 1
-     CALL MPI_Irecv(gathered_matrix%inner_index(istart:iend), isize, &
-          & MPINTINTEGER, II - 1, 2, comm, &
-          & helper%inner_recv_request_list(II), ierr)
+     IF (helper%compress_indices) THEN
+        CALL MPI_ISend(helper%send_packed, SIZE(helper%send_packed), &
+             & MPINTINTEGER, II - 1, 2, comm, &
+             & helper%inner_send_request_list(II), ierr)
+        istart = helper%packed_displacement(II) + 1
+        isize = helper%packed_per_process(II)
+        iend = istart + isize - 1
+        CALL MPI_Irecv(helper%recv_packed(istart:iend), isize, &
+             & MPINTINTEGER, II - 1, 2, comm, &
+             & helper%inner_recv_request_list(II), ierr)
+     ELSE
+        CALL MPI_ISend(matrix%inner_index, SIZE(matrix%inner_index), &
+             & MPINTINTEGER, II - 1, 2, comm, &
+             & helper%inner_send_request_list(II), ierr)
+        istart = helper%displacement(II) + 1
+        isize = helper%values_per_process(II)
+        iend = istart + isize - 1
+        CALL MPI_Irecv(gathered_matrix%inner_index(istart:iend), isize, &
+             & MPINTINTEGER, II - 1, 2, comm, &
+             & helper%inner_recv_request_list(II), ierr)
+     END IF
   END DO
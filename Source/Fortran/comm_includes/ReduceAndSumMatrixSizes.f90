@@ -3,6 +3,7 @@
   INTEGER :: ierr
 
   CALL MPI_Comm_size(comm, helper%comm_size, ierr)
+  IF (.NOT. PRESENT(plan_in)) helper%compress_indices = .FALSE.
 
   !! Build Storage
   CALL DestructMatrix(gathered_matrix)
@@ -10,6 +11,15 @@
   ALLOCATE(gathered_matrix%outer_index(sum_outer_indices + 1))
 
   !! Gather Outer Indices
-  CALL MPI_IAllGather(matrix%outer_index, matrix%columns+1, &
-       & MPINTINTEGER, gathered_matrix%outer_index, matrix%columns + 1, &
-       & MPINTINTEGER, comm, helper%outer_request, ierr)
+  IF (PRESENT(plan_in) .AND. helper%compress_indices) THEN
+     !! The length of the packed inner indices is sent with the sizes.
+     CALL PackIndices(matrix%inner_index, helper%send_packed)
+     CALL StartReducePlan(plan_in, comm, &
+          & [matrix%outer_index, SIZE(helper%send_packed)], helper)
+  ELSE IF (PRESENT(plan_in)) THEN
+     CALL StartReducePlan(plan_in, comm, matrix%outer_index, helper)
+  ELSE
+     CALL MPI_IAllGather(matrix%outer_index, matrix%columns+1, &
+          & MPINTINTEGER, gathered_matrix%outer_index, matrix%columns + 1, &
+          & MPINTINTEGER, comm, helper%outer_request, ierr)
+  END IF
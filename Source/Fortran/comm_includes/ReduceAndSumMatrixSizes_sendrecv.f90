@@ -5,24 +5,34 @@
   INTEGER :: ierr
 
   CALL MPI_Comm_size(comm, helper%comm_size, ierr)
+  IF (.NOT. PRESENT(plan_in)) helper%compress_indices = .FALSE.
 
   !! Build Storage
   CALL DestructMatrix(gathered_matrix)
   sum_outer_indices = (matrix%columns + 1) * helper%comm_size
   ALLOCATE(gathered_matrix%outer_index(sum_outer_indices + 1))
 
-  ALLOCATE(helper%outer_send_request_list(helper%comm_size))
-  ALLOCATE(helper%outer_recv_request_list(helper%comm_size))
+  IF (PRESENT(plan_in) .AND. helper%compress_indices) THEN
+     !! The length of the packed inner indices is sent with the sizes.
+     CALL PackIndices(matrix%inner_index, helper%send_packed)
+     CALL StartReducePlan(plan_in, comm, &
+          & [matrix%outer_index, SIZE(helper%send_packed)], helper)
+  ELSE IF (PRESENT(plan_in)) THEN
+     CALL StartReducePlan(plan_in, comm, matrix%outer_index, helper)
+  ELSE
+     ALLOCATE(helper%outer_send_request_list(helper%comm_size))
+     ALLOCATE(helper%outer_recv_request_list(helper%comm_size))
 
-  !! Send/Recv Outer Index
-  DO II = 1, helper%comm_size
-     CALL MPI_ISend(matrix%outer_index, SIZE(matrix%outer_index), &
-          & MPINTINTEGER, II - 1, 3, comm, &
-          & helper%outer_send_request_list(II), ierr)
-     istart = (matrix%columns + 1) * (II - 1) + 1
-     isize = matrix%columns + 1
-     iend = istart + isize - 1
-     CALL MPI_Irecv(gathered_matrix%outer_index(istart:iend), isize, &
-          & MPINTINTEGER, II - 1, 3, comm, &
-          & helper%outer_recv_request_list(II), ierr)
-  END DO
+     !! Send/Recv Outer Index
+     DO II = 1, helper%comm_size
+        CALL MPI_ISend(matrix%outer_index, SIZE(matrix%outer_index), &
+             & MPINTINTEGER, II - 1, 3, comm, &
+             & helper%outer_send_request_list(II), ierr)
+        istart = (matrix%columns + 1) * (II - 1) + 1
+        isize = matrix%columns + 1
+        iend = istart + isize - 1
+        CALL MPI_Irecv(gathered_matrix%outer_index(istart:iend), isize, &
+             & MPINTINTEGER, II - 1, 3, comm, &
+             & helper%outer_recv_request_list(II), ierr)
+     END DO
+  END IF
@@ -1,14 +1,24 @@
   isvalid = .TRUE.
-  !! Check allocation
-  IF (.NOT. ALLOCATED(this%pruned_list)) isvalid = .FALSE.
-  IF (.NOT. ALLOCATED(this%value_array)) isvalid = .FALSE.
+  !! Check the kind of accumulator
+  IF (PRESENT(use_hash_in)) THEN
+     IF (use_hash_in .NEQV. this%use_hash) isvalid = .FALSE.
+  END IF
 
-  IF (isvalid) THEN
-     !! Check allocation size
-     IF (.NOT. SIZE(this%value_array, dim = 2) .EQ. rows) THEN
-        isvalid = .FALSE.
-     END IF
-     IF (.NOT. SIZE(this%value_array, dim = 1) .EQ. columns) THEN
-        isvalid = .FALSE.
+  IF (this%use_hash) THEN
+     !! The hash tables grow as needed, so only check they exist.
+     IF (.NOT. ALLOCATED(this%table_keys)) isvalid = .FALSE.
+  ELSE
+     !! Check allocation
+     IF (.NOT. ALLOCATED(this%pruned_list)) isvalid = .FALSE.
+     IF (.NOT. ALLOCATED(this%value_array)) isvalid = .FALSE.
+
+     IF (isvalid) THEN
+        !! Check allocation size
+        IF (.NOT. SIZE(this%value_array, dim = 2) .EQ. rows) THEN
+           isvalid = .FALSE.
+        END IF
+        IF (.NOT. SIZE(this%value_array, dim = 1) .EQ. columns) THEN
+           isvalid = .FALSE.
+        END IF
      END IF
   END IF
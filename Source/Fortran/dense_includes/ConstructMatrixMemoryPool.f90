@@ -6,6 +6,22 @@
 
   this%columns = columns
   this%rows = rows
+  IF (PRESENT(use_hash_in)) THEN
+     this%use_hash = use_hash_in
+  ELSE
+     this%use_hash = .FALSE.
+  END IF
+  IF (PRESENT(reuse_pattern_in)) THEN
+     this%reuse_pattern = reuse_pattern_in
+  ELSE
+     this%reuse_pattern = .FALSE.
+  END IF
+  IF (this%reuse_pattern) this%use_hash = .TRUE.
+  IF (PRESENT(block_size_in)) THEN
+     this%block_size = block_size_in
+  ELSE
+     this%block_size = 1
+  END IF
 
   IF (.NOT. PRESENT(sparsity_in)) THEN
      this%hash_size = 1
@@ -17,14 +33,22 @@
   num_buckets = columns/this%hash_size + 1
 
   !! Allocate
-  ALLOCATE(this%pruned_list(columns * rows), stat = alloc_stat)
-  ALLOCATE(this%value_array(columns, rows), stat = alloc_stat)
-  ALLOCATE(this%dirty_array(columns, rows), stat = alloc_stat)
+  IF (this%use_hash) THEN
+     !! The tables start small and grow with the product.
+     ALLOCATE(this%table_keys(1))
+     ALLOCATE(this%table_index(1))
+     ALLOCATE(this%table_slots(1))
+     this%table_keys = 0
+  ELSE
+     ALLOCATE(this%pruned_list(columns * rows), stat = alloc_stat)
+     ALLOCATE(this%value_array(columns, rows), stat = alloc_stat)
+     ALLOCATE(this%dirty_array(columns, rows), stat = alloc_stat)
 
-  ALLOCATE(this%hash_index(columns, rows))
-  ALLOCATE(this%inserted_per_bucket(columns, rows))
+     ALLOCATE(this%hash_index(columns, rows))
+     ALLOCATE(this%inserted_per_bucket(columns, rows))
 
-  this%value_array = 0
-  this%hash_index = 0
-  this%inserted_per_bucket = 0
-  this%dirty_array = .FALSE.
+     this%value_array = 0
+     this%hash_index = 0
+     this%inserted_per_bucket = 0
+     this%dirty_array = .FALSE.
+  END IF
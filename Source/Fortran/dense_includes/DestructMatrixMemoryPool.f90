@@ -4,3 +4,13 @@
   IF (ALLOCATED(this%dirty_array)) DEALLOCATE(this%dirty_array)
   IF (ALLOCATED(this%hash_index)) DEALLOCATE(this%hash_index)
   IF (ALLOCATED(this%inserted_per_bucket)) DEALLOCATE(this%inserted_per_bucket)
+  IF (ALLOCATED(this%table_keys)) DEALLOCATE(this%table_keys)
+  IF (ALLOCATED(this%table_index)) DEALLOCATE(this%table_index)
+  IF (ALLOCATED(this%table_slots)) DEALLOCATE(this%table_slots)
+  IF (ALLOCATED(this%pattern_a_outer)) DEALLOCATE(this%pattern_a_outer)
+  IF (ALLOCATED(this%pattern_a_inner)) DEALLOCATE(this%pattern_a_inner)
+  IF (ALLOCATED(this%pattern_b_outer)) DEALLOCATE(this%pattern_b_outer)
+  IF (ALLOCATED(this%pattern_b_inner)) DEALLOCATE(this%pattern_b_inner)
+  IF (ALLOCATED(this%pattern_c_outer)) DEALLOCATE(this%pattern_c_outer)
+  IF (ALLOCATED(this%pattern_c_inner)) DEALLOCATE(this%pattern_c_inner)
+  IF (ALLOCATED(this%pattern_map)) DEALLOCATE(this%pattern_map)
@@ -0,0 +1,38 @@
+  bytes = 0
+#ifdef ISCOMPLEX
+  IF (ALLOCATED(this%pruned_list)) bytes = bytes + &
+       & SIZE(this%pruned_list, KIND = NTLONG) * BYTES_PER_TRIPLET_C
+  IF (ALLOCATED(this%value_array)) bytes = bytes + &
+       & SIZE(this%value_array, KIND = NTLONG) * BYTES_PER_COMPLEX
+#else
+  IF (ALLOCATED(this%pruned_list)) bytes = bytes + &
+       & SIZE(this%pruned_list, KIND = NTLONG) * BYTES_PER_TRIPLET_R
+  IF (ALLOCATED(this%value_array)) bytes = bytes + &
+       & SIZE(this%value_array, KIND = NTLONG) * BYTES_PER_REAL
+#endif
+  IF (ALLOCATED(this%dirty_array)) bytes = bytes + &
+       & SIZE(this%dirty_array, KIND = NTLONG) * BYTES_PER_LOGICAL
+  IF (ALLOCATED(this%hash_index)) bytes = bytes + &
+       & SIZE(this%hash_index, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%inserted_per_bucket)) bytes = bytes + &
+       & SIZE(this%inserted_per_bucket, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%table_keys)) bytes = bytes + &
+       & SIZE(this%table_keys, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%table_index)) bytes = bytes + &
+       & SIZE(this%table_index, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%table_slots)) bytes = bytes + &
+       & SIZE(this%table_slots, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%pattern_a_outer)) bytes = bytes + &
+       & SIZE(this%pattern_a_outer, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%pattern_a_inner)) bytes = bytes + &
+       & SIZE(this%pattern_a_inner, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%pattern_b_outer)) bytes = bytes + &
+       & SIZE(this%pattern_b_outer, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%pattern_b_inner)) bytes = bytes + &
+       & SIZE(this%pattern_b_inner, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%pattern_c_outer)) bytes = bytes + &
+       & SIZE(this%pattern_c_outer, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%pattern_c_inner)) bytes = bytes + &
+       & SIZE(this%pattern_c_inner, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%pattern_map)) bytes = bytes + &
+       & SIZE(this%pattern_map, KIND = NTLONG) * BYTES_PER_INTEGER
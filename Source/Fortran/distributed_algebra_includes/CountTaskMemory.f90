@@ -0,0 +1,50 @@
+  !! Local Data
+  INTEGER :: II, JJ, PP
+  INTEGER(NTLONG) :: bytes
+
+  DO II = 1, SIZE(ATasks)
+     IF (ATasks(II) .NE. TaskRunningA) THEN
+        bytes = SUM(GetMatrixMemory(AdjacentABlocks(II, :))) + &
+             & GetMatrixMemory(LocalRowContribution(II)) + &
+             & GetMatrixMemory(GatheredRowContribution(II)) + &
+             & GetMatrixMemory(GatheredRowContributionT(II)) + &
+             & GetReduceHelperMemory(row_helper(II))
+        IF (bytes .NE. ATasks_bytes(II)) THEN
+           CALL UpdateMemoryUsage(bytes - ATasks_bytes(II), memory_counted)
+           ATasks_bytes(II) = bytes
+        END IF
+     END IF
+  END DO
+
+  DO PP = 1, SIZE(BTasks, 2)
+     DO JJ = 1, SIZE(BTasks, 1)
+        IF (BTasks(JJ, PP) .NE. TaskRunningB) THEN
+           bytes = SUM(GetMatrixMemory(TransposedBBlocks(:, JJ, PP))) + &
+                & GetMatrixMemory(LocalColumnContribution(JJ, PP)) + &
+                & GetMatrixMemory(GatheredColumnContribution(JJ, PP)) + &
+                & GetReduceHelperMemory(column_helper(JJ, PP))
+           IF (bytes .NE. BTasks_bytes(JJ, PP)) THEN
+              CALL UpdateMemoryUsage(bytes - BTasks_bytes(JJ, PP), &
+                   & memory_counted)
+              BTasks_bytes(JJ, PP) = bytes
+           END IF
+        END IF
+     END DO
+  END DO
+
+  DO PP = 1, SIZE(ABTasks, 3)
+     DO JJ = 1, SIZE(ABTasks, 2)
+        DO II = 1, SIZE(ABTasks, 1)
+           IF (ABTasks(II, JJ, PP) .NE. TaskRunningAB) THEN
+              bytes = GetMatrixMemory(SliceContribution(II, JJ, PP)) + &
+                   & GetMatrixMemory(matAB(PP)%LMAT(II, JJ)) + &
+                   & GetReduceHelperMemory(slice_helper(II, JJ, PP))
+              IF (bytes .NE. ABTasks_bytes(II, JJ, PP)) THEN
+                 CALL UpdateMemoryUsage(bytes - ABTasks_bytes(II, JJ, PP), &
+                      & memory_counted)
+                 ABTasks_bytes(II, JJ, PP) = bytes
+              END IF
+           END IF
+        END DO
+     END DO
+  END DO
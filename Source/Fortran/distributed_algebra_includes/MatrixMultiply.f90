@@ -1,9 +1,10 @@
   !! Communication Helpers
   TYPE(ReduceHelper_t), DIMENSION(:), ALLOCATABLE :: row_helper
-  TYPE(ReduceHelper_t), DIMENSION(:), ALLOCATABLE :: column_helper
-  TYPE(ReduceHelper_t), DIMENSION(:, :), ALLOCATABLE :: slice_helper
+  TYPE(ReduceHelper_t), DIMENSION(:, :), ALLOCATABLE :: column_helper
+  TYPE(ReduceHelper_t), DIMENSION(:, :, :), ALLOCATABLE :: slice_helper
   !! For Iterating Over Local Blocks
   INTEGER :: II, II2, II2_range
+  INTEGER :: PP, num_products
   INTEGER :: JJ, JJ2, JJ2_range
   INTEGER :: duplicate_start_column, duplicate_offset_column
   INTEGER :: duplicate_start_row, duplicate_offset_row
@@ -12,13 +13,29 @@
   INTEGER, DIMENSION(:), ALLOCATABLE :: ATasks
   INTEGER :: ATasks_completed
   !! Scheduling the B work
-  INTEGER, DIMENSION(:), ALLOCATABLE :: BTasks
+  INTEGER, DIMENSION(:,:), ALLOCATABLE :: BTasks
   INTEGER :: BTasks_completed
   !! Scheduling the AB work
-  INTEGER, DIMENSION(:,:), ALLOCATABLE :: ABTasks
+  INTEGER, DIMENSION(:,:,:), ALLOCATABLE :: ABTasks
   INTEGER :: ABTasks_completed
-  !! Temporary AB matrix for scaling.
-  TYPE(Matrix_ps) :: matAB
+  !! For the progress engine
+  INTEGER, DIMENSION(:), ALLOCATABLE :: ATasks_last
+  INTEGER, DIMENSION(:,:), ALLOCATABLE :: BTasks_last
+  INTEGER, DIMENSION(:,:,:), ALLOCATABLE :: ABTasks_last
+  LOGICAL, DIMENSION(:), ALLOCATABLE :: AWaiting
+  LOGICAL, DIMENSION(:,:), ALLOCATABLE :: BWaiting
+  LOGICAL, DIMENSION(:,:,:), ALLOCATABLE :: ABWaiting
+  INTEGER, DIMENSION(:), ALLOCATABLE :: request_list
+  INTEGER :: list_size, list_position
+  LOGICAL :: tasks_running
+  !! Temporary AB matrices for scaling, one for each product of the chain.
+  TYPE(Matrix_ps), DIMENSION(:), ALLOCATABLE :: matAB
+  !! Bytes this multiply counted as in use, for the pools and for the
+  !! buffers of each task.
+  INTEGER(NTLONG) :: memory_counted, pool_bytes
+  INTEGER(NTLONG), DIMENSION(:), ALLOCATABLE :: ATasks_bytes
+  INTEGER(NTLONG), DIMENSION(:,:), ALLOCATABLE :: BTasks_bytes
+  INTEGER(NTLONG), DIMENSION(:,:,:), ALLOCATABLE :: ABTasks_bytes
 
   !! The threshold needs to be smaller if we are doing a sliced version
   !! because you might flush a value that would be kept in the summed version.
@@ -28,60 +45,142 @@
      working_threshold = threshold
   END IF
 
-  !! Construct The Temporary Matrices
-  CALL ConstructEmptyMatrix(matAB, matA)
-
-  ALLOCATE(AdjacentABlocks(matAB%process_grid%number_of_blocks_rows, &
-       & matAB%process_grid%number_of_blocks_columns / &
-       & matAB%process_grid%num_process_slices))
-  ALLOCATE(LocalRowContribution(matAB%process_grid%number_of_blocks_rows))
-  ALLOCATE(GatheredRowContribution(matAB%process_grid%number_of_blocks_rows))
-  ALLOCATE(GatheredRowContributionT(matAB%process_grid%number_of_blocks_rows))
-
-  ALLOCATE(TransposedBBlocks(matAB%process_grid%number_of_blocks_rows / &
-       & matAB%process_grid%num_process_slices, &
-       & matAB%process_grid%number_of_blocks_columns))
-  ALLOCATE(LocalColumnContribution(&
-       & matAB%process_grid%number_of_blocks_columns))
-  ALLOCATE(GatheredColumnContribution(&
-       & matAB%process_grid%number_of_blocks_columns))
-  ALLOCATE(SliceContribution(matAB%process_grid%number_of_blocks_rows, &
-       & matAB%process_grid%number_of_blocks_columns))
-
-  !! Helpers
-  ALLOCATE(row_helper(matAB%process_grid%number_of_blocks_rows))
-  ALLOCATE(column_helper(matAB%process_grid%number_of_blocks_columns))
-  ALLOCATE(slice_helper(matAB%process_grid%number_of_blocks_rows, &
-       & matAB%process_grid%number_of_blocks_columns))
+  !! With a second output, the product of A with the first result is
+  !! computed in the same pass, reusing the gathered rows of A.
+  IF (PRESENT(matC2)) THEN
+     num_products = 2
+  ELSE
+     num_products = 1
+  END IF
 
   !! Construct the task queues
-  ALLOCATE(ATasks(matAB%process_grid%number_of_blocks_rows))
-  DO II = 1, matAB%process_grid%number_of_blocks_rows
+  ALLOCATE(ATasks(matA%process_grid%number_of_blocks_rows))
+  DO II = 1, matA%process_grid%number_of_blocks_rows
      ATasks(II) = LocalGatherA
   END DO
-  ALLOCATE(BTasks(matAB%process_grid%number_of_blocks_columns))
-  DO JJ = 1, matAB%process_grid%number_of_blocks_columns
-     BTasks(JJ) = LocalGatherB
-  END DO
-  ALLOCATE(ABTasks(matAB%process_grid%number_of_blocks_rows, &
-       & matAB%process_grid%number_of_blocks_columns))
-  DO JJ = 1, matAB%process_grid%number_of_blocks_columns
-     DO II = 1, matAB%process_grid%number_of_blocks_rows
-        ABTasks(II,JJ) = AwaitingAB
+  ALLOCATE(BTasks(matA%process_grid%number_of_blocks_columns, num_products))
+  DO PP = 1, num_products
+     DO JJ = 1, matA%process_grid%number_of_blocks_columns
+        IF (PP .EQ. 1) THEN
+           BTasks(JJ, PP) = LocalGatherB
+        ELSE
+           BTasks(JJ, PP) = AwaitingB
+        END IF
      END DO
   END DO
+  ALLOCATE(ABTasks(matA%process_grid%number_of_blocks_rows, &
+       & matA%process_grid%number_of_blocks_columns, num_products))
+  ABTasks(:, :, :) = AwaitingAB
+
+  !! Operands kept in the memory pool from other matrices are dropped. A
+  !! chain does not use kept operands, and a started gather still holds the
+  !! communication plans, so they are all completed and freed.
+  IF (num_products .EQ. 1) THEN
+     CALL DropStaleOperands(memory_pool, matA, matB, low_precision, .FALSE.)
+  ELSE IF (memory_pool%row_state .NE. OperandLocal .OR. &
+       & memory_pool%column_state .NE. OperandLocal) THEN
+     CALL DestructGatheredOperands(memory_pool)
+  END IF
+
+  !! Operands gathered ahead of time, or kept from an earlier multiply, are
+  !! taken from the memory pool. This is only done for single products.
+  IF (num_products .EQ. 1) THEN
+     SELECT CASE (memory_pool%row_state)
+     CASE (OperandGathering)
+        CALL MOVE_ALLOC(MPLOCALROWS, LocalRowContribution)
+        CALL MOVE_ALLOC(MPROWS, GatheredRowContribution)
+        CALL MOVE_ALLOC(memory_pool%row_helper, row_helper)
+        ATasks(:) = WaitInnerA
+     CASE (OperandPinned)
+        CALL MOVE_ALLOC(MPROWS, GatheredRowContributionT)
+        ATasks(:) = FinishedA
+     END SELECT
+     SELECT CASE (memory_pool%column_state)
+     CASE (OperandGathering)
+        CALL MOVE_ALLOC(MPLOCALCOLUMNS, LocalColumnContribution)
+        CALL MOVE_ALLOC(MPCOLUMNS, GatheredColumnContribution)
+        CALL MOVE_ALLOC(memory_pool%column_helper, column_helper)
+        BTasks(:, :) = WaitInnerB
+     CASE (OperandPinned)
+        CALL MOVE_ALLOC(MPCOLUMNS, GatheredColumnContribution)
+        BTasks(:, :) = FinishedB
+     END SELECT
+  END IF
+
+  !! Construct The Temporary Matrices
+  ALLOCATE(matAB(num_products))
+  DO PP = 1, num_products
+     CALL ConstructEmptyMatrix(matAB(PP), matA)
+  END DO
+
+  ALLOCATE(AdjacentABlocks(matA%process_grid%number_of_blocks_rows, &
+       & matA%process_grid%number_of_blocks_columns / &
+       & matA%process_grid%num_process_slices))
+  IF (.NOT. ALLOCATED(LocalRowContribution)) &
+       & ALLOCATE(LocalRowContribution(matA%process_grid%number_of_blocks_rows))
+  IF (.NOT. ALLOCATED(GatheredRowContribution)) ALLOCATE(&
+       & GatheredRowContribution(matA%process_grid%number_of_blocks_rows))
+  IF (.NOT. ALLOCATED(GatheredRowContributionT)) ALLOCATE(&
+       & GatheredRowContributionT(matA%process_grid%number_of_blocks_rows))
+
+  ALLOCATE(TransposedBBlocks(matA%process_grid%number_of_blocks_rows / &
+       & matA%process_grid%num_process_slices, &
+       & matA%process_grid%number_of_blocks_columns, num_products))
+  IF (.NOT. ALLOCATED(LocalColumnContribution)) ALLOCATE(&
+       & LocalColumnContribution(matA%process_grid%number_of_blocks_columns, &
+       & num_products))
+  IF (.NOT. ALLOCATED(GatheredColumnContribution)) ALLOCATE(&
+       & GatheredColumnContribution(&
+       & matA%process_grid%number_of_blocks_columns, num_products))
+  ALLOCATE(SliceContribution(matA%process_grid%number_of_blocks_rows, &
+       & matA%process_grid%number_of_blocks_columns, num_products))
+
+  !! Helpers. Only the operands are gathered in low precision, the sum
+  !! between slices is always done in full precision.
+  IF (.NOT. ALLOCATED(row_helper)) THEN
+     ALLOCATE(row_helper(matA%process_grid%number_of_blocks_rows))
+     row_helper(:)%low_precision = low_precision
+     row_helper(:)%compress_indices = matA%process_grid%compress_indices
+  END IF
+  IF (.NOT. ALLOCATED(column_helper)) THEN
+     ALLOCATE(column_helper(matA%process_grid%number_of_blocks_columns, &
+          & num_products))
+     column_helper(:,:)%low_precision = low_precision
+     column_helper(:,:)%compress_indices = &
+          & matA%process_grid%compress_indices
+  END IF
+  ALLOCATE(slice_helper(matA%process_grid%number_of_blocks_rows, &
+       & matA%process_grid%number_of_blocks_columns, num_products))
+  slice_helper(:,:,:)%compress_indices = matA%process_grid%compress_indices
+  !! The sizes are gathered with plans cached in the memory pool.
+  CALL PrepareReducePlans(memory_pool, matA, num_products)
+
+  !! The memory pools are counted as in use while the multiply runs, and the
+  !! buffers of each task after every pass over the tasks.
+  memory_counted = 0
+  pool_bytes = GetMemoryPoolMemory(memory_pool)
+  IF (PRESENT(memory_pool2)) pool_bytes = pool_bytes + &
+       & GetMemoryPoolMemory(memory_pool2)
+  CALL UpdateMemoryUsage(pool_bytes, memory_counted)
+  ALLOCATE(ATasks_bytes(SIZE(ATasks)))
+  ALLOCATE(BTasks_bytes(SIZE(BTasks, 1), SIZE(BTasks, 2)))
+  ALLOCATE(ABTasks_bytes(SIZE(ABTasks, 1), SIZE(ABTasks, 2), &
+       & SIZE(ABTasks, 3)))
+  ATasks_bytes = 0
+  BTasks_bytes = 0
+  ABTasks_bytes = 0
 
   !! Setup A Tasks
-  duplicate_start_column = matAB%process_grid%my_slice + 1
-  duplicate_offset_column = matAB%process_grid%num_process_slices
+  duplicate_start_column = matA%process_grid%my_slice + 1
+  duplicate_offset_column = matA%process_grid%num_process_slices
 
   !! Setup B Tasks
-  duplicate_start_row = matAB%process_grid%my_slice + 1
-  duplicate_offset_row = matAB%process_grid%num_process_slices
+  duplicate_start_row = matA%process_grid%my_slice + 1
+  duplicate_offset_row = matA%process_grid%num_process_slices
 
   !! Run A Tasks
-  ATasks_completed = 0
-  BTasks_completed = 0
+  ATasks_completed = COUNT(ATasks .EQ. FinishedA)
+  BTasks_completed = COUNT(BTasks .EQ. FinishedB)
   ABTasks_completed = 0
 
   !$OMP PARALLEL
@@ -89,14 +188,17 @@
   DO WHILE (ATasks_completed .LT. SIZE(ATasks) .OR. &
        & BTasks_completed .LT. SIZE(BTasks) .OR. &
        & ABTasks_completed .LT. SIZE(ABTasks))
-     DO II = 1, matAB%process_grid%number_of_blocks_rows
+     ATasks_last = ATasks
+     BTasks_last = BTasks
+     ABTasks_last = ABTasks
+     DO II = 1, matA%process_grid%number_of_blocks_rows
         SELECT CASE (ATasks(II))
         CASE(LocalGatherA)
            ATasks(II) = TaskRunningA
            !$OMP TASK DEFAULT(SHARED), PRIVATE(JJ2, JJ2_range), FIRSTPRIVATE(II)
            !! First Align The Data We Are Working With
-           JJ2_range = matAB%process_grid%number_of_blocks_columns / &
-                & matAB%process_grid%num_process_slices
+           JJ2_range = matA%process_grid%number_of_blocks_columns / &
+                & matA%process_grid%num_process_slices
            DO JJ2 = 1, JJ2_range
               CALL CopyMatrix(matA%LMAT(II, &
                    & duplicate_start_column + &
@@ -114,14 +216,16 @@
         CASE(SendSizeA)
            !! Then Start A Global Gather
            CALL ReduceAndComposeMatrixSizes(LocalRowContribution(II), &
-                & matAB%process_grid%blocked_row_comm(II), &
-                & GatheredRowContribution(II), row_helper(II))
+                & matA%process_grid%blocked_row_comm(II), &
+                & GatheredRowContribution(II), row_helper(II), &
+                & memory_pool%row_plan(II))
            ATasks(II) = ComposeA
         CASE(ComposeA)
            IF (TestReduceSizeRequest(row_helper(II))) THEN
               CALL ReduceAndComposeMatrixData(LocalRowContribution(II), &
-                   & matAB%process_grid%blocked_row_comm(II), &
-                   & GatheredRowContribution(II), row_helper(II))
+                   & matA%process_grid%blocked_row_comm(II), &
+                   & GatheredRowContribution(II), row_helper(II), &
+                   & memory_pool%row_plan(II))
               ATasks(II) = WaitInnerA
            END IF
         CASE(WaitInnerA)
@@ -148,131 +252,244 @@
            ATasks_completed = ATasks_completed + 1
         END SELECT
      END DO
-     !! B Tasks
-     DO JJ = 1 , matAB%process_grid%number_of_blocks_columns
-        SELECT CASE (BTasks(JJ))
-        CASE(LocalGatherB)
-           BTasks(JJ) = TaskRunningB
-           !$OMP TASK DEFAULT(SHARED), PRIVATE(II2, II2_range), FIRSTPRIVATE(JJ)
-           !! First Transpose The Data We Are Working With
-           II2_range = matAB%process_grid%number_of_blocks_rows / &
-                & matAB%process_grid%num_process_slices
-           DO II2 = 1, II2_range
-              CALL TransposeMatrix(matB%LMAT(duplicate_start_row + &
-                   & duplicate_offset_row * (II2 - 1), JJ), &
-                   & TransposedBBlocks(II2, JJ))
-           END DO
-           !! Then Do A Local Gather and Cleanup
-           CALL ComposeMatrixColumns(TransposedBBlocks(:, JJ), &
-                & LocalColumnContribution(JJ))
-           DO II2 = 1, II2_range
-              CALL DestructMatrix(TransposedBBlocks(II2, JJ))
-           END DO
-           BTasks(JJ) = SendSizeB
-           !$OMP END TASK
-        CASE(SendSizeB)
-           !! Then A Global Gather
-           CALL ReduceAndComposeMatrixSizes(LocalColumnContribution(JJ), &
-                & matAB%process_grid%blocked_column_comm(JJ), &
-                & GatheredColumnContribution(JJ), column_helper(JJ))
-           BTasks(JJ) = LocalComposeB
-        CASE(LocalComposeB)
-           IF (TestReduceSizeRequest(column_helper(JJ))) THEN
-              CALL ReduceAndComposeMatrixData(LocalColumnContribution(JJ),&
-                   & matAB%process_grid%blocked_column_comm(JJ), &
-                   & GatheredColumnContribution(JJ), column_helper(JJ))
-              BTasks(JJ) = WaitInnerB
-           END IF
-        CASE(WaitInnerB)
-           IF (TestReduceInnerRequest(column_helper(JJ))) THEN
-              BTasks(JJ) = WaitDataB
-           END IF
-        CASE(WaitDataB)
-           IF (TestReduceDataRequest(column_helper(JJ))) THEN
-              BTasks(JJ) = AdjustIndicesB
-           END IF
-        CASE(AdjustIndicesB)
-           BTasks(JJ) = TaskRunningB
-           !$OMP TASK DEFAULT(SHARED), FIRSTPRIVATE(JJ)
-           CALL ReduceAndComposeMatrixCleanup(LocalColumnContribution(JJ), &
-                & GatheredColumnContribution(JJ), column_helper(JJ))
-           CALL DestructMatrix(LocalColumnContribution(JJ))
-           BTasks(JJ) = CleanupB
-           !$OMP END TASK
-        CASE(CleanupB)
-           BTasks(JJ) = FinishedB
-           BTasks_completed = BTasks_completed + 1
-        END SELECT
-     END DO
-     !! AB Tasks
-     DO II = 1 , matAB%process_grid%number_of_blocks_rows
-        DO JJ = 1, matAB%process_grid%number_of_blocks_columns
-           SELECT CASE(ABTasks(II, JJ))
-           CASE (AwaitingAB)
-              IF (ATasks(II) .EQ. FinishedA .AND. &
-                   & BTasks(JJ) .EQ. FinishedB) THEN
-                 ABTasks(II, JJ) = GemmAB
-              END IF
-           CASE (GemmAB)
-              ABTasks(II, JJ) = TaskRunningAB
-              !$OMP TASK DEFAULT(shared), FIRSTPRIVATE(II, JJ)
-              CALL MatrixMultiply(GatheredRowContributionT(II), &
-                   & GatheredColumnContribution(JJ), &
-                   & SliceContribution(II, JJ), &
-                   & IsATransposed_in = .TRUE., IsBTransposed_in = .TRUE., &
-                   & alpha_in = alpha, threshold_in = working_threshold, &
-                   & blocked_memory_pool_in = MPGRID(II, JJ))
-              !! We can exit early if there is only one process slice
-              IF (matAB%process_grid%num_process_slices .EQ. 1) THEN
-                 ABTasks(II,JJ) = CleanupAB
-                 CALL CopyMatrix(SliceContribution(II, JJ), matAB%LMAT(II, JJ))
-                 CALL DestructMatrix(SliceContribution(II, JJ))
-              ELSE
-                 ABTasks(II, JJ) = SendSizeAB
+     DO PP = 1, num_products
+        !! B Tasks
+        DO JJ = 1 , matA%process_grid%number_of_blocks_columns
+           SELECT CASE (BTasks(JJ, PP))
+           CASE(AwaitingB)
+              !! The column of the earlier product must be complete.
+              IF (ALL(ABTasks(:, JJ, PP - 1) .EQ. FinishedAB)) THEN
+                 BTasks(JJ, PP) = LocalGatherB
               END IF
+           CASE(LocalGatherB)
+              BTasks(JJ, PP) = TaskRunningB
+              !$OMP TASK DEFAULT(SHARED), PRIVATE(II2, II2_range), &
+              !$OMP& FIRSTPRIVATE(JJ, PP)
+              !! First Transpose The Data We Are Working With
+              II2_range = matA%process_grid%number_of_blocks_rows / &
+                   & matA%process_grid%num_process_slices
+              DO II2 = 1, II2_range
+                 IF (PP .EQ. 1) THEN
+                    CALL TransposeMatrix(matB%LMAT(duplicate_start_row + &
+                         & duplicate_offset_row * (II2 - 1), JJ), &
+                         & TransposedBBlocks(II2, JJ, PP))
+                 ELSE
+                    CALL TransposeMatrix(matAB(PP - 1)%LMAT(&
+                         & duplicate_start_row + &
+                         & duplicate_offset_row * (II2 - 1), JJ), &
+                         & TransposedBBlocks(II2, JJ, PP))
+                 END IF
+              END DO
+              !! Then Do A Local Gather and Cleanup
+              CALL ComposeMatrixColumns(TransposedBBlocks(:, JJ, PP), &
+                   & LocalColumnContribution(JJ, PP))
+              DO II2 = 1, II2_range
+                 CALL DestructMatrix(TransposedBBlocks(II2, JJ, PP))
+              END DO
+              BTasks(JJ, PP) = SendSizeB
               !$OMP END TASK
-           CASE(SendSizeAB)
-              CALL ReduceAndSumMatrixSizes(SliceContribution(II, JJ),&
-                   & matAB%process_grid%blocked_between_slice_comm(II, JJ), &
-                   & matAB%LMAT(II, JJ), slice_helper(II, JJ))
-              ABTasks(II, JJ) = GatherAndSumAB
-           CASE (GatherAndSumAB)
-              IF (TestReduceSizeRequest(slice_helper(II, JJ))) THEN
-                 CALL ReduceAndSumMatrixData(SliceContribution(II, JJ), &
-                      & matAB%process_grid%blocked_between_slice_comm(II, JJ), &
-                      & matAB%LMAT(II, JJ), slice_helper(II, JJ))
-                 ABTasks(II, JJ) = WaitInnerAB
+           CASE(SendSizeB)
+              !! Then A Global Gather
+              CALL ReduceAndComposeMatrixSizes(&
+                   & LocalColumnContribution(JJ, PP), &
+                   & matA%process_grid%blocked_column_comm(JJ), &
+                   & GatheredColumnContribution(JJ, PP), &
+                   & column_helper(JJ, PP), memory_pool%column_plan(JJ, PP))
+              BTasks(JJ, PP) = LocalComposeB
+           CASE(LocalComposeB)
+              IF (TestReduceSizeRequest(column_helper(JJ, PP))) THEN
+                 CALL ReduceAndComposeMatrixData(&
+                      & LocalColumnContribution(JJ, PP), &
+                      & matA%process_grid%blocked_column_comm(JJ), &
+                      & GatheredColumnContribution(JJ, PP), &
+                      & column_helper(JJ, PP), &
+                      & memory_pool%column_plan(JJ, PP))
+                 BTasks(JJ, PP) = WaitInnerB
               END IF
-           CASE (WaitInnerAB)
-              IF (TestReduceInnerRequest(slice_helper(II, JJ))) THEN
-                 ABTasks(II, JJ) = WaitDataAB
+           CASE(WaitInnerB)
+              IF (TestReduceInnerRequest(column_helper(JJ, PP))) THEN
+                 BTasks(JJ, PP) = WaitDataB
               END IF
-           CASE (WaitDataAB)
-              IF (TestReduceDataRequest(slice_helper(II, JJ))) THEN
-                 ABTasks(II, JJ) = LocalSumAB
+           CASE(WaitDataB)
+              IF (TestReduceDataRequest(column_helper(JJ, PP))) THEN
+                 BTasks(JJ, PP) = AdjustIndicesB
               END IF
-           CASE(LocalSumAB)
-              ABTasks(II, JJ) = TaskRunningAB
-              !$OMP TASK DEFAULT(SHARED), FIRSTPRIVATE(II, JJ)
-              CALL ReduceAndSumMatrixCleanup(SliceContribution(II, JJ), &
-                   & matAB%LMAT(II, JJ), threshold, slice_helper(II, JJ))
-              CALL DestructMatrix(SliceContribution(II, JJ))
-              ABTasks(II, JJ) = CleanupAB
+           CASE(AdjustIndicesB)
+              BTasks(JJ, PP) = TaskRunningB
+              !$OMP TASK DEFAULT(SHARED), FIRSTPRIVATE(JJ, PP)
+              CALL ReduceAndComposeMatrixCleanup(&
+                   & LocalColumnContribution(JJ, PP), &
+                   & GatheredColumnContribution(JJ, PP), &
+                   & column_helper(JJ, PP))
+              CALL DestructMatrix(LocalColumnContribution(JJ, PP))
+              BTasks(JJ, PP) = CleanupB
               !$OMP END TASK
-           CASE(CleanupAB)
-              ABTasks(II, JJ) = FinishedAB
-              ABTasks_completed = ABTasks_completed + 1
+           CASE(CleanupB)
+              BTasks(JJ, PP) = FinishedB
+              BTasks_completed = BTasks_completed + 1
            END SELECT
         END DO
+        !! AB Tasks
+        DO II = 1 , matA%process_grid%number_of_blocks_rows
+           DO JJ = 1, matA%process_grid%number_of_blocks_columns
+              SELECT CASE(ABTasks(II, JJ, PP))
+              CASE (AwaitingAB)
+                 IF (ATasks(II) .EQ. FinishedA .AND. &
+                      & BTasks(JJ, PP) .EQ. FinishedB) THEN
+                    ABTasks(II, JJ, PP) = GemmAB
+                 END IF
+              CASE (GemmAB)
+                 ABTasks(II, JJ, PP) = TaskRunningAB
+                 !$OMP TASK DEFAULT(shared), FIRSTPRIVATE(II, JJ, PP)
+                 IF (PP .GT. 1 .AND. PRESENT(memory_pool2)) THEN
+                    CALL MatrixMultiply(GatheredRowContributionT(II), &
+                         & GatheredColumnContribution(JJ, PP), &
+                         & SliceContribution(II, JJ, PP), &
+                         & IsATransposed_in = .TRUE., &
+                         & IsBTransposed_in = .TRUE., alpha_in = alpha, &
+                         & threshold_in = working_threshold, &
+                         & blocked_memory_pool_in = MPGRID2(II, JJ), &
+                         & screen_in = screen)
+                 ELSE
+                    CALL MatrixMultiply(GatheredRowContributionT(II), &
+                         & GatheredColumnContribution(JJ, PP), &
+                         & SliceContribution(II, JJ, PP), &
+                         & IsATransposed_in = .TRUE., &
+                         & IsBTransposed_in = .TRUE., alpha_in = alpha, &
+                         & threshold_in = working_threshold, &
+                         & blocked_memory_pool_in = MPGRID(II, JJ), &
+                         & screen_in = screen)
+                 END IF
+                 !! We can exit early if there is only one process slice
+                 IF (matA%process_grid%num_process_slices .EQ. 1) THEN
+                    CALL CopyMatrix(SliceContribution(II, JJ, PP), &
+                         & matAB(PP)%LMAT(II, JJ))
+                    CALL DestructMatrix(SliceContribution(II, JJ, PP))
+                    ABTasks(II, JJ, PP) = CleanupAB
+                 ELSE
+                    ABTasks(II, JJ, PP) = SendSizeAB
+                 END IF
+                 !$OMP END TASK
+              CASE(SendSizeAB)
+                 CALL ReduceAndSumMatrixSizes(SliceContribution(II, JJ, PP),&
+                      & matA%process_grid%blocked_between_slice_comm(II, JJ), &
+                      & matAB(PP)%LMAT(II, JJ), slice_helper(II, JJ, PP), &
+                      & memory_pool%slice_plan(II, JJ, PP))
+                 ABTasks(II, JJ, PP) = GatherAndSumAB
+              CASE (GatherAndSumAB)
+                 IF (TestReduceSizeRequest(slice_helper(II, JJ, PP))) THEN
+                    CALL ReduceAndSumMatrixData(&
+                         & SliceContribution(II, JJ, PP), &
+                         & matA%process_grid%blocked_between_slice_comm(II,JJ),&
+                         & matAB(PP)%LMAT(II, JJ), slice_helper(II, JJ, PP), &
+                         & memory_pool%slice_plan(II, JJ, PP))
+                    ABTasks(II, JJ, PP) = WaitInnerAB
+                 END IF
+              CASE (WaitInnerAB)
+                 IF (TestReduceInnerRequest(slice_helper(II, JJ, PP))) THEN
+                    ABTasks(II, JJ, PP) = WaitDataAB
+                 END IF
+              CASE (WaitDataAB)
+                 IF (TestReduceDataRequest(slice_helper(II, JJ, PP))) THEN
+                    ABTasks(II, JJ, PP) = LocalSumAB
+                 END IF
+              CASE(LocalSumAB)
+                 ABTasks(II, JJ, PP) = TaskRunningAB
+                 !$OMP TASK DEFAULT(SHARED), FIRSTPRIVATE(II, JJ, PP)
+                 CALL ReduceAndSumMatrixCleanup(SliceContribution(II, JJ, PP),&
+                      & matAB(PP)%LMAT(II, JJ), threshold, &
+                      & slice_helper(II, JJ, PP))
+                 CALL DestructMatrix(SliceContribution(II, JJ, PP))
+                 ABTasks(II, JJ, PP) = CleanupAB
+                 !$OMP END TASK
+              CASE(CleanupAB)
+                 ABTasks(II, JJ, PP) = FinishedAB
+                 ABTasks_completed = ABTasks_completed + 1
+              END SELECT
+           END DO
+        END DO
      END DO
+     CALL CountTaskMemory(ATasks, BTasks, ABTasks, AdjacentABlocks, &
+          & LocalRowContribution, GatheredRowContribution, &
+          & GatheredRowContributionT, row_helper, TransposedBBlocks, &
+          & LocalColumnContribution, GatheredColumnContribution, &
+          & column_helper, SliceContribution, matAB, slice_helper, &
+          & ATasks_bytes, BTasks_bytes, ABTasks_bytes, memory_counted)
      !! Prevent deadlock in the case where the number of tasks is capped.
      IF (matA%process_grid%omp_max_threads .EQ. 1) THEN
         !$OMP taskwait
      END IF
+
+     !! Progress engine. If nothing moved forward in this pass, progress all
+     !! of the requests in flight together instead of testing them again.
+     IF (ALL(ATasks .EQ. ATasks_last) .AND. ALL(BTasks .EQ. BTasks_last) &
+          & .AND. ALL(ABTasks .EQ. ABTasks_last)) THEN
+        AWaiting = ATasks .EQ. ComposeA .OR. ATasks .EQ. WaitInnerA .OR. &
+             & ATasks .EQ. WaitDataA
+        BWaiting = BTasks .EQ. LocalComposeB .OR. &
+             & BTasks .EQ. WaitInnerB .OR. BTasks .EQ. WaitDataB
+        ABWaiting = ABTasks .EQ. GatherAndSumAB .OR. &
+             & ABTasks .EQ. WaitInnerAB .OR. ABTasks .EQ. WaitDataAB
+        tasks_running = ANY(ATasks .EQ. TaskRunningA) .OR. &
+             & ANY(BTasks .EQ. TaskRunningB) .OR. &
+             & ANY(ABTasks .EQ. TaskRunningAB)
+        list_size = 0
+        DO II = 1, SIZE(AWaiting)
+           IF (AWaiting(II)) CALL GatherReduceRequests(row_helper(II), &
+                & request_list, list_size)
+        END DO
+        DO PP = 1, num_products
+           DO JJ = 1, SIZE(BWaiting, 1)
+              IF (BWaiting(JJ, PP)) CALL GatherReduceRequests(&
+                   & column_helper(JJ, PP), request_list, list_size)
+              DO II = 1, SIZE(ABWaiting, 1)
+                 IF (ABWaiting(II, JJ, PP)) CALL GatherReduceRequests(&
+                      & slice_helper(II, JJ, PP), request_list, list_size)
+              END DO
+           END DO
+        END DO
+        IF (list_size .GT. 0) THEN
+           !! With no compute running, only a completed request can make
+           !! progress, so the master thread sleeps in MPI until one does.
+           CALL WaitSomeReduceRequests(request_list, list_size, &
+                & .NOT. tasks_running)
+           list_position = 1
+           DO II = 1, SIZE(AWaiting)
+              IF (AWaiting(II)) CALL ScatterReduceRequests(row_helper(II), &
+                   & request_list, list_position)
+           END DO
+           DO PP = 1, num_products
+              DO JJ = 1, SIZE(BWaiting, 1)
+                 IF (BWaiting(JJ, PP)) CALL ScatterReduceRequests(&
+                      & column_helper(JJ, PP), request_list, list_position)
+                 DO II = 1, SIZE(ABWaiting, 1)
+                    IF (ABWaiting(II, JJ, PP)) CALL ScatterReduceRequests(&
+                         & slice_helper(II, JJ, PP), request_list, &
+                         & list_position)
+                 END DO
+              END DO
+           END DO
+           IF (tasks_running) THEN
+              !$OMP taskyield
+           END IF
+        ELSE IF (tasks_running) THEN
+           !! Only compute is left, so the master thread helps with it.
+           !$OMP taskwait
+        END IF
+     END IF
   END DO
   !$OMP END MASTER
   !$OMP END PARALLEL
 
+  !! The pools grew with the plans and the products of the blocks.
+  pool_bytes = GetMemoryPoolMemory(memory_pool) - pool_bytes
+  IF (PRESENT(memory_pool2)) pool_bytes = pool_bytes + &
+       & GetMemoryPoolMemory(memory_pool2)
+  CALL UpdateMemoryUsage(pool_bytes, memory_counted)
+  DEALLOCATE(ATasks_bytes)
+  DEALLOCATE(BTasks_bytes)
+  DEALLOCATE(ABTasks_bytes)
+
   !! Cleanup
   DEALLOCATE(row_helper)
   DEALLOCATE(column_helper)
@@ -280,11 +497,12 @@
   DEALLOCATE(ATasks)
   DEALLOCATE(BTasks)
   DEALLOCATE(ABTasks)
+  IF (ALLOCATED(request_list)) DEALLOCATE(request_list)
 
   !! Deallocate Buffers From A
-  DO II = 1, matAB%process_grid%number_of_blocks_rows
-     DO JJ2 = 1, matAB%process_grid%number_of_blocks_columns / &
-          & matAB%process_grid%num_process_slices
+  DO II = 1, matA%process_grid%number_of_blocks_rows
+     DO JJ2 = 1, matA%process_grid%number_of_blocks_columns / &
+          & matA%process_grid%num_process_slices
         CALL DestructMatrix(AdjacentABlocks(II, JJ2))
      END DO
      CALL DestructMatrix(LocalRowContribution(II))
@@ -294,37 +512,69 @@
   DEALLOCATE(LocalRowContribution)
   DEALLOCATE(GatheredRowContribution)
   !! Deallocate Buffers From B
-  DO JJ = 1, matAB%process_grid%number_of_blocks_columns
-     DO II2 = 1, matAB%process_grid%number_of_blocks_rows / &
-          & matAB%process_grid%num_process_slices
-        CALL DestructMatrix(TransposedBBlocks(II2, JJ))
+  DO PP = 1, num_products
+     DO JJ = 1, matA%process_grid%number_of_blocks_columns
+        DO II2 = 1, matA%process_grid%number_of_blocks_rows / &
+             & matA%process_grid%num_process_slices
+           CALL DestructMatrix(TransposedBBlocks(II2, JJ, PP))
+        END DO
+        CALL DestructMatrix(LocalColumnContribution(JJ, PP))
      END DO
-     CALL DestructMatrix(LocalColumnContribution(JJ))
   END DO
   DEALLOCATE(TransposedBBlocks)
   DEALLOCATE(LocalColumnContribution)
+  !! Pinned operands are kept in the memory pool for the next multiply.
+  IF (num_products .EQ. 1) THEN
+     memory_pool%row_state = OperandLocal
+     IF (memory_pool%pin_first) THEN
+        CALL MOVE_ALLOC(GatheredRowContributionT, MPROWS)
+        memory_pool%row_state = OperandPinned
+     END IF
+     memory_pool%column_state = OperandLocal
+     IF (memory_pool%pin_second) THEN
+        CALL MOVE_ALLOC(GatheredColumnContribution, MPCOLUMNS)
+        memory_pool%column_state = OperandPinned
+     END IF
+  END IF
+
   !! Deallocate Buffers From Multiplying The Block
-  DO II = 1, matAB%process_grid%number_of_blocks_rows
-     CALL DestructMatrix(GatheredRowContributionT(II))
-  END DO
-  DO JJ = 1, matAB%process_grid%number_of_blocks_columns
-     CALL DestructMatrix(GatheredColumnContribution(JJ))
-  END DO
-  DEALLOCATE(GatheredRowContributionT)
-  DEALLOCATE(GatheredColumnContribution)
+  IF (ALLOCATED(GatheredRowContributionT)) THEN
+     DO II = 1, matA%process_grid%number_of_blocks_rows
+        CALL DestructMatrix(GatheredRowContributionT(II))
+     END DO
+     DEALLOCATE(GatheredRowContributionT)
+  END IF
+  IF (ALLOCATED(GatheredColumnContribution)) THEN
+     DO PP = 1, num_products
+        DO JJ = 1, matA%process_grid%number_of_blocks_columns
+           CALL DestructMatrix(GatheredColumnContribution(JJ, PP))
+        END DO
+     END DO
+     DEALLOCATE(GatheredColumnContribution)
+  END IF
   !! Deallocate Buffers From Sum
-  DO JJ = 1, matAB%process_grid%number_of_blocks_columns
-     DO II = 1, matAB%process_grid%number_of_blocks_rows
-        CALL DestructMatrix(SliceContribution(II, JJ))
+  DO PP = 1, num_products
+     DO JJ = 1, matA%process_grid%number_of_blocks_columns
+        DO II = 1, matA%process_grid%number_of_blocks_rows
+           CALL DestructMatrix(SliceContribution(II, JJ, PP))
+        END DO
      END DO
   END DO
   DEALLOCATE(SliceContribution)
 
-  !! Copy to output matrix.
+  !! Move to output matrix. The operands are not read after this point, so
+  !! the output may be one of them.
   IF (ABS(beta) .LT. TINY(beta)) THEN
-     CALL CopyMatrix(matAB, matC)
+     CALL MoveMatrix(matAB(1), matC)
   ELSE
      CALL ScaleMatrix(MatC, beta)
-     CALL IncrementMatrix(MatAB, MatC)
+     CALL IncrementMatrix(MatAB(1), MatC)
   END IF
-  CALL DestructMatrix(matAB)
+  IF (PRESENT(matC2)) CALL MoveMatrix(matAB(2), matC2)
+  DO PP = 1, num_products
+     CALL DestructMatrix(matAB(PP))
+  END DO
+  DEALLOCATE(matAB)
+
+  !! The result now belongs to the caller, and the pool is no longer in use.
+  CALL UpdateMemoryUsage(-memory_counted, memory_counted)
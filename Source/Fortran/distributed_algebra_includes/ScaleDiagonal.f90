@@ -22,3 +22,4 @@
   CALL SplitMatrixToLocalBlocks(this, lmat)
   CALL DestructMatrix(lmat)
   CALL DestructTripletList(filtered)
+  this%is_hermitian = .FALSE.
@@ -0,0 +1,48 @@
+  !! Without a permutation, the padding beyond the actual dimension is left
+  !! alone. With one, a diagonal element belongs to the identity if it comes
+  !! from within the actual dimension.
+  is_permuted = .FALSE.
+  IF (PRESENT(permutation_in)) THEN
+     is_permuted = ALLOCATED(permutation_in%index_lookup)
+  END IF
+  IF (is_permuted) THEN
+     diagonal_limit = this%logical_matrix_dimension
+  ELSE
+     diagonal_limit = this%actual_matrix_dimension
+  END IF
+
+  !! Walk over the local blocks, keeping track of where each one starts.
+  row_offset = this%start_row
+  DO II = 1, this%process_grid%number_of_blocks_rows
+     column_offset = this%start_column
+     DO JJ = 1, this%process_grid%number_of_blocks_columns
+        !! The part of the diagonal that passes through this block
+        first = MAX(row_offset, column_offset)
+        last = MIN(row_offset + this%LMAT(II, JJ)%rows, &
+             & column_offset + this%LMAT(II, JJ)%columns, &
+             & diagonal_limit + 1) - 1
+        IF (last .GE. first) THEN
+           CALL ConstructTripletList(tlist, last - first + 1)
+           NN = 0
+           DO KK = first, last
+              IF (is_permuted) THEN
+                 IF (permutation_in%index_lookup(KK) .GT. &
+                      & this%actual_matrix_dimension) CYCLE
+              END IF
+              NN = NN + 1
+              tlist%DATA(NN)%index_row = KK - row_offset + 1
+              tlist%DATA(NN)%index_column = KK - column_offset + 1
+              tlist%DATA(NN)%point_value = shift
+           END DO
+           tlist%CurrentSize = NN
+           CALL ConstructMatrixFromTripletList(diagonal, tlist, &
+                & this%LMAT(II, JJ)%rows, this%LMAT(II, JJ)%columns)
+           CALL IncrementMatrix(diagonal, this%LMAT(II, JJ))
+        END IF
+        column_offset = column_offset + this%LMAT(1, JJ)%columns
+     END DO
+     row_offset = row_offset + this%LMAT(II, 1)%rows
+  END DO
+
+  CALL DestructMatrix(diagonal)
+  CALL DestructTripletList(tlist)
@@ -0,0 +1,90 @@
+  !! Local Data
+  INTEGER :: II, II2, II2_range
+  INTEGER :: JJ, JJ2, JJ2_range
+  INTEGER :: duplicate_start, duplicate_offset
+
+  CALL PrepareReducePlans(memory_pool, matA, 1)
+  CALL DropStaleOperands(memory_pool, matA, matB, low_precision, .TRUE.)
+  duplicate_start = matA%process_grid%my_slice + 1
+  duplicate_offset = matA%process_grid%num_process_slices
+  II2_range = matA%process_grid%number_of_blocks_rows / duplicate_offset
+  JJ2_range = matA%process_grid%number_of_blocks_columns / duplicate_offset
+
+  !! Local gather of the rows of A, and send the sizes. Rows that are
+  !! pinned in the memory pool are already gathered.
+  IF (memory_pool%row_state .EQ. OperandLocal) THEN
+     ALLOCATE(MPLOCALROWS(matA%process_grid%number_of_blocks_rows))
+     ALLOCATE(MPROWS(matA%process_grid%number_of_blocks_rows))
+     ALLOCATE(memory_pool%row_helper(matA%process_grid%number_of_blocks_rows))
+     memory_pool%row_helper(:)%low_precision = low_precision
+     memory_pool%row_helper(:)%compress_indices = &
+          & matA%process_grid%compress_indices
+     ALLOCATE(AdjacentABlocks(JJ2_range))
+     DO II = 1, matA%process_grid%number_of_blocks_rows
+        DO JJ2 = 1, JJ2_range
+           CALL CopyMatrix(matA%LMAT(II, &
+                & duplicate_start + duplicate_offset * (JJ2 - 1)), &
+                & AdjacentABlocks(JJ2))
+        END DO
+        CALL ComposeMatrixColumns(AdjacentABlocks, MPLOCALROWS(II))
+        CALL ReduceAndComposeMatrixSizes(MPLOCALROWS(II), &
+             & matA%process_grid%blocked_row_comm(II), MPROWS(II), &
+             & memory_pool%row_helper(II), memory_pool%row_plan(II))
+     END DO
+     DO JJ2 = 1, JJ2_range
+        CALL DestructMatrix(AdjacentABlocks(JJ2))
+     END DO
+     DEALLOCATE(AdjacentABlocks)
+  END IF
+
+  !! Local gather of the columns of B, and send the sizes.
+  IF (memory_pool%column_state .EQ. OperandLocal) THEN
+     ALLOCATE(MPLOCALCOLUMNS(matA%process_grid%number_of_blocks_columns, 1))
+     ALLOCATE(MPCOLUMNS(matA%process_grid%number_of_blocks_columns, 1))
+     ALLOCATE(memory_pool%column_helper(&
+          & matA%process_grid%number_of_blocks_columns, 1))
+     memory_pool%column_helper(:,:)%low_precision = low_precision
+     memory_pool%column_helper(:,:)%compress_indices = &
+          & matA%process_grid%compress_indices
+     ALLOCATE(TransposedBBlocks(II2_range))
+     DO JJ = 1, matA%process_grid%number_of_blocks_columns
+        DO II2 = 1, II2_range
+           CALL TransposeMatrix(matB%LMAT(&
+                & duplicate_start + duplicate_offset * (II2 - 1), JJ), &
+                & TransposedBBlocks(II2))
+        END DO
+        CALL ComposeMatrixColumns(TransposedBBlocks, MPLOCALCOLUMNS(JJ, 1))
+        CALL ReduceAndComposeMatrixSizes(MPLOCALCOLUMNS(JJ, 1), &
+             & matA%process_grid%blocked_column_comm(JJ), &
+             & MPCOLUMNS(JJ, 1), memory_pool%column_helper(JJ, 1), &
+             & memory_pool%column_plan(JJ, 1))
+     END DO
+     DO II2 = 1, II2_range
+        CALL DestructMatrix(TransposedBBlocks(II2))
+     END DO
+     DEALLOCATE(TransposedBBlocks)
+  END IF
+
+  !! Once the sizes have arrived, the data is left to be sent in the
+  !! background, and the multiply picks it up from the memory pool.
+  IF (memory_pool%row_state .EQ. OperandLocal) THEN
+     DO II = 1, matA%process_grid%number_of_blocks_rows
+        DO WHILE(.NOT. TestReduceSizeRequest(memory_pool%row_helper(II)))
+        END DO
+        CALL ReduceAndComposeMatrixData(MPLOCALROWS(II), &
+             & matA%process_grid%blocked_row_comm(II), MPROWS(II), &
+             & memory_pool%row_helper(II), memory_pool%row_plan(II))
+     END DO
+     memory_pool%row_state = OperandGathering
+  END IF
+  IF (memory_pool%column_state .EQ. OperandLocal) THEN
+     DO JJ = 1, matA%process_grid%number_of_blocks_columns
+        DO WHILE(.NOT. TestReduceSizeRequest(memory_pool%column_helper(JJ, 1)))
+        END DO
+        CALL ReduceAndComposeMatrixData(MPLOCALCOLUMNS(JJ, 1), &
+             & matA%process_grid%blocked_column_comm(JJ), &
+             & MPCOLUMNS(JJ, 1), memory_pool%column_helper(JJ, 1), &
+             & memory_pool%column_plan(JJ, 1))
+     END DO
+     memory_pool%column_state = OperandGathering
+  END IF
@@ -0,0 +1,26 @@
+  !! Tr(AB) is the sum of A_ij B_ji. If either matrix is Hermitian, the
+  !! partner of each element is stored in the same block of the other matrix.
+  !! Otherwise B^H is built, so that the partners are in the same place.
+  IF (.NOT. (matA%is_hermitian .OR. matB%is_hermitian)) THEN
+     CALL TransposeMatrix(matB, matBH)
+     CALL ConjugateMatrix(matBH)
+  END IF
+
+  trace_value = 0
+  DO JJ = 1, matA%process_grid%number_of_blocks_columns
+     DO II = 1, matA%process_grid%number_of_blocks_rows
+        IF (matB%is_hermitian) THEN
+           CALL DotMatrix(matB%LMAT(II, JJ), matA%LMAT(II, JJ), TEMP)
+        ELSE IF (matA%is_hermitian) THEN
+           CALL DotMatrix(matA%LMAT(II, JJ), matB%LMAT(II, JJ), TEMP)
+        ELSE
+           CALL DotMatrix(matBH%LMAT(II, JJ), matA%LMAT(II, JJ), TEMP)
+        END IF
+        trace_value = trace_value + TEMP
+     END DO
+  END DO
+  CALL DestructMatrix(matBH)
+
+  !! Sum Among Process Slice
+  CALL MPI_Allreduce(MPI_IN_PLACE, trace_value, 1, MPIDATATYPE, &
+       & MPI_SUM, matA%process_grid%within_slice_comm, ierr)
@@ -57,6 +57,7 @@
      ELSE
         CALL FillMatrixFromTripletList(split_mat, full_list, .TRUE.)
      END IF
+     split_mat%is_hermitian = this%is_hermitian
 
      !! Cleanup
      CALL DestructTripletList(full_list)
@@ -7,4 +7,5 @@
 
      CALL ConvertMatrixType(local_matrix, converted_matrix)
      CALL SplitMatrixToLocalBlocks(out, converted_matrix)
+     out%is_hermitian = in%is_hermitian
   END IF
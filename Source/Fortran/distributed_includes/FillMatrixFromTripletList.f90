@@ -15,12 +15,12 @@
      !! Shift and sort the local entries.
      CALL CopyTripletList(triplet_list, shifted)
      CALL ShiftTripletList(shifted, 1 - this%start_row, 1 - this%start_column)
-     CALL SortTripletList(shifted, this%local_columns, &
+     CALL ThreadedSortTripletList(shifted, this%local_columns, &
           & this%local_rows, sorted_tlist)
      CALL DestructTripletList(shifted)
      !! Build
-     CALL ConstructMatrixFromTripletList(local_matrix, sorted_tlist, &
-          & this%local_rows, this%local_columns)
+     CALL ThreadedConstructMatrixFromTripletList(local_matrix, &
+          & sorted_tlist, this%local_rows, this%local_columns)
      CALL SplitMatrixToLocalBlocks(this, local_matrix)
   ELSE
      !! First we redistribute the triplet list to get all the local data
@@ -31,8 +31,8 @@
           & basic_permutation%reverse_index_lookup, triplet_list, sorted_tlist)
 
      !! Now we can just construct a local matrix.
-     CALL ConstructMatrixFromTripletList(local_matrix, sorted_tlist, &
-          & this%local_rows, this%local_columns)
+     CALL ThreadedConstructMatrixFromTripletList(local_matrix, &
+          & sorted_tlist, this%local_rows, this%local_columns)
 
      !! And reduce over the Z dimension. 
      IF (.NOT. preduplicated .AND. &
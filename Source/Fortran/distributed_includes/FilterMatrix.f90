@@ -1,5 +1,6 @@
   !! Local Data
   INTEGER :: II
+  LOGICAL :: is_hermitian
 
   CALL GetMatrixTripletList(this, tlist)
   CALL ConstructTripletList(new_list)
@@ -11,4 +12,6 @@
      END IF
   END DO
 
+  is_hermitian = this%is_hermitian
   CALL FillMatrixFromTripletList(this, new_list, preduplicated_in=.TRUE.)
+  this%is_hermitian = is_hermitian
@@ -23,8 +23,8 @@
 
   !! Create the local matrix
   IF (this%process_grid%within_slice_rank .EQ. within_slice_id) THEN
-     CALL SortTripletList(tlist, mat_dim, mat_dim, sorted, .TRUE.)
-     CALL ConstructMatrixFromTripletList(local_mat, sorted, &
+     CALL ThreadedSortTripletList(tlist, mat_dim, mat_dim, sorted, .TRUE.)
+     CALL ThreadedConstructMatrixFromTripletList(local_mat, sorted, &
           & mat_dim, mat_dim)
   END IF
 
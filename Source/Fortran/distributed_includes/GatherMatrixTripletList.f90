@@ -1,3 +1,3 @@
   CALL GatherMatrixToProcess(this, lmat)
-  CALL MatrixToTripletList(lmat, tlist)
+  CALL ThreadedMatrixToTripletList(lmat, tlist)
   CALL DestructMatrix(lmat)
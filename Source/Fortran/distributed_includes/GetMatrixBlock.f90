@@ -1,6 +1,6 @@
   !! Merge all the local data
   CALL MergeMatrixLocalBlocks(working_matrix, merged_local_data)
-  CALL MatrixToTripletList(merged_local_data, local_triplet_list)
+  CALL ThreadedMatrixToTripletList(merged_local_data, local_triplet_list)
 
   !! Share the start row/column information across processes
   ALLOCATE(row_start_list(working_matrix%process_grid%slice_size))
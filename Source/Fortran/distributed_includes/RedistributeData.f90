@@ -50,8 +50,8 @@
           & reverse_index_lookup(gathered_list%DATA(II)%index_column) - &
           & this%start_column + 1
   END DO
-  CALL SortTripletList(gathered_list, this%local_columns, this%local_rows, &
-       & sorted_triplet_list)
+  CALL ThreadedSortTripletList(gathered_list, this%local_columns, &
+       & this%local_rows, sorted_triplet_list)
 
   !! Cleanup
   DO II = 1, this%process_grid%slice_size
@@ -1,4 +1,5 @@
   INTEGER :: II
+  LOGICAL :: is_hermitian
 
   !! Get the triplet values.
   CALL GetMatrixTripletList(this, tlist)
@@ -14,8 +15,10 @@
   END DO
 
   !! Rebuild.
+  is_hermitian = this%is_hermitian
   CALL ConstructEmptyMatrix(this, new_size)
   CALL FillMatrixFromTripletList(this, pruned, preduplicated_in = .TRUE.)
+  this%is_hermitian = is_hermitian
 
   !! Cleanup
   CALL DestructTripletList(tlist)
@@ -37,7 +37,7 @@
   !! Write The File
   IF (this%process_grid%between_slice_rank .EQ. 0) THEN
      !! Create Special MPI Type
-     CALL MatrixToTripletList(merged_local_data, tlist)
+     CALL ThreadedMatrixToTripletList(merged_local_data, tlist)
      !! Absolute Positions
      CALL ShiftTripletList(tlist, this%start_row - 1, this%start_column - 1)
      CALL MPI_File_open(this%process_grid%within_slice_comm, file_name,&
@@ -4,6 +4,7 @@
   INTEGER, DIMENSION(:), ALLOCATABLE :: local_values_buffer
   !! Local Data
   INTEGER :: triplet_list_string_length
+  INTEGER(NTLONG) :: total_values
   INTEGER(KIND = MPI_OFFSET_KIND) :: header_size
   INTEGER(KIND = MPI_OFFSET_KIND) :: write_offset
   INTEGER(KIND = MPI_OFFSET_KIND) :: header_offset
@@ -27,34 +28,64 @@
 
   CALL MPI_Type_size(MPI_CHARACTER, bytes_per_character, ierr)
 
+  !! Local Data
+  CALL ThreadedMatrixToTripletList(merged_local_data, tlist)
+  CALL DestructMatrix(merged_local_data)
+
+  !! Absolute Positions
+  CALL ShiftTripletList(tlist, this%start_row - 1, this%start_column - 1)
+
+  !! Only the lower triangle of a Hermitian matrix is written.
+  IF (this%is_hermitian) THEN
+     OFF_JJ = 0
+     DO II = 1, tlist%CurrentSize
+        IF (tlist%DATA(II)%index_row .GE. tlist%DATA(II)%index_column) THEN
+           OFF_JJ = OFF_JJ + 1
+           tlist%DATA(OFF_JJ) = tlist%DATA(II)
+        END IF
+     END DO
+     tlist%CurrentSize = OFF_JJ
+     total_values = tlist%CurrentSize
+     CALL MPI_Allreduce(MPI_IN_PLACE, total_values, 1, MPINTLONG, MPI_SUM, &
+          & this%process_grid%within_slice_comm, ierr)
+  ELSE
+     total_values = GetMatrixSize(this)
+  END IF
+
   !! Create the matrix size line
   NEW_LINE_LENGTH = LEN(NEW_LINE('A'))
 #ifdef ISCOMPLEX
-  WRITE(temp_string1, '(A)') &
-       & "%%MatrixMarket matrix coordinate complex general" &
-       & // NEW_LINE('A') // "%" // NEW_LINE('A')
+  IF (this%is_hermitian) THEN
+     WRITE(temp_string1, '(A)') &
+          & "%%MatrixMarket matrix coordinate complex hermitian" &
+          & // NEW_LINE('A') // "%" // NEW_LINE('A')
+  ELSE
+     WRITE(temp_string1, '(A)') &
+          & "%%MatrixMarket matrix coordinate complex general" &
+          & // NEW_LINE('A') // "%" // NEW_LINE('A')
+  END IF
 #else
-  WRITE(temp_string1, '(A)') "%%MatrixMarket matrix coordinate real general" &
-       & // NEW_LINE('A') // "%" // NEW_LINE('A')
+  IF (this%is_hermitian) THEN
+     WRITE(temp_string1, '(A)') &
+          & "%%MatrixMarket matrix coordinate real symmetric" &
+          & // NEW_LINE('A') // "%" // NEW_LINE('A')
+  ELSE
+     WRITE(temp_string1, '(A)') &
+          & "%%MatrixMarket matrix coordinate real general" &
+          & // NEW_LINE('A') // "%" // NEW_LINE('A')
+  END IF
 #endif
   ALLOCATE(CHARACTER(LEN = LEN_TRIM(temp_string1)) :: header_line1)
   header_line1(:) = TRIM(temp_string1)
 
   CALL WriteMMSize(temp_string2, this%actual_matrix_dimension, &
-       & this%actual_matrix_dimension, GetMatrixSize(this))
+       & this%actual_matrix_dimension, total_values)
   ALLOCATE(CHARACTER(&
        & LEN = LEN_TRIM(temp_string2) + NEW_LINE_LENGTH + 1) :: header_line2)
   WRITE(header_line2,*) TRIM(temp_string2) // new_LINE('A')
 
   header_size = LEN(header_line1) + LEN(header_line2)
 
-  !! Local Data
-  CALL MatrixToTripletList(merged_local_data, tlist)
-  CALL DestructMatrix(merged_local_data)
-
-  !! Absolute Positions
-  CALL ShiftTripletList(tlist, this%start_row - 1, this%start_column - 1)
-
   !! Figure out the length of the string for storing.
   triplet_list_string_length = 0
   DO II = 1, tlist%CurrentSize
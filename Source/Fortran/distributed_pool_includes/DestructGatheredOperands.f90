@@ -0,0 +1,18 @@
+#ifdef ROWS
+  IF (ALLOCATED(this%ROWS)) THEN
+     DO II = 1, SIZE(this%ROWS)
+        CALL DestructMatrix(this%ROWS(II))
+     END DO
+     DEALLOCATE(this%ROWS)
+  END IF
+#endif
+#ifdef COLUMNS
+  IF (ALLOCATED(this%COLUMNS)) THEN
+     DO JJ = 1, SIZE(this%COLUMNS, 2)
+        DO II = 1, SIZE(this%COLUMNS, 1)
+           CALL DestructMatrix(this%COLUMNS(II, JJ))
+        END DO
+     END DO
+     DEALLOCATE(this%COLUMNS)
+  END IF
+#endif
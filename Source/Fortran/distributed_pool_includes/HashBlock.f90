@@ -0,0 +1,8 @@
+  CALL HashValue(key, INT(block%rows, KIND=NTLONG))
+  CALL HashValue(key, INT(block%columns, KIND=NTLONG))
+  DO KK = 1, SIZE(block%outer_index)
+     CALL HashValue(key, INT(block%outer_index(KK), KIND=NTLONG))
+  END DO
+  DO KK = 1, SIZE(block%inner_index)
+     CALL HashValue(key, INT(block%inner_index(KK), KIND=NTLONG))
+  END DO
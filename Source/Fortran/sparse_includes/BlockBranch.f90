@@ -0,0 +1,24 @@
+  !! Block A and B in their untransposed form
+  IF (IsATransposed) THEN
+     CALL TransposeMatrix(matA, matAT)
+     CALL ConstructMatrixBFromS(matAT, blockA, block_size)
+     CALL DestructMatrix(matAT)
+  ELSE
+     CALL ConstructMatrixBFromS(matA, blockA, block_size)
+  END IF
+  IF (IsBTransposed) THEN
+     CALL TransposeMatrix(matB, matBT)
+     CALL ConstructMatrixBFromS(matBT, blockB, block_size)
+     CALL DestructMatrix(matBT)
+  ELSE
+     CALL ConstructMatrixBFromS(matB, blockB, block_size)
+  END IF
+
+  !! Multiply, and go back to the sparse format
+  CALL MultiplyMatrix(blockA, blockB, blockC, alpha, threshold, screen)
+  CALL ConstructMatrixSFromB(blockC, matC, threshold)
+
+  !! Cleanup
+  CALL DestructMatrix(blockA)
+  CALL DestructMatrix(blockB)
+  CALL DestructMatrix(blockC)
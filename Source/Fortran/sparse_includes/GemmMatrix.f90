@@ -1,10 +1,10 @@
-  REAL(NTREAL), PARAMETER :: sparsity_threshold = 0.1_NTREAL
   !! Counters and temporary data
-  INTEGER :: mat_c_columns, mat_c_rows
+  INTEGER :: mat_c_columns, mat_c_rows, inner_dimension
   !! For Efficiency Purposes
   REAL(NTREAL) :: sparsity_a, sparsity_b
   REAL(NTREAL) :: sparsity_estimate
   LOGICAL :: pool_flag
+  INTEGER :: sparse_threads
 
   !! Process Optional Parameters
   IF (.NOT. PRESENT(alpha_in)) THEN
@@ -32,6 +32,36 @@
   ELSE
      threshold = threshold_in
   END IF
+  IF (PRESENT(use_hash_in)) THEN
+     use_hash = use_hash_in
+  ELSE IF (PRESENT(blocked_memory_pool_in)) THEN
+     use_hash = blocked_memory_pool_in%use_hash
+  ELSE
+     use_hash = .FALSE.
+  END IF
+  IF (PRESENT(blocked_memory_pool_in)) THEN
+     reuse_pattern = blocked_memory_pool_in%reuse_pattern
+     block_size = blocked_memory_pool_in%block_size
+  ELSE
+     reuse_pattern = .FALSE.
+     block_size = 1
+  END IF
+  IF (PRESENT(screen_in)) THEN
+     screen = screen_in
+  ELSE
+     screen = 0.0_NTREAL
+  END IF
+
+  !! Screen the elements of A against the rows of op(B), and multiply what
+  !! is left. The blocked algorithm screens pairs of blocks instead.
+  IF (screen .GT. 0.0_NTREAL .AND. block_size .EQ. 1) THEN
+     CALL ScreenOperand(matA, matB, IsATransposed, IsBTransposed, alpha, &
+          & screen, matAS)
+     CALL MatrixMultiply(matAS, matB, matC, IsATransposed, IsBTransposed, &
+          & alpha, beta_in, threshold, blocked_memory_pool_in, use_hash_in)
+     CALL DestructMatrix(matAS)
+     RETURN
+  END IF
 
   !! Storage details for result matrix
   IF (IsATransposed) THEN
@@ -44,6 +74,11 @@
   ELSE
      mat_c_columns = matB%columns
   END IF
+  IF (IsATransposed) THEN
+     inner_dimension = matA%rows
+  ELSE
+     inner_dimension = matA%columns
+  END IF
 
   !! Initialization of Memory
   sparsity_a = DBLE(SIZE(matA%values)) / (matA%rows * matA%columns)
@@ -55,21 +90,34 @@
      sparsity_estimate = 1e-8
   END IF
 
+  !! The threads the sparse version would run on (see SparseBranch).
+  sparse_threads = 1
+#ifdef _OPENMP
+  IF (.NOT. use_hash .AND. .NOT. omp_in_parallel() .AND. &
+       & SIZE(matA%values) + SIZE(matB%values) .GE. min_parallel_entries) THEN
+     sparse_threads = omp_get_max_threads()
+  END IF
+#endif
+
   !! Decide whether to do dense or sparse version.
-  IF (MIN(sparsity_a, sparsity_b) .GT. sparsity_threshold) THEN
+  IF (ChooseDenseBranch(mat_c_rows, mat_c_columns, inner_dimension, &
+       & SIZE(matA%values), SIZE(matB%values), sparse_threads)) THEN
      CALL DenseBranch(matA, matB, matAB, IsATransposed, IsBTransposed, &
           & alpha, threshold)
+  ELSE IF (block_size .GT. 1) THEN
+     CALL BlockBranch(matA, matB, matAB, IsATransposed, IsBTransposed, &
+          & alpha, threshold, block_size, screen)
   ELSE
      !! Setup the memory pool
      IF (.NOT. PRESENT(blocked_memory_pool_in)) THEN
         CALL ConstructMatrixMemoryPool(blocked_memory_pool, mat_c_columns, &
-             & mat_c_rows, sparsity_estimate)
+             & mat_c_rows, sparsity_estimate, use_hash)
         pool_flag = .FALSE.
      ELSEIF (.NOT. CheckMemoryPoolValidity(blocked_memory_pool_in, &
-          & mat_c_columns, mat_c_rows)) THEN
+          & mat_c_columns, mat_c_rows, use_hash)) THEN
         CALL DestructMatrixMemoryPool(blocked_memory_pool_in)
         CALL ConstructMatrixMemoryPool(blocked_memory_pool_in, mat_c_columns, &
-             & mat_c_rows, sparsity_estimate)
+             & mat_c_rows, sparsity_estimate, use_hash, reuse_pattern)
         pool_flag = .TRUE.
      ELSE
         CALL SetPoolSparsity(blocked_memory_pool_in, sparsity_estimate)
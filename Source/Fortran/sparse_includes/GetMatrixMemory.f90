@@ -0,0 +1,12 @@
+  bytes = 0
+  IF (ALLOCATED(this%outer_index)) bytes = bytes + &
+       & SIZE(this%outer_index, KIND = NTLONG) * BYTES_PER_INTEGER
+  IF (ALLOCATED(this%inner_index)) bytes = bytes + &
+       & SIZE(this%inner_index, KIND = NTLONG) * BYTES_PER_INTEGER
+#ifdef ISCOMPLEX
+  IF (ALLOCATED(this%values)) bytes = bytes + &
+       & SIZE(this%values, KIND = NTLONG) * BYTES_PER_COMPLEX
+#else
+  IF (ALLOCATED(this%values)) bytes = bytes + &
+       & SIZE(this%values, KIND = NTLONG) * BYTES_PER_REAL
+#endif
@@ -5,7 +5,22 @@
   !! Counters
   INTEGER :: II, AA, BB
 
-  !! Multiply
+  !! Count the work first, so the tasks below do not share a counter.
+  memorypool%flops = 0
+  DO II = 1, matAT%columns
+     DO AA = matAT%outer_index(II) + 1, matAT%outer_index(II + 1)
+        idx_a = matAT%inner_index(AA)
+        memorypool%flops = memorypool%flops + &
+             & matBT%outer_index(idx_a + 1) - matBT%outer_index(idx_a)
+     END DO
+  END DO
+
+  !! Multiply. Each column of the memory pool is only touched by the task
+  !! that owns that column, so the columns can be split between threads.
+  !$omp taskloop default(shared) &
+  !$omp& private(AA, BB, val_a, val_b, val_c, idx_a, idx_b, idx_hash) &
+  !$omp& private(inserted_vals, is_set) &
+  !$omp& private(elements_per_inner_a, elements_per_inner_b)
   DO II = 1, matAT%columns
      elements_per_inner_a = matAT%outer_index(II + 1) - &
           & matAT%outer_index(II)
@@ -34,3 +49,4 @@
         END DO
      END DO
   END DO
+  !$omp end taskloop
@@ -0,0 +1,198 @@
+  !! Local Data
+  INTEGER :: row_flops, max_row_flops, row_start, row_end
+  INTEGER :: table_size, table_mask, slot
+  INTEGER :: inserted_vals, total_vals
+  INTEGER :: idx_a, idx_b
+  INTEGER :: nnz_a, nnz_b
+  LOGICAL :: pattern_matches, record_pattern
+  !! Counters
+  INTEGER :: II, AA, BB, SS, FF
+
+  !! The product is built one row at a time as the columns of its transpose.
+  CALL ConstructEmptyMatrix(matCT, matBT%rows, matAT%columns)
+
+  !! Check if the operands have the same structure as the cached product.
+  nnz_a = matAT%outer_index(matAT%columns + 1)
+  nnz_b = matBT%outer_index(matBT%columns + 1)
+  pattern_matches = .FALSE.
+  IF (memorypool%reuse_pattern .AND. ALLOCATED(memorypool%pattern_map)) THEN
+     IF (memorypool%pattern_rows .EQ. matBT%rows .AND. &
+          & SIZE(memorypool%pattern_a_outer) .EQ. matAT%columns + 1 .AND. &
+          & SIZE(memorypool%pattern_b_outer) .EQ. matBT%columns + 1 .AND. &
+          & SIZE(memorypool%pattern_a_inner) .EQ. nnz_a .AND. &
+          & SIZE(memorypool%pattern_b_inner) .EQ. nnz_b) THEN
+        pattern_matches = &
+             & ALL(memorypool%pattern_a_outer .EQ. matAT%outer_index) .AND. &
+             & ALL(memorypool%pattern_b_outer .EQ. matBT%outer_index) .AND. &
+             & ALL(memorypool%pattern_a_inner .EQ. &
+             &     matAT%inner_index(:nnz_a)) .AND. &
+             & ALL(memorypool%pattern_b_inner .EQ. matBT%inner_index(:nnz_b))
+     END IF
+  END IF
+
+  IF (pattern_matches) THEN
+     !! Only the values need to be computed.
+     matCT%outer_index = memorypool%pattern_c_outer
+     total_vals = matCT%outer_index(matCT%columns + 1)
+     ALLOCATE(matCT%inner_index(total_vals))
+     ALLOCATE(matCT%values(total_vals))
+     matCT%inner_index = memorypool%pattern_c_inner
+     matCT%values = 0
+     FF = 0
+     DO II = 1, matAT%columns
+        DO AA = matAT%outer_index(II) + 1, matAT%outer_index(II + 1)
+           val_a = matAT%values(AA)
+           idx_a = matAT%inner_index(AA)
+           DO BB = matBT%outer_index(idx_a) + 1, matBT%outer_index(idx_a + 1)
+              FF = FF + 1
+              matCT%values(memorypool%pattern_map(FF)) = &
+                   & matCT%values(memorypool%pattern_map(FF)) + &
+                   & val_a * matBT%values(BB)
+           END DO
+        END DO
+     END DO
+     memorypool%flops = FF
+  ELSE
+     !! Count the flops of each row, which bound the size of its table.
+     memorypool%flops = 0
+     max_row_flops = 0
+     DO II = 1, matAT%columns
+        row_flops = 0
+        DO AA = matAT%outer_index(II) + 1, matAT%outer_index(II + 1)
+           idx_a = matAT%inner_index(AA)
+           row_flops = row_flops + matBT%outer_index(idx_a + 1) - &
+                & matBT%outer_index(idx_a)
+        END DO
+        memorypool%flops = memorypool%flops + row_flops
+        row_flops = MIN(row_flops, matBT%rows)
+        max_row_flops = MAX(max_row_flops, row_flops)
+        matCT%outer_index(II + 1) = row_flops
+     END DO
+     table_size = 1
+     DO WHILE (table_size .LT. 2 * max_row_flops)
+        table_size = 2 * table_size
+     END DO
+     IF (SIZE(memorypool%table_keys) .LT. table_size) THEN
+        DEALLOCATE(memorypool%table_keys)
+        DEALLOCATE(memorypool%table_index)
+        DEALLOCATE(memorypool%table_slots)
+        ALLOCATE(memorypool%table_keys(table_size))
+        ALLOCATE(memorypool%table_index(table_size))
+        ALLOCATE(memorypool%table_slots(table_size))
+        memorypool%table_keys = 0
+     END IF
+
+     !! Symbolic phase: count the distinct columns in each row.
+     DO II = 1, matAT%columns
+        table_size = 1
+        DO WHILE (table_size .LT. 2 * matCT%outer_index(II + 1))
+           table_size = 2 * table_size
+        END DO
+        table_mask = table_size - 1
+        inserted_vals = 0
+        DO AA = matAT%outer_index(II) + 1, matAT%outer_index(II + 1)
+           idx_a = matAT%inner_index(AA)
+           DO BB = matBT%outer_index(idx_a) + 1, matBT%outer_index(idx_a + 1)
+              idx_b = matBT%inner_index(BB)
+              slot = IAND(idx_b, table_mask) + 1
+              DO WHILE (memorypool%table_keys(slot) .NE. idx_b)
+                 IF (memorypool%table_keys(slot) .EQ. 0) THEN
+                    memorypool%table_keys(slot) = idx_b
+                    inserted_vals = inserted_vals + 1
+                    memorypool%table_slots(inserted_vals) = slot
+                 ELSE
+                    slot = IAND(slot, table_mask) + 1
+                 END IF
+              END DO
+           END DO
+        END DO
+        DO SS = 1, inserted_vals
+           memorypool%table_keys(memorypool%table_slots(SS)) = 0
+        END DO
+        matCT%outer_index(II + 1) = matCT%outer_index(II) + inserted_vals
+     END DO
+
+     !! The map from multiply-adds to the product is only kept if it fits.
+     record_pattern = memorypool%reuse_pattern .AND. &
+          & memorypool%flops .LE. HUGE(FF)
+     IF (ALLOCATED(memorypool%pattern_map)) &
+          & DEALLOCATE(memorypool%pattern_map)
+     IF (record_pattern) ALLOCATE(memorypool%pattern_map(memorypool%flops))
+
+     !! Numeric phase: accumulate straight into the preallocated product.
+     total_vals = matCT%outer_index(matCT%columns + 1)
+     ALLOCATE(matCT%inner_index(total_vals))
+     ALLOCATE(matCT%values(total_vals))
+     FF = 0
+     DO II = 1, matAT%columns
+        row_start = matCT%outer_index(II)
+        table_size = 1
+        DO WHILE (table_size .LT. 2 * (matCT%outer_index(II + 1) - row_start))
+           table_size = 2 * table_size
+        END DO
+        table_mask = table_size - 1
+        inserted_vals = 0
+        DO AA = matAT%outer_index(II) + 1, matAT%outer_index(II + 1)
+           val_a = matAT%values(AA)
+           idx_a = matAT%inner_index(AA)
+           DO BB = matBT%outer_index(idx_a) + 1, matBT%outer_index(idx_a + 1)
+              idx_b = matBT%inner_index(BB)
+              slot = IAND(idx_b, table_mask) + 1
+              DO WHILE (memorypool%table_keys(slot) .NE. idx_b)
+                 IF (memorypool%table_keys(slot) .EQ. 0) THEN
+                    memorypool%table_keys(slot) = idx_b
+                    inserted_vals = inserted_vals + 1
+                    memorypool%table_slots(inserted_vals) = slot
+                    memorypool%table_index(slot) = row_start + inserted_vals
+                    matCT%inner_index(row_start + inserted_vals) = idx_b
+                    matCT%values(row_start + inserted_vals) = 0
+                 ELSE
+                    slot = IAND(slot, table_mask) + 1
+                 END IF
+              END DO
+              matCT%values(memorypool%table_index(slot)) = &
+                   & matCT%values(memorypool%table_index(slot)) + &
+                   & val_a * matBT%values(BB)
+              IF (record_pattern) THEN
+                 FF = FF + 1
+                 memorypool%pattern_map(FF) = memorypool%table_index(slot)
+              END IF
+           END DO
+        END DO
+        DO SS = 1, inserted_vals
+           memorypool%table_keys(memorypool%table_slots(SS)) = 0
+        END DO
+     END DO
+
+     !! Remember the structure for the next product.
+     IF (record_pattern) THEN
+        memorypool%pattern_rows = matBT%rows
+        memorypool%pattern_a_outer = matAT%outer_index
+        memorypool%pattern_a_inner = matAT%inner_index(:nnz_a)
+        memorypool%pattern_b_outer = matBT%outer_index
+        memorypool%pattern_b_inner = matBT%inner_index(:nnz_b)
+        memorypool%pattern_c_outer = matCT%outer_index
+        memorypool%pattern_c_inner = matCT%inner_index
+     END IF
+  END IF
+
+  !! Scale and flush small values in place.
+  total_vals = 0
+  row_end = 0
+  DO II = 1, matCT%columns
+     row_start = row_end
+     row_end = matCT%outer_index(II + 1)
+     DO SS = row_start + 1, row_end
+        working_value = alpha * matCT%values(SS)
+        IF (ABS(working_value) .GT. threshold) THEN
+           total_vals = total_vals + 1
+           matCT%inner_index(total_vals) = matCT%inner_index(SS)
+           matCT%values(total_vals) = working_value
+        END IF
+     END DO
+     matCT%outer_index(II + 1) = total_vals
+  END DO
+
+  !! Transposing back also sorts the rows within each column.
+  CALL TransposeMatrix(matCT, matC)
+  CALL DestructMatrix(matCT)
@@ -0,0 +1,65 @@
+  !! Local Data
+  REAL(NTREAL), DIMENSION(:), ALLOCATABLE :: inner_norm
+  INTEGER :: inner_dimension
+  INTEGER :: II, JJ, KK
+  INTEGER :: counter
+
+  !! The norm of each row of op(B), indexed by the inner dimension.
+  IF (IsATransposed) THEN
+     inner_dimension = matA%rows
+  ELSE
+     inner_dimension = matA%columns
+  END IF
+  ALLOCATE(inner_norm(inner_dimension))
+  inner_norm = 0.0_NTREAL
+  IF (IsBTransposed) THEN
+     DO II = 1, matB%columns
+        DO JJ = matB%outer_index(II) + 1, matB%outer_index(II + 1)
+           inner_norm(II) = inner_norm(II) + ABS(matB%values(JJ))**2
+        END DO
+     END DO
+  ELSE
+     DO JJ = 1, matB%outer_index(matB%columns + 1)
+        KK = matB%inner_index(JJ)
+        inner_norm(KK) = inner_norm(KK) + ABS(matB%values(JJ))**2
+     END DO
+  END IF
+  inner_norm = ABS(alpha) * SQRT(inner_norm)
+
+  !! Count the elements of A that are kept.
+  CALL ConstructEmptyMatrix(matAS, matA%rows, matA%columns)
+  counter = 0
+  DO II = 1, matA%columns
+     DO JJ = matA%outer_index(II) + 1, matA%outer_index(II + 1)
+        IF (IsATransposed) THEN
+           KK = matA%inner_index(JJ)
+        ELSE
+           KK = II
+        END IF
+        IF (ABS(matA%values(JJ)) * inner_norm(KK) .GE. screen) THEN
+           counter = counter + 1
+        END IF
+     END DO
+     matAS%outer_index(II + 1) = counter
+  END DO
+
+  !! Copy them over.
+  ALLOCATE(matAS%inner_index(counter))
+  ALLOCATE(matAS%values(counter))
+  counter = 0
+  DO II = 1, matA%columns
+     DO JJ = matA%outer_index(II) + 1, matA%outer_index(II + 1)
+        IF (IsATransposed) THEN
+           KK = matA%inner_index(JJ)
+        ELSE
+           KK = II
+        END IF
+        IF (ABS(matA%values(JJ)) * inner_norm(KK) .GE. screen) THEN
+           counter = counter + 1
+           matAS%inner_index(counter) = matA%inner_index(JJ)
+           matAS%values(counter) = matA%values(JJ)
+        END IF
+     END DO
+  END DO
+
+  DEALLOCATE(inner_norm)
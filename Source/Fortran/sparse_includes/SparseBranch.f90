@@ -6,16 +6,58 @@
      CALL TransposeMatrix(matB, matBT)
   END IF
 
-  IF (IsATransposed .AND. IsBTransposed) THEN
-     CALL MultiplyBlock(matA, matB, blocked_memory_pool)
-  ELSEIF (IsATransposed) THEN
-     CALL MultiplyBlock(matA, matBT, blocked_memory_pool)
-  ELSEIF (IsBTransposed) THEN
-     CALL MultiplyBlock(matAT, matB, blocked_memory_pool)
+  IF (blocked_memory_pool%use_hash) THEN
+     !! The hash version builds the return matrix directly.
+     IF (IsATransposed .AND. IsBTransposed) THEN
+        CALL MultiplyBlockHash(matA, matB, alpha, threshold, &
+             & blocked_memory_pool, matC)
+     ELSEIF (IsATransposed) THEN
+        CALL MultiplyBlockHash(matA, matBT, alpha, threshold, &
+             & blocked_memory_pool, matC)
+     ELSEIF (IsBTransposed) THEN
+        CALL MultiplyBlockHash(matAT, matB, alpha, threshold, &
+             & blocked_memory_pool, matC)
+     ELSE
+        CALL MultiplyBlockHash(matAT, matBT, alpha, threshold, &
+             & blocked_memory_pool, matC)
+     END IF
   ELSE
-     CALL MultiplyBlock(matAT, matBT, blocked_memory_pool)
-  END IF
+     !! The columns are multiplied in tasks. Inside a parallel region, idle
+     !! threads of the team pick them up. Otherwise, make a team here, unless
+     !! the product is too small to pay for waking the threads up.
+     in_parallel = .FALSE.
+#ifdef _OPENMP
+     in_parallel = omp_in_parallel()
+#endif
+     small_product = matA%outer_index(matA%columns + 1) + &
+          & matB%outer_index(matB%columns + 1) .LT. min_parallel_entries
+     IF (in_parallel .OR. small_product) THEN
+        IF (IsATransposed .AND. IsBTransposed) THEN
+           CALL MultiplyBlock(matA, matB, blocked_memory_pool)
+        ELSEIF (IsATransposed) THEN
+           CALL MultiplyBlock(matA, matBT, blocked_memory_pool)
+        ELSEIF (IsBTransposed) THEN
+           CALL MultiplyBlock(matAT, matB, blocked_memory_pool)
+        ELSE
+           CALL MultiplyBlock(matAT, matBT, blocked_memory_pool)
+        END IF
+     ELSE
+        !$omp parallel
+        !$omp single
+        IF (IsATransposed .AND. IsBTransposed) THEN
+           CALL MultiplyBlock(matA, matB, blocked_memory_pool)
+        ELSEIF (IsATransposed) THEN
+           CALL MultiplyBlock(matA, matBT, blocked_memory_pool)
+        ELSEIF (IsBTransposed) THEN
+           CALL MultiplyBlock(matAT, matB, blocked_memory_pool)
+        ELSE
+           CALL MultiplyBlock(matAT, matBT, blocked_memory_pool)
+        END IF
+        !$omp end single
+        !$omp end parallel
+     END IF
 
-  !! Go from triplets to return matrix
-  CALL PruneList(blocked_memory_pool, alpha, threshold, &
-       & blocked_memory_pool%columns, blocked_memory_pool%rows, matC)
+     !! Go from triplets to return matrix
+     CALL PruneList(blocked_memory_pool, alpha, threshold, &
+          & blocked_memory_pool%columns, blocked_memory_pool%rows, matC)
+  END IF
@@ -0,0 +1,45 @@
+  !! Local Data
+  INTEGER :: II, JJ, list_length
+  INTEGER :: previous_column, next_column
+
+  CALL DestructMatrix(this)
+
+  this%rows = rows
+  this%columns = columns
+  list_length = triplet_list%CurrentSize
+
+  !! Allocate
+  ALLOCATE(this%outer_index(this%columns + 1))
+  ALLOCATE(this%inner_index(list_length))
+  ALLOCATE(this%values(list_length))
+
+  !$omp parallel private(previous_column, next_column, JJ)
+  !! Insert inner index and value
+  !$omp do
+  DO II = 1, list_length
+     this%inner_index(II) = triplet_list%DATA(II)%index_row
+     this%values(II) = triplet_list%DATA(II)%point_value
+  END DO
+  !$omp end do nowait
+
+  !! The list is sorted, so a column starts wherever the column index changes.
+  !! Each outer value is set by exactly one iteration, including those of
+  !! the empty columns in between.
+  !$omp do
+  DO II = 1, list_length + 1
+     IF (II .EQ. 1) THEN
+        previous_column = 0
+     ELSE
+        previous_column = triplet_list%DATA(II - 1)%index_column
+     END IF
+     IF (II .GT. list_length) THEN
+        next_column = this%columns + 1
+     ELSE
+        next_column = triplet_list%DATA(II)%index_column
+     END IF
+     DO JJ = previous_column + 1, next_column
+        this%outer_index(JJ) = II - 1
+     END DO
+  END DO
+  !$omp end do
+  !$omp end parallel
@@ -0,0 +1,17 @@
+  !! Helper variables
+  INTEGER :: II, KK
+
+  CALL ConstructTripletList(triplet_list, this%outer_index(this%columns + 1))
+
+  !! Each column already knows where its entries go in the list.
+  !$omp parallel private(KK)
+  !$omp do
+  DO II = 1, this%columns
+     DO KK = this%outer_index(II) + 1, this%outer_index(II + 1)
+        triplet_list%DATA(KK)%index_column = II
+        triplet_list%DATA(KK)%index_row = this%inner_index(KK)
+        triplet_list%DATA(KK)%point_value = this%values(KK)
+     END DO
+  END DO
+  !$omp end do
+  !$omp end parallel
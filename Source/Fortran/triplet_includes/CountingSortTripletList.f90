@@ -0,0 +1,35 @@
+  !! Local Data
+  INTEGER, DIMENSION(:), ALLOCATABLE :: offset_array
+  INTEGER :: II, idx
+
+  CALL ConstructTripletList(sorted_list, input_list%CurrentSize)
+  ALLOCATE(offset_array(number_of_keys + 1))
+
+  !! Count the entries with each key, one place over to make the offsets.
+  offset_array = 0
+  DO II = 1, input_list%CurrentSize
+     IF (by_row) THEN
+        idx = input_list%DATA(II)%index_row
+     ELSE
+        idx = input_list%DATA(II)%index_column
+     END IF
+     offset_array(idx + 1) = offset_array(idx + 1) + 1
+  END DO
+  offset_array(1) = 1
+  DO II = 2, number_of_keys + 1
+     offset_array(II) = offset_array(II) + offset_array(II - 1)
+  END DO
+
+  !! Scatter, keeping entries with the same key in their original order.
+  DO II = 1, input_list%CurrentSize
+     IF (by_row) THEN
+        idx = input_list%DATA(II)%index_row
+     ELSE
+        idx = input_list%DATA(II)%index_column
+     END IF
+     sorted_list%DATA(offset_array(idx)) = input_list%DATA(II)
+     offset_array(idx) = offset_array(idx) + 1
+  END DO
+
+  !! Cleanup
+  DEALLOCATE(offset_array)
@@ -0,0 +1,94 @@
+  !! Local Data
+  INTEGER, DIMENSION(:,:), ALLOCATABLE :: offset_array
+  INTEGER, DIMENSION(:), ALLOCATABLE :: block_start
+  INTEGER :: list_length, num_threads, list_chunk, key_chunk
+  INTEGER :: thread_id, II, JJ, idx, running, temp
+
+  list_length = input_list%CurrentSize
+  CALL ConstructTripletList(sorted_list, list_length)
+
+  !! Each thread needs enough entries to be worth its own set of counters.
+  num_threads = 1
+#ifdef _OPENMP
+  num_threads = MAX(1, MIN(omp_get_max_threads(), &
+       & list_length / min_entries_per_thread))
+#endif
+
+  !$omp parallel num_threads(num_threads) &
+  !$omp& private(thread_id, II, JJ, idx, running, temp)
+  !! The team can be smaller than asked for, for example when this is called
+  !! from inside another parallel region. The work is split over the threads
+  !! that are actually there.
+  !$omp single
+#ifdef _OPENMP
+  num_threads = omp_get_num_threads()
+#endif
+  list_chunk = (list_length + num_threads - 1) / num_threads
+  key_chunk = (number_of_keys + num_threads - 1) / num_threads
+  ALLOCATE(offset_array(number_of_keys, num_threads))
+  ALLOCATE(block_start(num_threads + 1))
+  !$omp end single
+
+  thread_id = 1
+#ifdef _OPENMP
+  thread_id = omp_get_thread_num() + 1
+#endif
+
+  !! Each thread counts the keys in its own part of the list.
+  offset_array(:, thread_id) = 0
+  DO II = (thread_id - 1) * list_chunk + 1, &
+       & MIN(thread_id * list_chunk, list_length)
+     IF (by_row) THEN
+        idx = input_list%DATA(II)%index_row
+     ELSE
+        idx = input_list%DATA(II)%index_column
+     END IF
+     offset_array(idx, thread_id) = offset_array(idx, thread_id) + 1
+  END DO
+  !$omp barrier
+
+  !! The prefix sum is split over the keys. First each thread adds up the
+  !! entries that fall in its range of keys.
+  running = 0
+  DO II = (thread_id - 1) * key_chunk + 1, &
+       & MIN(thread_id * key_chunk, number_of_keys)
+     running = running + SUM(offset_array(II, :))
+  END DO
+  block_start(thread_id + 1) = running
+  !$omp barrier
+  !$omp single
+  block_start(1) = 1
+  DO II = 2, num_threads + 1
+     block_start(II) = block_start(II) + block_start(II - 1)
+  END DO
+  !$omp end single
+
+  !! Then each thread turns its counts into offsets. Within a key the
+  !! threads are taken in order, which keeps the sort stable.
+  running = block_start(thread_id)
+  DO II = (thread_id - 1) * key_chunk + 1, &
+       & MIN(thread_id * key_chunk, number_of_keys)
+     DO JJ = 1, num_threads
+        temp = offset_array(II, JJ)
+        offset_array(II, JJ) = running
+        running = running + temp
+     END DO
+  END DO
+  !$omp barrier
+
+  !! Scatter, keeping entries with the same key in their original order.
+  DO II = (thread_id - 1) * list_chunk + 1, &
+       & MIN(thread_id * list_chunk, list_length)
+     IF (by_row) THEN
+        idx = input_list%DATA(II)%index_row
+     ELSE
+        idx = input_list%DATA(II)%index_column
+     END IF
+     sorted_list%DATA(offset_array(idx, thread_id)) = input_list%DATA(II)
+     offset_array(idx, thread_id) = offset_array(idx, thread_id) + 1
+  END DO
+  !$omp end parallel
+
+  !! Cleanup
+  DEALLOCATE(offset_array)
+  DEALLOCATE(block_start)
@@ -6,12 +6,14 @@
 %apply double *OUTPUT { double *min_ger_eig };
 %apply double *OUTPUT { double *max_ger_eig };
 %apply double *OUTPUT { double *gap };
+%apply int &OUTPUT { int &num_slices, int &my_slice };
 
 %{
 #include "SolverBase.h"
 #include "Triplet.h"
 #include "Analysis.h"
 #include "ChebyshevSolvers.h"
+#include "CostModel.h"
 #include "DensityMatrixSolvers.h"
 #include "EigenBounds.h"
 #include "EigenSolvers.h"
@@ -26,6 +28,7 @@
 #include "MatrixConversion.h"
 #include "MatrixMapper.h"
 #include "MatrixMemoryPool.h"
+#include "MemoryAccounting.h"
 #include "Permutation.h"
 #include "PMatrixMemoryPool.h"
 #include "PSMatrix.h"
@@ -40,6 +43,77 @@
 #include "TripletList.h"
 #include <complex>
 using namespace NTPoly;
+
+// Acquire a contiguous buffer from a python object, checking that the
+// element size matches what the wrapper expects.
+static bool GetContiguousBuffer(PyObject *obj, Py_buffer *view,
+                                Py_ssize_t itemsize) {
+  if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0)
+    return false;
+  if (view->itemsize != itemsize) {
+    PyBuffer_Release(view);
+    PyErr_SetString(PyExc_TypeError, "Array has the wrong element type.");
+    return false;
+  }
+  return true;
+}
+
+// Fill a triplet list from three buffers of the same length.
+template <class List, class Value>
+static PyObject *FillFromBuffers(List *list, PyObject *index_row,
+                                 PyObject *index_column,
+                                 PyObject *point_value) {
+  Py_buffer rbuf, cbuf, vbuf;
+  if (!GetContiguousBuffer(index_row, &rbuf, sizeof(int)))
+    return NULL;
+  if (!GetContiguousBuffer(index_column, &cbuf, sizeof(int))) {
+    PyBuffer_Release(&rbuf);
+    return NULL;
+  }
+  if (!GetContiguousBuffer(point_value, &vbuf, sizeof(Value))) {
+    PyBuffer_Release(&rbuf);
+    PyBuffer_Release(&cbuf);
+    return NULL;
+  }
+  Py_ssize_t size = rbuf.len / rbuf.itemsize;
+  PyObject *result = Py_None;
+  if (cbuf.len / cbuf.itemsize != size || vbuf.len / vbuf.itemsize != size) {
+    PyErr_SetString(PyExc_ValueError, "Arrays must have the same length.");
+    result = NULL;
+  } else {
+    list->FillFromArrays(static_cast<int>(size),
+                         static_cast<const int *>(rbuf.buf),
+                         static_cast<const int *>(cbuf.buf),
+                         static_cast<const Value *>(vbuf.buf));
+    Py_INCREF(result);
+  }
+  PyBuffer_Release(&rbuf);
+  PyBuffer_Release(&cbuf);
+  PyBuffer_Release(&vbuf);
+  return result;
+}
+
+// Describe the arrays stored in a triplet list as a tuple of addresses.
+template <class List, class Value> static PyObject *GetListArrays(List *list) {
+  int *index_row, *index_column;
+  Value *point_value;
+  int stride;
+  int size = list->GetArrays(index_row, index_column, point_value, stride);
+  return Py_BuildValue("(iKKKi)", size, (unsigned long long)index_row,
+                       (unsigned long long)index_column,
+                       (unsigned long long)point_value, stride);
+}
+
+// Describe the arrays stored in a sparse matrix as a tuple of addresses.
+template <class Matrix, class Value>
+static PyObject *GetMatrixArrays(Matrix *mat) {
+  int *outer_index, *inner_index;
+  Value *values;
+  int nnz = mat->GetArrays(outer_index, inner_index, values);
+  return Py_BuildValue("(iKKK)", nnz, (unsigned long long)outer_index,
+                       (unsigned long long)inner_index,
+                       (unsigned long long)values);
+}
 %}
 
 %include <complex.i>
@@ -48,8 +122,60 @@ using namespace NTPoly;
 %feature("director") RealOperation;
 %feature("director") ComplexOperation;
 
+%ignore NTPoly::TripletList_r::FillFromArrays;
+%ignore NTPoly::TripletList_c::FillFromArrays;
+%ignore NTPoly::TripletList_r::GetArrays;
+%ignore NTPoly::TripletList_c::GetArrays;
+%ignore NTPoly::Matrix_lsr::GetArrays;
+%ignore NTPoly::Matrix_lsc::GetArrays;
+
+// Release the GIL around a call, so other python threads can run while
+// the library works. Only used for calls that never touch python objects.
+%define %releasegil(name)
+%exception name {
+  Py_BEGIN_ALLOW_THREADS
+  $action
+  Py_END_ALLOW_THREADS
+}
+%enddef
+%releasegil(NTPoly::Matrix_lsr::Matrix_lsr)
+%releasegil(NTPoly::Matrix_lsr::WriteToMatrixMarket)
+%releasegil(NTPoly::Matrix_lsr::Gemm)
+%releasegil(NTPoly::Matrix_lsc::Matrix_lsc)
+%releasegil(NTPoly::Matrix_lsc::WriteToMatrixMarket)
+%releasegil(NTPoly::Matrix_lsc::Gemm)
+%releasegil(NTPoly::Matrix_ps::Matrix_ps)
+%releasegil(NTPoly::Matrix_ps::WriteToBinary)
+%releasegil(NTPoly::Matrix_ps::WriteToMatrixMarket)
+%releasegil(NTPoly::Matrix_ps::FillFromTripletList)
+%releasegil(NTPoly::Matrix_ps::GetMatrixBlock)
+%releasegil(NTPoly::Matrix_ps::GetMatrixSlice)
+%releasegil(NTPoly::Matrix_ps::Transpose)
+%releasegil(NTPoly::Matrix_ps::Resize)
+%releasegil(NTPoly::Matrix_ps::Gemm)
+
 %include "SolverBase.h"
 %include "Triplet.h"
+%include "CostModel.h"
+%include "Logging.h"
+%include "MatrixConversion.h"
+%include "MatrixMapper.h"
+%include "MatrixMemoryPool.h"
+%include "MemoryAccounting.h"
+%include "Permutation.h"
+%include "ProcessGrid.h"
+%include "PMatrixMemoryPool.h"
+%include "PSMatrix.h"
+%include "SMatrix.h"
+%include "SolverParameters.h"
+%include "TripletList.h"
+
+// The solvers do not call back into python, so they always release the GIL.
+%exception {
+  Py_BEGIN_ALLOW_THREADS
+  $action
+  Py_END_ALLOW_THREADS
+}
 %include "Analysis.h"
 %include "ChebyshevSolvers.h"
 %include "DensityMatrixSolvers.h"
@@ -62,19 +188,292 @@ using namespace NTPoly;
 %include "InverseSolvers.h"
 %include "LinearSolvers.h"
 %include "LoadBalancer.h"
-%include "Logging.h"
-%include "MatrixConversion.h"
-%include "MatrixMapper.h"
-%include "MatrixMemoryPool.h"
-%include "Permutation.h"
 %include "Polynomial.h"
-%include "ProcessGrid.h"
-%include "PMatrixMemoryPool.h"
-%include "PSMatrix.h"
 %include "RootSolvers.h"
 %include "SignSolvers.h"
-%include "SMatrix.h"
-%include "SolverParameters.h"
 %include "SquareRootSolvers.h"
 %include "TrigonometrySolvers.h"
-%include "TripletList.h"
+%exception;
+
+%pythoncode %{
+class _ArrayView(object):
+    """Exposes memory owned by an NTPoly object through the numpy array
+    interface, holding a reference to the owner for the life of the view.
+    """
+
+    def __init__(self, owner, address, size, dtype, stride):
+        self.owner = owner
+        self.__array_interface__ = {
+            'shape': (size,), 'typestr': dtype.str, 'version': 3,
+            'data': (address, False), 'strides': (stride,)}
+
+
+def _array_view(owner, address, size, dtype, stride=None):
+    """Build a numpy view of memory owned by an NTPoly object."""
+    from numpy import asarray, empty, dtype as npdtype
+    dtype = npdtype(dtype)
+    if size == 0:
+        return empty(0, dtype=dtype)
+    if stride is None:
+        stride = dtype.itemsize
+    return asarray(_ArrayView(owner, address, size, dtype, stride))
+
+
+def _csc_triplet_list(mat, list_type):
+    """Build a triplet list from a scipy matrix, sorted the way the local
+    matrices are stored.
+    """
+    from numpy import arange, diff, repeat
+    from scipy.sparse import csc_matrix
+    csc = csc_matrix(mat)
+    csc.sum_duplicates()
+    columns = repeat(arange(1, csc.shape[1] + 1), diff(csc.indptr))
+    return list_type.from_arrays(csc.indices + 1, columns, csc.data)
+
+
+def _csc_from_arrays(arrays, rows, columns):
+    """Build a scipy CSC matrix from copies of a local matrix's arrays."""
+    from scipy.sparse import csc_matrix
+    outer, inner, values = arrays
+    return csc_matrix((values.copy(), inner - 1, outer.copy()),
+                      shape=(rows, columns))
+%}
+
+%extend NTPoly::TripletList_r {
+  PyObject *_FillFromBuffers(PyObject *index_row, PyObject *index_column,
+                             PyObject *point_value) {
+    return FillFromBuffers<NTPoly::TripletList_r, double>(
+        $self, index_row, index_column, point_value);
+  }
+  PyObject *_GetArrays() {
+    return GetListArrays<NTPoly::TripletList_r, double>($self);
+  }
+%pythoncode %{
+  @staticmethod
+  def from_arrays(rows, columns, values):
+      """Construct a triplet list from arrays of indices and values.
+
+      The indices start from 1, as with Append. Arrays of the right type
+      are passed to the library without copying.
+      """
+      from numpy import ascontiguousarray, intc, float64
+      tlist = TripletList_r()
+      tlist._FillFromBuffers(ascontiguousarray(rows, dtype=intc),
+                             ascontiguousarray(columns, dtype=intc),
+                             ascontiguousarray(values, dtype=float64))
+      return tlist
+
+  def as_arrays(self):
+      """Get numpy views of the rows, columns and values in the list.
+
+      No data is copied. The views are invalidated when the list is
+      resized or modified from the library.
+      """
+      from numpy import intc, float64
+      size, rows, cols, vals, stride = self._GetArrays()
+      return (_array_view(self, rows, size, intc, stride),
+              _array_view(self, cols, size, intc, stride),
+              _array_view(self, vals, size, float64, stride))
+%}
+}
+
+%extend NTPoly::TripletList_c {
+  PyObject *_FillFromBuffers(PyObject *index_row, PyObject *index_column,
+                             PyObject *point_value) {
+    return FillFromBuffers<NTPoly::TripletList_c, std::complex<double> >(
+        $self, index_row, index_column, point_value);
+  }
+  PyObject *_GetArrays() {
+    return GetListArrays<NTPoly::TripletList_c, std::complex<double> >($self);
+  }
+%pythoncode %{
+  @staticmethod
+  def from_arrays(rows, columns, values):
+      """Construct a triplet list from arrays of indices and values.
+
+      The indices start from 1, as with Append. Arrays of the right type
+      are passed to the library without copying.
+      """
+      from numpy import ascontiguousarray, intc, complex128
+      tlist = TripletList_c()
+      tlist._FillFromBuffers(ascontiguousarray(rows, dtype=intc),
+                             ascontiguousarray(columns, dtype=intc),
+                             ascontiguousarray(values, dtype=complex128))
+      return tlist
+
+  def as_arrays(self):
+      """Get numpy views of the rows, columns and values in the list.
+
+      No data is copied. The views are invalidated when the list is
+      resized or modified from the library.
+      """
+      from numpy import intc, complex128
+      size, rows, cols, vals, stride = self._GetArrays()
+      return (_array_view(self, rows, size, intc, stride),
+              _array_view(self, cols, size, intc, stride),
+              _array_view(self, vals, size, complex128, stride))
+%}
+}
+
+%extend NTPoly::Matrix_lsr {
+  PyObject *_GetArrays() {
+    return GetMatrixArrays<NTPoly::Matrix_lsr, double>($self);
+  }
+%pythoncode %{
+  def as_arrays(self):
+      """Get numpy views of the outer index, inner index and values.
+
+      No data is copied. Storage is by column: the outer index holds the
+      offset of each column starting from 0, and the inner index holds the
+      row of each value starting from 1. The views are invalidated when the
+      matrix is modified.
+      """
+      from numpy import intc, float64
+      nnz, outer, inner, vals = self._GetArrays()
+      return (_array_view(self, outer, self.GetColumns() + 1, intc),
+              _array_view(self, inner, nnz, intc),
+              _array_view(self, vals, nnz, float64))
+%}
+}
+
+%extend NTPoly::Matrix_lsc {
+  PyObject *_GetArrays() {
+    return GetMatrixArrays<NTPoly::Matrix_lsc, std::complex<double> >($self);
+  }
+%pythoncode %{
+  def as_arrays(self):
+      """Get numpy views of the outer index, inner index and values.
+
+      No data is copied. Storage is by column: the outer index holds the
+      offset of each column starting from 0, and the inner index holds the
+      row of each value starting from 1. The views are invalidated when the
+      matrix is modified.
+      """
+      from numpy import intc, complex128
+      nnz, outer, inner, vals = self._GetArrays()
+      return (_array_view(self, outer, self.GetColumns() + 1, intc),
+              _array_view(self, inner, nnz, intc),
+              _array_view(self, vals, nnz, complex128))
+%}
+}
+
+%extend NTPoly::Matrix_lsr {
+%pythoncode %{
+  @staticmethod
+  def from_csr(csr):
+      """Construct a matrix from a scipy sparse matrix."""
+      tlist = _csc_triplet_list(csr, TripletList_r)
+      return Matrix_lsr(tlist, csr.shape[0], csr.shape[1])
+
+  def to_csr(self):
+      """Convert the matrix to a scipy CSR matrix."""
+      return _csc_from_arrays(self.as_arrays(),
+                              self.GetRows(), self.GetColumns()).tocsr()
+%}
+}
+
+%extend NTPoly::Matrix_lsc {
+%pythoncode %{
+  @staticmethod
+  def from_csr(csr):
+      """Construct a matrix from a scipy sparse matrix."""
+      tlist = _csc_triplet_list(csr, TripletList_c)
+      return Matrix_lsc(tlist, csr.shape[0], csr.shape[1])
+
+  def to_csr(self):
+      """Convert the matrix to a scipy CSR matrix."""
+      return _csc_from_arrays(self.as_arrays(),
+                              self.GetRows(), self.GetColumns()).tocsr()
+%}
+}
+
+%extend NTPoly::Matrix_ps {
+%pythoncode %{
+  @staticmethod
+  def from_local_csr(row_block, row_start, grid=None):
+      """Construct a distributed matrix from the rows held by each process.
+
+      Each process passes a scipy sparse matrix with the full number of
+      columns, holding the rows starting at row_start (counting from 0).
+      Processes may pass an empty block.
+      """
+      from numpy import iscomplexobj
+      from scipy.sparse import coo_matrix
+      coo = coo_matrix(row_block)
+      if iscomplexobj(coo.data):
+          list_type = TripletList_c
+      else:
+          list_type = TripletList_r
+      tlist = list_type.from_arrays(coo.row + row_start + 1, coo.col + 1,
+                                    coo.data)
+      if grid is None:
+          mat = Matrix_ps(coo.shape[1])
+      else:
+          mat = Matrix_ps(coo.shape[1], grid)
+      mat.FillFromTripletList(tlist)
+      return mat
+%}
+}
+
+%pythoncode %{
+class _BatchOperation(object):
+    """Base class of operations applied to chunks of matrix elements."""
+    # How many elements to hand to each call.
+    chunk_size = 65536
+
+    def __call__(self, rows, columns, values):
+        """The operation to override.
+
+        Receives numpy arrays with the rows and columns (starting from 1)
+        and values of a chunk of elements. Returns a boolean mask of the
+        elements to keep, and an array of their new values.
+        """
+        from numpy import ones
+        return ones(len(values), dtype=bool), values
+
+
+class RealBatchOperation(_BatchOperation):
+    """An operation applied to chunks of the elements of a real matrix."""
+
+
+class ComplexBatchOperation(_BatchOperation):
+    """An operation applied to chunks of the elements of a complex matrix."""
+%}
+
+%extend NTPoly::MatrixMapper {
+%pythoncode %{
+  @staticmethod
+  def MapBatch(inmat, outmat, proc):
+      """Given a distributed matrix, apply a batch operation to its elements.
+
+      Each process slice handles its share of the local elements, as Map
+      does, but the operation is called once per chunk of elements.
+      """
+      from numpy import asarray, concatenate
+      if isinstance(proc, ComplexBatchOperation):
+          list_type = TripletList_c
+      else:
+          list_type = TripletList_r
+      num_slices, my_slice = MatrixMapper.GetSliceInfo(inmat)
+      inlist = list_type()
+      inmat.GetTripletList(inlist)
+      rows, cols, vals = [x[my_slice::num_slices]
+                          for x in inlist.as_arrays()]
+
+      kept = ([], [], [])
+      for start in range(0, len(vals), proc.chunk_size):
+          chunk = [x[start:start + proc.chunk_size].copy()
+                   for x in (rows, cols, vals)]
+          mask, new_vals = proc(*chunk)
+          mask = asarray(mask, dtype=bool)
+          kept[0].append(chunk[0][mask])
+          kept[1].append(chunk[1][mask])
+          kept[2].append(asarray(new_vals)[mask])
+
+      if len(kept[2]) > 0:
+          outlist = list_type.from_arrays(*[concatenate(x) for x in kept])
+      else:
+          outlist = list_type()
+      outmat.FillFromTripletList(outlist)
+%}
+}
@@ -275,10 +275,40 @@ class TestChemistry:
         '''Test routines to compute the density matrix with TRS4.'''
         self.basic_solver(nt.DensityMatrixSolvers.TRS4)
 
+    def test_trs2_reuse(self):
+        '''Test TRS2 when products reuse the structure of previous ones.'''
+        self.solver_parameters.SetReusePattern(True)
+        self.basic_solver(nt.DensityMatrixSolvers.TRS2)
+
+    def test_pm_reuse(self):
+        '''Test PM when products reuse the structure of previous ones.'''
+        self.solver_parameters.SetReusePattern(True)
+        self.basic_solver(nt.DensityMatrixSolvers.PM)
+
+    def test_trs4_reuse(self):
+        '''Test TRS4 when products reuse the structure of previous ones.'''
+        self.solver_parameters.SetReusePattern(True)
+        self.basic_solver(nt.DensityMatrixSolvers.TRS4)
+
+    def test_trs2_mixed(self):
+        '''Test TRS2 starting with single precision communication.'''
+        self.solver_parameters.SetPrecisionSwitch(1e-3)
+        self.basic_solver(nt.DensityMatrixSolvers.TRS2)
+
+    def test_trs2_screen(self):
+        '''Test TRS2 skipping products with a small norm bound.'''
+        self.solver_parameters.SetScreenTolerance(1e-10)
+        self.basic_solver(nt.DensityMatrixSolvers.TRS2)
+
     def test_HPCP(self):
         '''Test routines to compute the density matrix with HPCP.'''
         self.basic_solver(nt.DensityMatrixSolvers.HPCP)
 
+    def test_HPCP_mixed(self):
+        '''Test HPCP starting with single precision communication.'''
+        self.solver_parameters.SetPrecisionSwitch(1e-3)
+        self.basic_solver(nt.DensityMatrixSolvers.HPCP)
+
     def test_densedensity(self):
         '''Test routines to compute the density matrix with Dense Method.'''
         self.basic_solver(nt.DensityMatrixSolvers.DenseDensity)
@@ -97,6 +97,84 @@ class TestLocalMatrix(unittest.TestCase):
             ResultMat = mmread(self.file2)
             self._compare_mat(matrix1, ResultMat)
 
+    def test_as_arrays(self):
+        '''Test viewing the arrays of a matrix without copying.'''
+        from scipy.sparse import csc_matrix
+        for param in self.parameters:
+            matrix1 = param.create_matrix(complex=self.complex)
+            mmwrite(self.file1, matrix1)
+            matrix2 = self.SMatrix(self.file1)
+            outer, inner, values = matrix2.as_arrays()
+            ResultMat = csc_matrix((values, inner - 1, outer),
+                                   shape=matrix1.shape)
+            self._compare_mat(matrix1, ResultMat)
+
+    def test_csr(self):
+        '''Test conversion to and from scipy matrices.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(complex=self.complex)
+            matrix2 = self.SMatrix.from_csr(matrix1)
+            self.assertEqual(matrix2.GetRows(), matrix1.shape[0])
+            self.assertEqual(matrix2.GetColumns(), matrix1.shape[1])
+            ResultMat = matrix2.to_csr()
+            self._compare_mat(matrix1, ResultMat)
+
+    def test_threaded_sort_team(self):
+        '''Test sorting when the OpenMP team is smaller than requested.'''
+        from os import environ
+        from subprocess import run
+        from sys import executable
+        # The thread limit gives the sort fewer threads than it asks for.
+        # The sort runs when filling a distributed matrix, which needs
+        # MPI, so it runs in a separate process.
+        script = '''
+from mpi4py import MPI
+from numpy import zeros, add
+from scipy.sparse import random
+import NTPolySwig as nt
+dim = 1000
+matrix1 = random(dim, dim, 0.05, format="coo", random_state=1)
+if {complex}:
+    matrix1.data = matrix1.data + 1j * matrix1.data[::-1]
+nt.ConstructGlobalProcessGrid(1, 1, 1)
+tlist = nt.{TripletList}.from_arrays(matrix1.row + 1, matrix1.col + 1,
+                                     matrix1.data)
+matrix2 = nt.Matrix_ps(dim)
+matrix2.FillFromTripletList(tlist)
+tlist2 = nt.{TripletList}(0)
+matrix2.GetTripletList(tlist2)
+rows, cols, values = tlist2.as_arrays()
+result = zeros((dim, dim), dtype=values.dtype)
+add.at(result, (rows - 1, cols - 1), values)
+assert abs(result - matrix1.toarray()).max() == 0
+nt.DestructGlobalProcessGrid()
+'''.format(complex=self.complex, TripletList=self.TripletList.__name__)
+        # Drop the launcher's variables so it starts as its own MPI job.
+        env = {k: v for k, v in environ.items()
+               if not k.startswith(("OMPI_COMM", "OMPI_MCA", "PMIX", "PMI_"))}
+        env.update(OMP_NUM_THREADS="4", OMP_THREAD_LIMIT="2")
+        proc = run([executable, "-c", script], env=env)
+        self.assertEqual(proc.returncode, 0)
+
+    def test_triplet_arrays(self):
+        '''Test filling and viewing a triplet list with arrays.'''
+        from scipy.sparse import coo_matrix
+        from numpy import array_equal
+        for param in self.parameters:
+            matrix1 = coo_matrix(param.create_matrix(complex=self.complex))
+            tlist = self.TripletList.from_arrays(matrix1.row + 1,
+                                                 matrix1.col + 1,
+                                                 matrix1.data)
+            rows, cols, values = tlist.as_arrays()
+            self.assertTrue(array_equal(rows, matrix1.row + 1))
+            self.assertTrue(array_equal(cols, matrix1.col + 1))
+            self.assertTrue(array_equal(values, matrix1.data))
+
+            # Writes through the view are seen by the library.
+            if len(values) > 0:
+                values[0] = 2.0
+                self.assertEqual(tlist.GetTripletAt(0).point_value, 2.0)
+
     def test_readcircular(self):
         '''Test routines to read a matrix produced by ntpoly.'''
         for param in self.parameters:
@@ -249,6 +327,177 @@ class TestLocalMatrix(unittest.TestCase):
             ResultMat = mmread(self.file3)
             self._compare_mat(CheckMat, ResultMat)
 
+    def test_multiply_hash(self):
+        '''Test multiplication with the hash table accumulator.'''
+        from random import uniform
+        memory_pool = self.MatrixMemoryPool(1, 1, True)
+        for param in self.parameters:
+            matrix1 = param.create_matrix(complex=self.complex)
+            matrix2 = param.create_matrix(complex=self.complex).getH()
+            mmwrite(self.file1, matrix1)
+            mmwrite(self.file2, matrix2)
+            alpha = uniform(1.0, 2.0)
+            CheckMat = alpha * matrix1.dot(matrix2)
+
+            ntmatrix1 = self.SMatrix(self.file1)
+            ntmatrix2 = self.SMatrix(self.file2)
+            ntmatrix3 = self.SMatrix(ntmatrix2.GetColumns(),
+                                     ntmatrix1.GetRows())
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, False, False, alpha, 0.0,
+                           0.0, memory_pool)
+            ntmatrix3.WriteToMatrixMarket(self.file3)
+
+            ResultMat = mmread(self.file3)
+            self._compare_mat(CheckMat, ResultMat)
+
+    def test_multiply_block(self):
+        '''Test multiplication with dense block kernels.'''
+        from random import uniform
+        for block_size in [2, 3]:
+            memory_pool = self.MatrixMemoryPool(1, 1, False, False,
+                                                block_size)
+            for param in self.parameters:
+                matrix1 = param.create_matrix(complex=self.complex)
+                matrix2 = param.create_matrix(complex=self.complex).getH()
+                mmwrite(self.file1, matrix1.transpose())
+                mmwrite(self.file2, matrix2)
+                alpha = uniform(1.0, 2.0)
+                CheckMat = alpha * matrix1.dot(matrix2)
+
+                ntmatrix1 = self.SMatrix(self.file1)
+                ntmatrix2 = self.SMatrix(self.file2)
+                ntmatrix3 = self.SMatrix(ntmatrix2.GetColumns(),
+                                         ntmatrix1.GetColumns())
+                ntmatrix3.Gemm(ntmatrix1, ntmatrix2, True, False, alpha, 0.0,
+                               0.0, memory_pool)
+                ntmatrix3.WriteToMatrixMarket(self.file3)
+
+                ResultMat = mmread(self.file3)
+                self._compare_mat(CheckMat, ResultMat)
+
+    def test_multiply_screen(self):
+        '''Test that screening skips small products within its bound.'''
+        from scipy.sparse import block_diag
+        from scipy.sparse.linalg import norm
+        from numpy import ones
+        block_size = 4
+        num_blocks = 16
+        screen = 1e-6
+        dim = block_size * num_blocks
+        matrix2 = block_diag([ones((block_size, block_size))] * num_blocks,
+                             format="lil")
+        # Small blocks next to the diagonal, which add fill to the product.
+        matrix1 = matrix2.copy()
+        num_small = 0
+        for start in range(0, dim - block_size, 2 * block_size):
+            matrix1[start:start + block_size,
+                    start + block_size:start + 2 * block_size] = 1e-9
+            num_small += 1
+        matrix1 = matrix1.tocsr()
+        matrix2 = matrix2.tocsr()
+        if self.complex:
+            matrix1 = matrix1 * (1 + 1j)
+            matrix2 = matrix2 * (1 - 1j)
+        CheckMat = matrix1.dot(matrix2)
+
+        ntmatrix1 = self.SMatrix.from_csr(matrix1)
+        ntmatrix2 = self.SMatrix.from_csr(matrix2)
+        # Elements are screened one at a time, and blocks in pairs.
+        skipped = {1: num_small * block_size**2, block_size: num_small}
+        for pool_block_size in [1, block_size]:
+            memory_pool = self.MatrixMemoryPool(1, 1, False, False,
+                                                pool_block_size)
+            ntmatrix3 = self.SMatrix(dim, dim)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, False, False, 1.0, 0.0,
+                           0.0, memory_pool, screen)
+            ResultMat = ntmatrix3.to_csr()
+
+            self.assertEqual(ResultMat.nnz, num_blocks * block_size**2)
+            error = norm(CheckMat - ResultMat)
+            self.assertGreater(error, 0.0)
+            self.assertLessEqual(error, skipped[pool_block_size] * screen)
+
+    def test_multiply_cost_model(self):
+        '''Test multiplication with the algorithm chosen by a cost model.'''
+        from random import uniform
+        # A calibrated model, then profiles that force each algorithm.
+        profiles = [None, (1.0, 1.0, 0.0, 0.0), (0.0, 0.0, 1.0, 0.0)]
+        try:
+            for profile in profiles:
+                if profile is None:
+                    nt.CalibrateCostModel()
+                else:
+                    nt.SetCostModel(*profile)
+                for param in self.parameters:
+                    matrix1 = param.create_matrix(complex=self.complex)
+                    matrix2 = param.create_matrix(complex=self.complex).getH()
+                    mmwrite(self.file1, matrix1)
+                    mmwrite(self.file2, matrix2)
+                    alpha = uniform(1.0, 2.0)
+                    CheckMat = alpha * matrix1.dot(matrix2)
+
+                    ntmatrix1 = self.SMatrix(self.file1)
+                    ntmatrix2 = self.SMatrix(self.file2)
+                    ntmatrix3 = self.SMatrix(ntmatrix2.GetColumns(),
+                                             ntmatrix1.GetRows())
+                    memory_pool = self.MatrixMemoryPool(
+                        ntmatrix2.GetColumns(), ntmatrix1.GetRows())
+                    ntmatrix3.Gemm(ntmatrix1, ntmatrix2, False, False, alpha,
+                                   0.0, 0.0, memory_pool)
+                    ntmatrix3.WriteToMatrixMarket(self.file3)
+
+                    ResultMat = mmread(self.file3)
+                    self._compare_mat(CheckMat, ResultMat)
+        finally:
+            nt.ResetCostModel()
+
+    def test_multiply_flops(self):
+        '''Test the flop count recorded by a memory pool.'''
+        from scipy.sparse import random
+        matrix1 = random(64, 48, 0.05, format="csc")
+        matrix2 = random(48, 56, 0.05, format="csc")
+        if self.complex:
+            matrix1 = matrix1 + 1j * matrix1
+            matrix2 = matrix2 - 1j * matrix2
+        check_flops = sum(matrix1.getcol(i).nnz * matrix2.getrow(i).nnz
+                          for i in range(48))
+        CheckMat = matrix1.dot(matrix2)
+
+        ntmatrix1 = self.SMatrix.from_csr(matrix1.tocsr())
+        ntmatrix2 = self.SMatrix.from_csr(matrix2.tocsr())
+        for use_hash in [False, True]:
+            ntmatrix3 = self.SMatrix(56, 64)
+            memory_pool = self.MatrixMemoryPool(56, 64, use_hash)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, False, False, 1.0, 0.0,
+                           0.0, memory_pool)
+            self.assertEqual(memory_pool.GetFlops(), check_flops)
+            self._compare_mat(CheckMat, ntmatrix3.to_csr())
+
+    def test_multiply_reuse(self):
+        '''Test multiplication reusing the structure of the last product.'''
+        from scipy.sparse import random
+        matrix1 = random(64, 48, 0.05, format="csr")
+        matrix2 = random(48, 56, 0.05, format="csr")
+        if self.complex:
+            matrix1 = matrix1 + 1j * matrix1
+            matrix2 = matrix2 - 1j * matrix2
+        memory_pool = self.MatrixMemoryPool(56, 64, False, True)
+
+        # Same pattern with new values, then a different pattern.
+        for step in range(3):
+            if step == 1:
+                matrix1.data *= 2.0
+                matrix2.data += 1.0
+            elif step == 2:
+                matrix1 = matrix1 + random(64, 48, 0.02, format="csr")
+            CheckMat = matrix1.dot(matrix2)
+            ntmatrix1 = self.SMatrix.from_csr(matrix1)
+            ntmatrix2 = self.SMatrix.from_csr(matrix2)
+            ntmatrix3 = self.SMatrix(56, 64)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, False, False, 1.0, 0.0,
+                           0.0, memory_pool)
+            self._compare_mat(CheckMat, ntmatrix3.to_csr())
+
     def test_multiply_nt(self):
         '''Test routines to multiply two matrices.'''
         from random import uniform
@@ -281,6 +281,45 @@ class TestPSMatrix(unittest.TestCase):
 
             self.check_result()
 
+    def test_fromarrays(self):
+        '''Test building a triplet list from arrays.'''
+        from scipy.sparse import coo_matrix
+        for param in self.parameters:
+            matrix1 = comm.bcast(param.create_matrix(self.complex), root=0)
+            self.CheckMat = matrix1
+
+            # Each process contributes a strided piece of the matrix.
+            coo = coo_matrix(matrix1)
+            nprocs = comm.Get_size()
+            rows = coo.row[self.my_rank::nprocs] + 1
+            cols = coo.col[self.my_rank::nprocs] + 1
+            vals = coo.data[self.my_rank::nprocs]
+            triplet_list = self.TripletList.from_arrays(rows, cols, vals)
+            self.assertEqual(triplet_list.GetSize(), len(vals))
+
+            ntmatrix1 = nt.Matrix_ps(param.rows)
+            ntmatrix1.FillFromTripletList(triplet_list)
+            ntmatrix1.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+
+            self.check_result()
+
+    def test_fromlocalcsr(self):
+        '''Test building a matrix from the rows held by each process.'''
+        for param in self.parameters:
+            matrix1 = comm.bcast(param.create_matrix(self.complex), root=0)
+            self.CheckMat = matrix1
+
+            nprocs = comm.Get_size()
+            row_start = (param.rows * self.my_rank) // nprocs
+            row_end = (param.rows * (self.my_rank + 1)) // nprocs
+            ntmatrix1 = nt.Matrix_ps.from_local_csr(
+                matrix1[row_start:row_end, :], row_start, self.grid)
+            ntmatrix1.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+
+            self.check_result()
+
     def test_repartition(self):
         '''Test extraction of triplet list via repartition function.'''
         from sys import maxsize
@@ -388,6 +427,52 @@ class TestPSMatrix(unittest.TestCase):
 
             self.check_result()
 
+    def test_hermitian(self):
+        '''Test matrices marked as symmetric or Hermitian.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(self.complex)
+            matrix1 = matrix1 + matrix1.getH()
+            self.write_matrix(matrix1, self.input_file1)
+
+            self.CheckMat = matrix1.T
+            ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            ntmatrix1.SetHermitian(True)
+            ntmatrix2 = nt.Matrix_ps(ntmatrix1.GetActualDimension())
+            ntmatrix2.Transpose(ntmatrix1)
+            self.assertTrue(ntmatrix2.IsHermitian())
+            ntmatrix2.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+
+            self.check_result()
+
+            # Only the lower triangle is written out.
+            if self.my_rank == 0:
+                with open(self.result_file) as ifile:
+                    header = ifile.readline()
+                self.assertNotIn("general", header)
+            ntmatrix3 = nt.Matrix_ps(self.result_file, False)
+            self.assertTrue(ntmatrix3.IsHermitian())
+
+    def test_hermitian_check(self):
+        '''Test that a matrix which is not Hermitian is not marked.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(self.complex)
+            matrix1 = (matrix1 + matrix1.getH()).tolil()
+            matrix1[0, param.rows - 1] += 1.0
+            matrix1 = matrix1.tocsr()
+            self.write_matrix(matrix1, self.input_file1)
+
+            self.CheckMat = matrix1.T
+            ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            ntmatrix1.SetHermitian(True)
+            self.assertFalse(ntmatrix1.IsHermitian())
+            ntmatrix2 = nt.Matrix_ps(ntmatrix1.GetActualDimension())
+            ntmatrix2.Transpose(ntmatrix1)
+            ntmatrix2.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+
+            self.check_result()
+
     def test_grow(self):
         '''Test our ability to resize matrices (grow).'''
         for param in self.parameters:
@@ -449,6 +534,39 @@ class TestPSMatrix(unittest.TestCase):
 
             self.check_result()
 
+    def test_map_batch(self):
+        '''Test mapping a function over chunks of the matrix elements.'''
+        if self.complex:
+            base = nt.ComplexBatchOperation
+        else:
+            base = nt.RealBatchOperation
+
+        class MatOp(base):
+            chunk_size = 7
+
+            def __call__(self, rows, columns, values):
+                return abs(values) < 0.5, 2 * values
+
+        for param in self.parameters:
+            matrix1 = param.create_matrix(self.complex)
+            self.write_matrix(matrix1, self.input_file1)
+
+            self.CheckMat = 2 * matrix1
+            for i in range(0, param.rows):
+                for j in range(0, param.columns):
+                    if abs(matrix1[i, j]) >= 0.5:
+                        self.CheckMat[i, j] = 0
+
+            ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            ntmatrix2 = nt.Matrix_ps(ntmatrix1.GetActualDimension())
+
+            nt.MatrixMapper.MapBatch(ntmatrix1, ntmatrix2, MatOp())
+
+            ntmatrix2.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+
+            self.check_result()
+
     def test_filldense(self):
         '''Test the routine that fills a dense matrix of 1s.'''
         for param in self.parameters:
@@ -93,6 +93,7 @@ class TestPSMatrixAlgebra:
     def tearDown(self):
         '''Cleanup this test.'''
         del self.grid
+        nt.SetGlobalCompressIndices(False)
 
     def setUp(self):
         '''Set up a specific test.'''
@@ -217,6 +218,486 @@ class TestPSMatrixAlgebra:
 
             self.check_result()
 
+    def test_multiply_chain(self):
+        '''Test routines to multiply a chain of matrices in one pass.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            ntmatrix3 = nt.Matrix_ps(param.rows)
+            ntmatrix4 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1)
+            ntmatrix3.GemmChain(ntmatrix1, ntmatrix2, ntmatrix4, memory_pool)
+
+            self.CheckMat = matrix1.dot(matrix2)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+            self.CheckMat = matrix1.dot(self.CheckMat)
+            ntmatrix4.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+    def test_multiply_reuse_pool(self):
+        '''Test repeated multiplication with the same memory pool.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            self.CheckMat = matrix1.dot(matrix1.dot(matrix1.dot(matrix2)))
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            ntmatrix3 = nt.Matrix_ps(param.rows)
+            ntmatrix4 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, memory_pool)
+            ntmatrix2.GemmChain(ntmatrix1, ntmatrix3, ntmatrix4,
+                                memory_pool)
+            ntmatrix4.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+
+            self.check_result()
+
+    def test_multiply_in_place(self):
+        '''Test multiplication where the output is also an operand.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1)
+            ntmatrix2.Gemm(ntmatrix1, ntmatrix2, memory_pool)
+
+            self.CheckMat = matrix1.dot(matrix2)
+            ntmatrix2.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+            ntmatrix1.Gemm(ntmatrix1, ntmatrix2, memory_pool, 1.0, 1.0)
+
+            self.CheckMat = matrix1 + matrix1.dot(self.CheckMat)
+            ntmatrix1.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+    def test_multiply_screen(self):
+        '''Test that screening skips small products within its bound.'''
+        from scipy.sparse import block_diag
+        from scipy.sparse.linalg import norm
+        from scipy.io import mmread
+        from numpy import ones
+        block_size = 4
+        num_blocks = 16
+        screen = 1e-6
+        dim = block_size * num_blocks
+        matrix2 = block_diag([ones((block_size, block_size))] * num_blocks,
+                             format="lil")
+        # Small blocks next to the diagonal, which add fill to the product.
+        matrix1 = matrix2.copy()
+        num_small = 0
+        for start in range(0, dim - block_size, 2 * block_size):
+            matrix1[start:start + block_size,
+                    start + block_size:start + 2 * block_size] = 1e-9
+            num_small += block_size**2
+        matrix1 = matrix1.tocsr()
+        matrix2 = matrix2.tocsr()
+        if self.complex1:
+            matrix1 = matrix1 * (1 + 1j)
+        if self.complex2:
+            matrix2 = matrix2 * (1 - 1j)
+        self.write_matrix(matrix1, self.input_file1)
+        self.write_matrix(matrix2, self.input_file2)
+        self.CheckMat = matrix1.dot(matrix2)
+        comm.barrier()
+
+        ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+        ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+        ntmatrix3 = nt.Matrix_ps(dim)
+        memory_pool = nt.PMatrixMemoryPool(ntmatrix1)
+        ntmatrix3.Gemm(ntmatrix1, ntmatrix2, memory_pool, 1.0, 0.0, 0.0,
+                       screen)
+        ntmatrix3.WriteToMatrixMarket(self.result_file)
+        comm.barrier()
+
+        self.assertEqual(ntmatrix3.GetSize(), num_blocks * block_size**2)
+        error = 0
+        if self.my_rank == 0:
+            error = norm(self.CheckMat - mmread(self.result_file))
+        error = comm.bcast(error, root=0)
+        self.assertGreater(error, 0.0)
+        self.assertLessEqual(error, num_small * screen)
+
+    def test_memory_accounting(self):
+        '''Test the memory reported for matrices, pools and multiplication.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            comm.barrier()
+
+            nt.ResetMemoryHighWaterMark()
+            self.assertEqual(nt.GetMemoryHighWaterMark(), 0)
+            ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            ntmatrix3 = nt.Matrix_ps(ntmatrix1.GetActualDimension())
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, memory_pool)
+
+            # Each entry holds at least an index and a value.
+            total = comm.allreduce(ntmatrix3.GetMemory())
+            self.assertGreaterEqual(total, 12 * ntmatrix3.GetSize())
+            self.assertGreater(memory_pool.GetMemory(), 0)
+
+            # The multiply held its pool, and every entry of the first
+            # operand was gathered on some process.
+            peak = nt.GetMemoryHighWaterMark()
+            self.assertGreaterEqual(peak, memory_pool.GetMemory())
+            self.assertGreaterEqual(comm.allreduce(peak),
+                                    12 * ntmatrix1.GetSize())
+
+            # Everything counted during the multiply was given back.
+            nt.ResetMemoryHighWaterMark()
+            self.assertEqual(nt.GetMemoryHighWaterMark(), 0)
+
+    def test_multiply_pinned(self):
+        '''Test repeated multiplication by a pinned first operand.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            self.CheckMat = matrix1.dot(matrix1.dot(matrix1.dot(matrix2)))
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            ntmatrix3 = nt.Matrix_ps(param.rows)
+            ntmatrix4 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1, False, False, 1,
+                                               True, False)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, memory_pool)
+            ntmatrix4.Gemm(ntmatrix1, ntmatrix3, memory_pool)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix4, memory_pool)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+
+            self.check_result()
+
+    def test_multiply_pinned_stale(self):
+        '''Test that a pinned operand is not used for other matrices.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            ntmatrix3 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1, False, False, 1,
+                                               True, False)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, memory_pool)
+
+            # A different first operand.
+            ntmatrix3.Gemm(ntmatrix2, ntmatrix2, memory_pool)
+            self.CheckMat = matrix2.dot(matrix2)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+            # The same first operand, changed in place.
+            ntmatrix2.Scale(2.0)
+            ntmatrix3.Gemm(ntmatrix2, ntmatrix1, memory_pool)
+            self.CheckMat = 2.0 * matrix2.dot(matrix1)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+            # Releasing the operands frees their memory.
+            kept = comm.allreduce(memory_pool.GetMemory())
+            memory_pool.ReleaseOperands()
+            self.assertLess(comm.allreduce(memory_pool.GetMemory()), kept)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, memory_pool)
+            self.CheckMat = 2.0 * matrix1.dot(matrix2)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+    def test_multiply_started_stale(self):
+        '''Test a started multiplication followed by other operands.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            ntmatrix3 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1)
+            memory_pool.StartGemm(ntmatrix1, ntmatrix2)
+            ntmatrix3.Gemm(ntmatrix2, ntmatrix2, memory_pool)
+
+            self.CheckMat = matrix2.dot(matrix2)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+    def test_multiply_started_chain(self):
+        '''Test a started multiplication followed by a chain.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            ntmatrix3 = nt.Matrix_ps(param.rows)
+            ntmatrix4 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1)
+            memory_pool.StartGemm(ntmatrix1, ntmatrix2)
+            ntmatrix3.GemmChain(ntmatrix1, ntmatrix2, ntmatrix4, memory_pool)
+
+            self.CheckMat = matrix1.dot(matrix2)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+            self.CheckMat = matrix1.dot(self.CheckMat)
+            ntmatrix4.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+            # The started gather is not picked up by a later multiply.
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, memory_pool)
+            self.CheckMat = matrix1.dot(matrix2)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+    def test_multiply_started(self):
+        '''Test a multiplication started ahead of another one.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            ntmatrix3 = nt.Matrix_ps(param.rows)
+            ntmatrix4 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1)
+            memory_pool2 = nt.PMatrixMemoryPool(ntmatrix1)
+            memory_pool.StartGemm(ntmatrix1, ntmatrix2)
+            ntmatrix4.Gemm(ntmatrix1, ntmatrix1, memory_pool2)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, memory_pool)
+
+            self.CheckMat = matrix1.dot(matrix2)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+            self.CheckMat = matrix1.dot(matrix1)
+            ntmatrix4.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+    def test_multiply_compressed(self):
+        '''Test multiplication sending packed indices.'''
+        nt.SetGlobalCompressIndices(True)
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            ntmatrix3 = nt.Matrix_ps(param.rows)
+            ntmatrix4 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1)
+            ntmatrix3.GemmChain(ntmatrix1, ntmatrix2, ntmatrix4, memory_pool)
+
+            self.CheckMat = matrix1.dot(matrix2)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+            self.CheckMat = matrix1.dot(self.CheckMat)
+            ntmatrix4.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+            self.check_result()
+
+    def test_multiply_update(self):
+        '''Test routines to multiply a matrix on to another in place.'''
+        from scipy.sparse import identity
+        alpha = 1.2
+        beta = -0.7
+        shift = 0.3
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            self.CheckMat = alpha * matrix1.dot(matrix2) + beta * matrix2 + \
+                shift * identity(param.rows)
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1)
+            ntmatrix2.GemmUpdate(ntmatrix1, memory_pool, alpha, beta, shift)
+            ntmatrix2.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+
+            self.check_result()
+
+    def test_multiply_hash(self):
+        '''Test multiplication with a hash table memory pool.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            self.CheckMat = matrix1.dot(matrix2)
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            ntmatrix3 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1, True)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, memory_pool)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+
+            self.check_result()
+
+    def test_multiply_block(self):
+        '''Test multiplication with a memory pool using dense blocks.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+
+            self.CheckMat = matrix1.dot(matrix2)
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+            ntmatrix3 = nt.Matrix_ps(param.rows)
+            memory_pool = nt.PMatrixMemoryPool(ntmatrix1, False, False, 3)
+            ntmatrix3.Gemm(ntmatrix1, ntmatrix2, memory_pool)
+            ntmatrix3.WriteToMatrixMarket(self.result_file)
+            comm.barrier()
+
+            self.check_result()
+
     def test_multiply_grid(self):
         '''
         Test routines to multiply two matrices with a default process grid.
@@ -355,6 +836,38 @@ class TestPSMatrixAlgebra:
             comm.barrier()
             self.check_result()
 
+    def test_traceofproduct(self):
+        '''Test routines to compute the trace of a product.'''
+        for param in self.parameters:
+            matrix1 = param.create_matrix(snum=1, complex=self.complex1)
+            matrix2 = param.create_matrix(snum=2, complex=self.complex2)
+            matrix3 = matrix2 + matrix2.getH()
+            self.write_matrix(matrix1, self.input_file1)
+            self.write_matrix(matrix2, self.input_file2)
+            self.write_matrix(matrix3, self.input_file3)
+
+            check2 = matrix1.dot(matrix2).diagonal().sum()
+            check3 = matrix1.dot(matrix3).diagonal().sum()
+            comm.barrier()
+
+            if param.sparsity > 0.0:
+                ntmatrix1 = nt.Matrix_ps(self.input_file1, False)
+            else:
+                ntmatrix1 = nt.Matrix_ps(param.rows)
+            if param.sparsity2 > 0.0:
+                ntmatrix2 = nt.Matrix_ps(self.input_file2, False)
+                ntmatrix3 = nt.Matrix_ps(self.input_file3, False)
+            else:
+                ntmatrix2 = nt.Matrix_ps(param.rows)
+                ntmatrix3 = nt.Matrix_ps(param.rows)
+
+            self.check_floats(ntmatrix1.TraceOfProduct_c(ntmatrix2), check2)
+            self.check_floats(ntmatrix1.TraceOfProduct(ntmatrix2),
+                              check2.real)
+            # Both orders, with the Hermitian operand on either side.
+            self.check_floats(ntmatrix1.TraceOfProduct_c(ntmatrix3), check3)
+            self.check_floats(ntmatrix3.TraceOfProduct_c(ntmatrix1), check3)
+
 
 class TestPSMatrixAlgebra_r(TestPSMatrixAlgebra, unittest.TestCase):
     '''Special routines for real algebra'''
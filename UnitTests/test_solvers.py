@@ -161,6 +161,42 @@ class TestSolvers(unittest.TestCase):
 
         self.check_result()
 
+    def test_releasegil(self):
+        '''Test that other python threads keep running during a solve.'''
+        from threading import Thread, Event
+        from sys import getswitchinterval, setswitchinterval
+        solving = [False]
+        observed = []
+        go = Event()
+
+        def watcher():
+            go.wait()
+            observed.append(solving[0])
+
+        # A larger matrix, so the solve takes a while.
+        self.mat_dim = 512
+        matrix1 = self.create_matrix(SPD=True, diag_dom=True)
+        self.write_matrix(matrix1, self.input_file)
+        overlap_matrix = nt.Matrix_ps(self.input_file, False)
+        inverse_matrix = nt.Matrix_ps(self.mat_dim)
+
+        # With a long switch interval, the watcher can only run while the
+        # main thread is inside the solve if the solve releases the GIL.
+        interval = getswitchinterval()
+        setswitchinterval(100.0)
+        try:
+            thread = Thread(target=watcher)
+            thread.start()
+            solving[0] = True
+            go.set()
+            nt.InverseSolvers.Invert(overlap_matrix, inverse_matrix, self.isp)
+            solving[0] = False
+            thread.join()
+        finally:
+            setswitchinterval(interval)
+
+        self.assertEqual(observed, [True])
+
     def test_denseinvert(self):
         '''Test routines to invert matrices.'''
         from scipy.sparse.linalg import inv
@@ -233,6 +269,29 @@ class TestSolvers(unittest.TestCase):
 
         self.check_result()
 
+    def test_inversesquareroot_mixed(self):
+        '''Test the inverse square root starting in single precision.'''
+        from scipy.linalg import funm
+        from numpy import sqrt
+        # Starting Matrix. Care taken to make sure eigenvalues are positive.
+        matrix1 = self.create_matrix(SPD=True, diag_dom=True)
+        self.write_matrix(matrix1, self.input_file)
+
+        # Check Matrix
+        dense_check = funm(matrix1.todense(), lambda x: 1.0 / sqrt(x))
+        self.CheckMat = csr_matrix(dense_check)
+
+        # Result Matrix
+        overlap_matrix = nt.Matrix_ps(self.input_file, False)
+        inverse_matrix = nt.Matrix_ps(self.mat_dim)
+        self.isp.SetPrecisionSwitch(1e-2)
+        nt.SquareRootSolvers.InverseSquareRoot(overlap_matrix, inverse_matrix,
+                                               self.isp)
+        inverse_matrix.WriteToMatrixMarket(result_file)
+        comm.barrier()
+
+        self.check_result()
+
     def test_denseinversesquareroot(self):
         '''Test routines to compute the inverse square root of matrices.'''
         from scipy.linalg import funm